@@ -5,7 +5,13 @@ from .sprite_loader import (
     get_progress_bar_for_percentage,
     ProgressBarInfo,
     load_font,
-    render_text
+    load_image,
+    load_flat_image,
+    render_text,
+    TextSprite,
+    render_text_sprite,
+    paste_text_sprite,
+    clear_text_cache
 )
 from . import icons
 
@@ -14,6 +20,12 @@ __all__ = [
     'get_progress_bar_for_percentage',
     'ProgressBarInfo',
     'load_font',
+    'load_image',
+    'load_flat_image',
     'render_text',
+    'TextSprite',
+    'render_text_sprite',
+    'paste_text_sprite',
+    'clear_text_cache',
     'icons'
 ]
@@ -34,7 +34,7 @@ HOME_ICON = (7, 2)
 # HIGHLIGHTED-CHECKBOXES.PNG SPRITE SHEET (separate from icons.png)
 # ==============================================================================
 # Note: These coordinates are for the highlighted-checkboxes.png sprite sheet,
-# not icons.png. Use with SpriteSheet(Config.HIGHLIGHTED_CHECKBOXES, 16, 16)
+# not icons.png. Use with SpriteSheet.get(Config.HIGHLIGHTED_CHECKBOXES, 16, 16)
 
 # Highlighted numbered boxes (row 3, 1-based = row 2, 0-indexed)
 NUMBERED_BOX_1_HIGHLIGHTED = (0, 2)
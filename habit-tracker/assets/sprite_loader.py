@@ -1,7 +1,9 @@
 """Sprite sheet loading and extraction utilities."""
 
+from functools import lru_cache
+import numpy as np
 from PIL import Image, ImageFont, ImageDraw
-from typing import Dict, Tuple, NamedTuple, Optional
+from typing import Dict, Iterable, List, Tuple, NamedTuple, Optional
 
 
 class ProgressBarInfo(NamedTuple):
@@ -10,11 +12,23 @@ class ProgressBarInfo(NamedTuple):
     row: int         # Row index in that sheet
 
 
+class TextSprite(NamedTuple):
+    """Pre-rasterized text that pastes exactly where draw.text would draw."""
+    image: Image.Image       # RGBA, binary alpha (non-antialiased glyphs)
+    offset: Tuple[int, int]  # Ink origin relative to the draw.text anchor
+
+
+# Sheet cache to avoid decoding the same PNG repeatedly
+_sheet_cache: Dict[Tuple[str, int, int], "SpriteSheet"] = {}
+
+
 class SpriteSheet:
     """Loads and extracts sprites from a sprite sheet.
 
     Supports both individual tile extraction and full-row extraction
-    (useful for progress bars). Caches extracted sprites for performance.
+    (useful for progress bars). The sheet is decoded once into a NumPy
+    RGBA array; tiles and rows are zero-copy views into it. PIL tiles
+    for the whole grid are built up front, rows are wrapped on demand.
     """
 
     def __init__(self, image_path: str, tile_width: int = 16, tile_height: int = 16):
@@ -29,12 +43,78 @@ class SpriteSheet:
         self.tile_width = tile_width
         self.tile_height = tile_height
         self.sheet = Image.open(image_path).convert('RGBA')
+        self.sheet.load()  # Force the full decode now, not on first access
         self.width = self.sheet.width
         self.height = self.sheet.height
 
-        # Cache for extracted sprites
-        self._tile_cache: Dict[Tuple[int, int], Image.Image] = {}
+        # Decoded pixels as a single read-only (H, W, 4) uint8 buffer.
+        # All tile/row views share it, so treat self.sheet as immutable.
+        self._raw = self.sheet.tobytes()
+        self._pixels = np.frombuffer(self._raw, dtype=np.uint8).reshape(self.height, self.width, 4)
+
+        # Grid dimensions and tile edge offsets (offsets[i]..offsets[i + 1])
+        self.rows = self.height // tile_height
+        self.cols = self.width // tile_width
+        self._x_offsets = [c * tile_width for c in range(self.cols + 1)]
+        self._y_offsets = [r * tile_height for r in range(self.rows + 1)]
+
+        # Grid of PIL tiles, indexed [row][col]
+        self._tiles: List[List[Image.Image]] = [
+            [Image.fromarray(self.get_sprite_array(c, r)) for c in range(self.cols)]
+            for r in range(self.rows)
+        ]
+
+        # Cache for PIL wrappers of extracted rows
         self._row_cache: Dict[int, Image.Image] = {}
+        self._row_mask_cache: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def get(cls, image_path: str, tile_width: int = 16, tile_height: int = 16) -> "SpriteSheet":
+        """Get a shared sprite sheet, loading it on first use.
+
+        Sheets are cached by (path, tile size) so each PNG is decoded once
+        no matter how many screens use it.
+
+        Args:
+            image_path: Path to the sprite sheet PNG
+            tile_width: Width of each tile in pixels (default 16)
+            tile_height: Height of each tile in pixels (default 16)
+
+        Returns:
+            Cached SpriteSheet instance
+        """
+        cache_key = (image_path, tile_width, tile_height)
+
+        if cache_key not in _sheet_cache:
+            _sheet_cache[cache_key] = cls(image_path, tile_width, tile_height)
+
+        return _sheet_cache[cache_key]
+
+    @classmethod
+    def preload_all(cls, image_paths: Iterable[str], tile_width: int = 16, tile_height: int = 16) -> None:
+        """Load several sprite sheets into the shared cache up front.
+
+        Args:
+            image_paths: Paths of sprite sheet PNGs to load
+            tile_width: Width of each tile in pixels (default 16)
+            tile_height: Height of each tile in pixels (default 16)
+        """
+        for image_path in image_paths:
+            cls.get(image_path, tile_width, tile_height)
+
+    def get_sprite_array(self, col: int, row: int) -> np.ndarray:
+        """Get a single tile at (col, row) as a view into the sheet pixels.
+
+        Args:
+            col: Column index (0-based)
+            row: Row index (0-based)
+
+        Returns:
+            (tile_height, tile_width, 4) uint8 array view (no copy)
+        """
+        y_offsets = self._y_offsets
+        x_offsets = self._x_offsets
+        return self._pixels[y_offsets[row]:y_offsets[row + 1], x_offsets[col]:x_offsets[col + 1]]
 
     def get_sprite(self, col: int, row: int) -> Image.Image:
         """Extract a single tile sprite at (col, row).
@@ -46,26 +126,18 @@ class SpriteSheet:
         Returns:
             PIL Image of the extracted tile
         """
-        # Check cache first
-        cache_key = (col, row)
-        if cache_key in self._tile_cache:
-            return self._tile_cache[cache_key]
-
-        # Calculate pixel coordinates
-        x = col * self.tile_width
-        y = row * self.tile_height
-
-        # Extract tile
-        tile = self.sheet.crop((
-            x,
-            y,
-            x + self.tile_width,
-            y + self.tile_height
-        ))
+        return self._tiles[row][col]
 
-        # Cache and return
-        self._tile_cache[cache_key] = tile
-        return tile
+    def get_row_array(self, row: int) -> np.ndarray:
+        """Get a full row as a view into the sheet pixels.
+
+        Args:
+            row: Row index (0-based)
+
+        Returns:
+            (tile_height, width, 4) uint8 array view (no copy)
+        """
+        return self._pixels[self._y_offsets[row]:self._y_offsets[row + 1]]
 
     def get_row(self, row: int) -> Image.Image:
         """Extract a full row from the sprite sheet.
@@ -82,21 +154,37 @@ class SpriteSheet:
         if row in self._row_cache:
             return self._row_cache[row]
 
-        # Calculate pixel coordinates
-        y = row * self.tile_height
-
-        # Extract full row
-        row_sprite = self.sheet.crop((
-            0,
-            y,
-            self.width,
-            y + self.tile_height
-        ))
+        # Wrap the pixel view as a PIL image
+        row_sprite = Image.fromarray(self.get_row_array(row))
 
         # Cache and return
         self._row_cache[row] = row_sprite
         return row_sprite
 
+    def blit_row_into(self, dest: np.ndarray, x: int, y: int, row: int) -> None:
+        """Copy a full row into a NumPy frame buffer without going through PIL.
+
+        Pixels with zero alpha are skipped; all others are copied as-is
+        (sprites use hard-edged 1-bit transparency, so no blending is needed).
+
+        Args:
+            dest: (H, W, C) uint8 array to draw into, C = 3 (RGB) or 4 (RGBA)
+            x: Left edge in dest
+            y: Top edge in dest
+            row: Row index (0-based)
+        """
+        if row not in self._row_mask_cache:
+            self._row_mask_cache[row] = self.get_row_array(row)[..., 3:4] > 0
+        mask = self._row_mask_cache[row]
+
+        region = dest[y:y + self.tile_height, x:x + self.width]
+        height, width, channels = region.shape
+        np.copyto(
+            region,
+            self.get_row_array(row)[:height, :width, :channels],
+            where=mask[:height, :width]
+        )
+
     def get_sprites_range(self, start_col: int, start_row: int,
                           end_col: int, end_row: int) -> list[Image.Image]:
         """Extract a range of sprites (useful for animations).
@@ -110,11 +198,48 @@ class SpriteSheet:
         Returns:
             List of PIL Images in left-to-right, top-to-bottom order
         """
-        sprites = []
-        for r in range(start_row, end_row + 1):
-            for c in range(start_col, end_col + 1):
-                sprites.append(self.get_sprite(c, r))
-        return sprites
+        return [
+            tile
+            for tile_row in self._tiles[start_row:end_row + 1]
+            for tile in tile_row[start_col:end_col + 1]
+        ]
+
+    def get_sprites_range_array(self, start_col: int, start_row: int,
+                                end_col: int, end_row: int) -> list[np.ndarray]:
+        """Get a range of tiles as views into the sheet pixels.
+
+        The whole block is sliced once and reshaped into a tile grid view,
+        so no per-tile offset math happens in Python.
+
+        Args:
+            start_col: Starting column (0-based)
+            start_row: Starting row (0-based)
+            end_col: Ending column (0-based, inclusive)
+            end_row: Ending row (0-based, inclusive)
+
+        Returns:
+            List of (tile_height, tile_width, 4) array views in
+            left-to-right, top-to-bottom order
+        """
+        n_rows = end_row - start_row + 1
+        n_cols = end_col - start_col + 1
+        block = self._pixels[
+            self._y_offsets[start_row]:self._y_offsets[end_row + 1],
+            self._x_offsets[start_col]:self._x_offsets[end_col + 1]
+        ]
+        # (n_rows, n_cols, tile_height, tile_width, 4) view of the block
+        grid = block.reshape(n_rows, self.tile_height, n_cols, self.tile_width, 4).swapaxes(1, 2)
+        return [tile for grid_row in grid for tile in grid_row]
+
+
+# Progress bar sprite for each 10% step (index = rounded percentage // 10).
+# 0-40 are in icons.png rows 3-7, 50-80 are in progress-bars.png rows 0-3,
+# and 90/100 both map to bar 80 (full).
+_PROGRESS_BAR_TABLE: Tuple[ProgressBarInfo, ...] = tuple(
+    ProgressBarInfo('icons', 3 + step) if step <= 4
+    else ProgressBarInfo('progress-bars', min(step, 8) - 5)
+    for step in range(11)
+)
 
 
 def get_progress_bar_for_percentage(percentage: float) -> ProgressBarInfo:
@@ -131,22 +256,82 @@ def get_progress_bar_for_percentage(percentage: float) -> ProgressBarInfo:
         ProgressBarInfo with sheet name and row index
     """
     # Clamp to 0-100 range
-    percentage = max(0, min(100, percentage))
+    if percentage <= 0:
+        return _PROGRESS_BAR_TABLE[0]
+    if percentage >= 100:
+        return _PROGRESS_BAR_TABLE[10]
 
-    # Round percentage to nearest 10
-    rounded_percentage = round(percentage / 10) * 10
+    # Round percentage to nearest 10 and look up the bar
+    return _PROGRESS_BAR_TABLE[round(percentage / 10)]
 
-    # Map to bar value (0, 10, 20, ..., 80)
-    # 100% and 90% both map to bar 80 (full)
-    bar_value = min(rounded_percentage, 80)
 
-    # Map to sprite sheet and row
-    if bar_value <= 40:
-        # 0, 10, 20, 30, 40 are in icons.png rows 3-7
-        return ProgressBarInfo('icons', 3 + (bar_value // 10))
-    else:
-        # 50, 60, 70, 80 are in progress-bars.png rows 0-3
-        return ProgressBarInfo('progress-bars', (bar_value - 50) // 10)
+def upscale2x(image: Image.Image) -> Image.Image:
+    """Scale an image up 2x with nearest-neighbor sampling.
+
+    Equivalent to image.resize((w * 2, h * 2), Image.NEAREST), but done as
+    a NumPy block expansion. Intended for L/RGB/RGBA pixel art.
+
+    Args:
+        image: PIL Image to scale
+
+    Returns:
+        New PIL Image twice the size, in the same mode
+    """
+    pixels = np.asarray(image)
+    return Image.fromarray(pixels.repeat(2, axis=0).repeat(2, axis=1))
+
+
+# Decoded image cache, keyed by path and (for flattened images) background
+_image_cache: Dict[Tuple[str, Optional[Tuple[int, int, int]]], Image.Image] = {}
+
+
+def load_image(image_path: str) -> Image.Image:
+    """Load a PNG as RGBA, decoding each path only once.
+
+    The returned image is shared between callers and must not be mutated;
+    copy it first if it needs drawing on.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        RGBA PIL Image
+    """
+    cache_key = (image_path, None)
+
+    if cache_key not in _image_cache:
+        img = Image.open(image_path).convert("RGBA")
+        img.load()
+        _image_cache[cache_key] = img
+
+    return _image_cache[cache_key]
+
+
+def load_flat_image(
+    image_path: str,
+    background: Tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """Load a PNG composited onto a solid background as RGB (cached).
+
+    Used for screen backgrounds so they can be pasted without a mask.
+    The returned image is shared and must not be mutated.
+
+    Args:
+        image_path: Path to the image file
+        background: RGB color to composite onto (default white)
+
+    Returns:
+        RGB PIL Image
+    """
+    cache_key = (image_path, tuple(background))
+
+    if cache_key not in _image_cache:
+        rgba = load_image(image_path)
+        flat = Image.new("RGB", rgba.size, tuple(background))
+        flat.paste(rgba, (0, 0), rgba)
+        _image_cache[cache_key] = flat
+
+    return _image_cache[cache_key]
 
 
 # Font cache to avoid reloading fonts repeatedly
@@ -182,6 +367,9 @@ def render_text(
 ) -> Image.Image:
     """Render text to a PIL Image with the specified font.
 
+    Results are cached, so repeated calls with the same arguments return
+    the same Image object. Callers must not mutate the returned image.
+
     Args:
         text: Text string to render
         font_path: Path to TTF font file
@@ -192,12 +380,23 @@ def render_text(
     Returns:
         PIL Image containing the rendered text
     """
+    return _render_text_cached(text, font_path, font_size, tuple(color),
+                               tuple(background) if background is not None else None)
+
+
+@lru_cache(maxsize=256)
+def _render_text_cached(
+    text: str,
+    font_path: str,
+    font_size: int,
+    color: Tuple[int, int, int],
+    background: Optional[Tuple[int, int, int]]
+) -> Image.Image:
+    """Rasterize text (cached backend for render_text)."""
     font = load_font(font_path, font_size)
 
-    # Create a temporary image to measure text size
-    temp_img = Image.new('RGBA', (1, 1))
-    draw = ImageDraw.Draw(temp_img)
-    bbox = draw.textbbox((0, 0), text, font=font)
+    # Measure text size directly from the font (no scratch image needed)
+    bbox = font.getbbox(text)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
 
@@ -205,10 +404,66 @@ def render_text(
     if background is not None:
         img = Image.new('RGB', (text_width, text_height), color=background)
     else:
-        img = Image.new('RGBA', (text_width, text_height), color=(0, 0, 0, 0))
+        # color=None skips Pillow's separate fill pass; new image memory is
+        # zero-initialized, which is already fully transparent RGBA
+        img = Image.new('RGBA', (text_width, text_height), color=None)
 
     # Draw text
     draw = ImageDraw.Draw(img)
     draw.text((-bbox[0], -bbox[1]), text, font=font, fill=color)
 
     return img
+
+
+@lru_cache(maxsize=512)
+def render_text_sprite(
+    text: str,
+    font_path: str,
+    font_size: int,
+    color: Tuple[int, int, int]
+) -> TextSprite:
+    """Rasterize text once for screens that draw it with fontmode '1'.
+
+    Pasting the sprite with paste_text_sprite gives the same pixels as
+    draw.text at that position with anti-aliasing disabled, without a
+    FreeType layout pass per frame. Results are cached; callers must not
+    mutate the returned image.
+
+    Args:
+        text: Text string to render
+        font_path: Path to TTF font file
+        font_size: Font size in pixels
+        color: Text color as RGB tuple
+
+    Returns:
+        TextSprite with the glyph image and its offset from the anchor
+    """
+    font = load_font(font_path, font_size)
+    bbox = font.getbbox(text)
+    size = (max(1, bbox[2] - bbox[0]), max(1, bbox[3] - bbox[1]))
+
+    img = Image.new('RGBA', size, color=None)
+    draw = ImageDraw.Draw(img)
+    draw.fontmode = '1'
+    draw.text((-bbox[0], -bbox[1]), text, font=font, fill=color)
+
+    return TextSprite(img, (bbox[0], bbox[1]))
+
+
+def paste_text_sprite(buffer: Image.Image, sprite: TextSprite, x: int, y: int) -> None:
+    """Paste a TextSprite as if drawn with draw.text((x, y), ...).
+
+    Args:
+        buffer: Image to draw into
+        sprite: Sprite from render_text_sprite
+        x: Text anchor X (same as the draw.text position)
+        y: Text anchor Y
+    """
+    image = sprite.image
+    buffer.paste(image, (x + sprite.offset[0], y + sprite.offset[1]), image)
+
+
+def clear_text_cache() -> None:
+    """Drop all cached render_text images (e.g. after a font or theme change)."""
+    _render_text_cached.cache_clear()
+    render_text_sprite.cache_clear()
@@ -35,6 +35,7 @@ class Config:
     SPRITES_PATH = os.path.join(ASSETS_PATH, "sprites")
     FONTS_PATH = os.path.join(ASSETS_PATH, "fonts")
     DB_PATH = "habit_tracker.db"
+    CACHE_PATH = os.path.join(BASE_DIR, ".cache")
 
     # Sprite files
     ICONS_SPRITE_SHEET = os.path.join(SPRITES_PATH, "icons.png")
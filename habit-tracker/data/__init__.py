@@ -1,5 +1,6 @@
 """Data persistence layer using SQLite."""
 
 from .db import Database
+from .models import Habit, HabitLog
 
-__all__ = ['Database']
+__all__ = ['Database', 'Habit', 'HabitLog']
@@ -2,9 +2,51 @@
 
 import sqlite3
 import json
-from typing import Optional, List, Dict, Any
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from data.migrations import check_and_migrate
+from data.models import Habit, HabitLog, habit_row_factory, habit_log_row_factory
+
+# Optional fast JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Hot-path statements, shared so every call hits the connection's
+# statement cache with the same SQL text
+# Upserts on the UNIQUE(habit_id, date) index: a repeat log for the same
+# day updates the row in place instead of REPLACE's delete + reinsert
+_SQL_INSERT_LOG = """
+    INSERT INTO habit_logs
+    (habit_id, date, completed, skipped, quantity, points_earned, logged_at)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(habit_id, date) DO UPDATE SET
+        completed = excluded.completed, skipped = excluded.skipped,
+        quantity = excluded.quantity, points_earned = excluded.points_earned,
+        logged_at = excluded.logged_at
+"""
+_SQL_SELECT_HABIT_BY_ID = "SELECT * FROM habits WHERE id = ?"
+_SQL_INSERT_HABIT = """
+    INSERT INTO habits (name, type, points_per, category, target_time, grace_period, recurrence)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+# Updates the row with that id in place (created_at is left untouched), or
+# inserts it under that id if it is gone
+_SQL_UPSERT_HABIT = """
+    INSERT INTO habits (id, name, type, points_per, category, target_time, grace_period, recurrence, active)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name, type = excluded.type, points_per = excluded.points_per,
+        category = excluded.category, target_time = excluded.target_time,
+        grace_period = excluded.grace_period, recurrence = excluded.recurrence,
+        active = excluded.active
+"""
 
 
 class Database:
@@ -17,12 +59,56 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # Autocommit mode: single statements commit on their own,
+        # multi-statement writes use _transaction().
+        # The connection may be shared with other threads (e.g. animation
+        # or background updates); writes are serialized by _write_lock and
+        # WAL lets reads proceed alongside them.
+        self.conn = sqlite3.connect(
+            db_path,
+            isolation_level=None,
+            cached_statements=256,
+            check_same_thread=False
+        )
+        self._write_lock = threading.RLock()
         self.conn.row_factory = sqlite3.Row
+        self._configure_connection()
         self._create_schema()
         # Run any pending migrations
         check_and_migrate(self.conn)
 
+    def _configure_connection(self) -> None:
+        """Apply per-connection PRAGMAs.
+
+        WAL with synchronous=NORMAL avoids the double fsync per commit of
+        the default rollback journal, which dominates writes on an SD card.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-4096")  # 4 MB
+        cursor.execute("PRAGMA mmap_size=67108864")  # 64 MB
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run several statements in one transaction.
+
+        Yields:
+            Cursor to execute statements on; commits on success,
+            rolls back if an exception is raised
+        """
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
     def _create_schema(self) -> None:
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -54,11 +140,16 @@ class Database:
                 quantity INTEGER DEFAULT 0,
                 points_earned INTEGER DEFAULT 0,
                 logged_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (habit_id) REFERENCES habits (id),
+                FOREIGN KEY (habit_id) REFERENCES habits (id) ON DELETE CASCADE,
                 UNIQUE(habit_id, date)
             )
         """)
 
+        # Indexes for date-only log queries and the active habit list.
+        # (habit_id, date) lookups already use the UNIQUE constraint's index.
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_date ON habit_logs(date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_habits_active ON habits(active, created_at)")
+
         # Character state
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS character_state (
@@ -68,8 +159,6 @@ class Database:
             )
         """)
 
-        self.conn.commit()
-
     def add_habit(
         self,
         name: str,
@@ -94,15 +183,12 @@ class Database:
         Returns:
             ID of the created habit
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO habits (name, type, points_per, category, target_time, grace_period, recurrence)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (name, habit_type, points_per, category, target_time, grace_period, recurrence))
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute(_SQL_INSERT_HABIT, (name, habit_type, points_per, category, target_time, grace_period, recurrence))
 
-        self.conn.commit()
-        habit_id = cursor.lastrowid
-        print(f"[DEBUG] Database.add_habit: Created habit ID {habit_id} (name='{name}', active should default to 1)")
+            habit_id = cursor.lastrowid
+        logger.debug("Database.add_habit: Created habit ID %s (name=%r)", habit_id, name)
         return habit_id
 
     def update_habit(
@@ -130,70 +216,127 @@ class Database:
             recurrence: Recurrence pattern (e.g., '3/day', '4/week', 'daily')
             active: Whether habit is active
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            UPDATE habits
-            SET name = ?, type = ?, points_per = ?, category = ?,
-                target_time = ?, grace_period = ?, recurrence = ?, active = ?
-            WHERE id = ?
-        """, (name, habit_type, points_per, category, target_time, grace_period, recurrence, int(active), habit_id))
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                UPDATE habits
+                SET name = ?, type = ?, points_per = ?, category = ?,
+                    target_time = ?, grace_period = ?, recurrence = ?, active = ?
+                WHERE id = ?
+            """, (name, habit_type, points_per, category, target_time, grace_period, recurrence, int(active), habit_id))
 
-        self.conn.commit()
+    def save_habit(
+        self,
+        habit_id: Optional[int],
+        name: str,
+        habit_type: str,
+        points_per: int,
+        category: str,
+        target_time: Optional[str] = None,
+        grace_period: int = 60,
+        recurrence: str = "daily",
+        active: bool = True
+    ) -> int:
+        """Create or update a habit in a single statement.
 
-    def delete_habit(self, habit_id: int) -> None:
-        """Delete a habit and its associated logs.
+        Args:
+            habit_id: ID of habit to update, or None to create a new one
+            name: Habit name
+            habit_type: 'binary' or 'incremental'
+            points_per: Points awarded per completion/unit
+            category: 'good' or 'bad'
+            target_time: Target time for habit (e.g., '09:00')
+            grace_period: Grace period in minutes before reminder
+            recurrence: Recurrence pattern (e.g., '3/day', '4/week', 'daily')
+            active: Whether habit is active (only applied to existing habits;
+                new habits start active, as with add_habit)
+
+        Returns:
+            ID of the saved habit
+        """
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            if habit_id is None:
+                cursor.execute(_SQL_INSERT_HABIT, (
+                    name, habit_type, points_per, category,
+                    target_time, grace_period, recurrence
+                ))
+                habit_id = cursor.lastrowid
+            else:
+                cursor.execute(_SQL_UPSERT_HABIT, (
+                    habit_id, name, habit_type, points_per, category,
+                    target_time, grace_period, recurrence, int(active)
+                ))
+        return habit_id
+
+    def add_habits_bulk(
+        self,
+        rows: List[Tuple[str, str, int, str, Optional[str], int, str]]
+    ) -> List[int]:
+        """Add many habits in a single transaction.
 
         Args:
-            habit_id: ID of habit to delete
+            rows: (name, habit_type, points_per, category, target_time,
+                grace_period, recurrence) tuples, with the same meaning as
+                add_habit's arguments
+
+        Returns:
+            IDs of the created habits, in the order given
         """
-        cursor = self.conn.cursor()
+        habit_ids = []
+        with self._transaction() as cursor:
+            for row in rows:
+                cursor.execute(_SQL_INSERT_HABIT, row)
+                habit_ids.append(cursor.lastrowid)
+        return habit_ids
 
-        # Delete associated logs first (foreign key constraint)
-        cursor.execute("DELETE FROM habit_logs WHERE habit_id = ?", (habit_id,))
+    def delete_habit(self, habit_id: int) -> None:
+        """Delete a habit and its associated logs.
 
-        # Delete the habit
-        cursor.execute("DELETE FROM habits WHERE id = ?", (habit_id,))
+        Logs are removed by the habit_logs ON DELETE CASCADE foreign key.
 
-        self.conn.commit()
+        Args:
+            habit_id: ID of habit to delete
+        """
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM habits WHERE id = ?", (habit_id,))
 
-    def get_all_habits(self, active_only: bool = True) -> List[Dict[str, Any]]:
+    def get_all_habits(self, active_only: bool = True) -> List[Habit]:
         """Get all habits from the database.
 
         Args:
             active_only: Only return active habits (default True)
 
         Returns:
-            List of habit dictionaries
+            List of Habit records
         """
         cursor = self.conn.cursor()
+        cursor.row_factory = habit_row_factory
 
         if active_only:
             cursor.execute("SELECT * FROM habits WHERE active = 1 ORDER BY created_at")
         else:
             cursor.execute("SELECT * FROM habits ORDER BY created_at")
 
-        rows = cursor.fetchall()
-        habits = [dict(row) for row in rows]
-        print(f"[DEBUG] Database.get_all_habits(active_only={active_only}): Returning {len(habits)} habits")
+        habits = cursor.fetchall()
+        logger.debug("Database.get_all_habits(active_only=%s): Returning %d habits", active_only, len(habits))
         return habits
 
-    def get_habit_by_id(self, habit_id: int) -> Optional[Dict[str, Any]]:
+    def get_habit_by_id(self, habit_id: int) -> Optional[Habit]:
         """Get a single habit by ID.
 
         Args:
             habit_id: ID of habit to retrieve
 
         Returns:
-            Habit dictionary or None if not found
+            Habit record or None if not found
         """
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM habits WHERE id = ?", (habit_id,))
-
-        row = cursor.fetchone()
-        if row is None:
-            return None
+        cursor.row_factory = habit_row_factory
+        cursor.execute(_SQL_SELECT_HABIT_BY_ID, (habit_id,))
 
-        return dict(row)
+        return cursor.fetchone()
 
     def save_character_state(self, state: Dict[str, Any]) -> None:
         """Save character state to database.
@@ -201,15 +344,17 @@ class Database:
         Args:
             state: Character state dictionary
         """
-        state_json = json.dumps(state)
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO character_state (id, state_json, updated_at)
-            VALUES (1, ?, CURRENT_TIMESTAMP)
-        """, (state_json,))
-
-        self.conn.commit()
+        if orjson is not None:
+            # OPT_NON_STR_KEYS stringifies int keys the way json.dumps does
+            state_json = orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            state_json = json.dumps(state)
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO character_state (id, state_json, updated_at)
+                VALUES (1, ?, CURRENT_TIMESTAMP)
+            """, (state_json,))
 
     def load_character_state(self) -> Optional[Dict[str, Any]]:
         """Load character state from database.
@@ -224,6 +369,8 @@ class Database:
         if row is None:
             return None
 
+        if orjson is not None:
+            return orjson.loads(row[0])
         return json.loads(row[0])
 
     def log_habit_completion(
@@ -245,21 +392,32 @@ class Database:
             quantity: Quantity for incremental habits
             points_earned: Points earned from this completion
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO habit_logs
-            (habit_id, date, completed, skipped, quantity, points_earned, logged_at)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (habit_id, date, int(completed), int(skipped), quantity, points_earned))
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute(_SQL_INSERT_LOG, (habit_id, date, int(completed), int(skipped), quantity, points_earned))
 
-        self.conn.commit()
+    def log_habit_completions_bulk(
+        self,
+        rows: List[Tuple[int, str, bool, bool, int, int]]
+    ) -> None:
+        """Log many habit completions in a single transaction.
+
+        Args:
+            rows: (habit_id, date, completed, skipped, quantity, points_earned)
+                tuples, with the same meaning as log_habit_completion's arguments
+        """
+        with self._transaction() as cursor:
+            cursor.executemany(_SQL_INSERT_LOG, [
+                (habit_id, date, int(completed), int(skipped), quantity, points_earned)
+                for habit_id, date, completed, skipped, quantity, points_earned in rows
+            ])
 
     def get_habit_logs(
         self,
         habit_id: int,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[HabitLog]:
         """Get habit logs for a date range.
 
         Args:
@@ -268,9 +426,10 @@ class Database:
             end_date: End date (YYYY-MM-DD) or None for all
 
         Returns:
-            List of log dictionaries ordered by date
+            List of HabitLog records ordered by date
         """
         cursor = self.conn.cursor()
+        cursor.row_factory = habit_log_row_factory
 
         if start_date and end_date:
             cursor.execute("""
@@ -297,27 +456,56 @@ class Database:
                 ORDER BY date
             """, (habit_id,))
 
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return cursor.fetchall()
+
+    def get_habit_logs_bulk(
+        self,
+        habit_ids: List[int],
+        start_date: str,
+        end_date: str
+    ) -> List[HabitLog]:
+        """Get logs for several habits over a date range in one query.
+
+        Args:
+            habit_ids: IDs of the habits to fetch logs for
+            start_date: Start date (YYYY-MM-DD), inclusive
+            end_date: End date (YYYY-MM-DD), inclusive
+
+        Returns:
+            List of HabitLog records ordered by habit_id, then date
+        """
+        if not habit_ids:
+            return []
+
+        cursor = self.conn.cursor()
+        cursor.row_factory = habit_log_row_factory
+        placeholders = ",".join("?" * len(habit_ids))
+        cursor.execute(f"""
+            SELECT * FROM habit_logs
+            WHERE habit_id IN ({placeholders}) AND date BETWEEN ? AND ?
+            ORDER BY habit_id, date
+        """, (*habit_ids, start_date, end_date))
+
+        return cursor.fetchall()
 
-    def get_logs_for_date(self, date: str) -> List[Dict[str, Any]]:
+    def get_logs_for_date(self, date: str) -> List[HabitLog]:
         """Get all habit logs for a specific date.
 
         Args:
             date: Date string (YYYY-MM-DD)
 
         Returns:
-            List of log dictionaries for that date
+            List of HabitLog records for that date
         """
         cursor = self.conn.cursor()
+        cursor.row_factory = habit_log_row_factory
         cursor.execute("""
             SELECT * FROM habit_logs
             WHERE date = ?
             ORDER BY habit_id
         """, (date,))
 
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return cursor.fetchall()
 
     def get_points_by_day(
         self,
@@ -342,8 +530,7 @@ class Database:
             ORDER BY date
         """, (start_date, end_date))
 
-        rows = cursor.fetchall()
-        return [{"date": row[0], "total_points": row[1]} for row in rows]
+        return [{"date": row[0], "total_points": row[1]} for row in cursor]
 
     def get_completion_stats(
         self,
@@ -358,23 +545,23 @@ class Database:
 
         Returns:
             List of dicts with habit_id, habit_name, completed_count, total_days
+            (habits with no logs in the range are included with zero counts)
         """
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT
                 h.id as habit_id,
                 h.name as habit_name,
-                SUM(CASE WHEN hl.completed = 1 THEN 1 ELSE 0 END) as completed_count,
-                COUNT(*) as total_days
+                COUNT(hl.id) FILTER (WHERE hl.completed = 1) as completed_count,
+                COUNT(hl.id) as total_days
             FROM habits h
-            LEFT JOIN habit_logs hl ON h.id = hl.habit_id
-            WHERE hl.date >= ? AND hl.date <= ?
+            LEFT JOIN habit_logs hl
+                ON h.id = hl.habit_id AND hl.date >= ? AND hl.date <= ?
             GROUP BY h.id, h.name
             ORDER BY h.name
         """, (start_date, end_date))
 
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in cursor]
 
     def close(self) -> None:
         """Close database connection."""
@@ -1,38 +1,40 @@
 """Database migration system for habit tracker."""
 
 import sqlite3
-from typing import Callable, List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 
 # Current schema version
-CURRENT_SCHEMA_VERSION = 2
+CURRENT_SCHEMA_VERSION = 3
 
 
 def get_schema_version(conn: sqlite3.Connection) -> int:
     """Get current schema version from database.
 
+    The version lives in the database header (PRAGMA user_version), so
+    reading it needs no DDL or table scan. Databases created before that
+    switch still carry a schema_version table, which is consulted once
+    while user_version is unset.
+
     Args:
         conn: SQLite connection
 
     Returns:
-        Current schema version (0 if table doesn't exist)
+        Current schema version (0 for a database never migrated)
     """
-    cursor = conn.cursor()
-
-    # Create schema_version table if it doesn't exist
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS schema_version (
-            version INTEGER PRIMARY KEY,
-            applied_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version:
+        return version
 
-    # Get current version
-    cursor.execute("SELECT MAX(version) FROM schema_version")
-    result = cursor.fetchone()
-    version = result[0] if result[0] is not None else 0
+    # Legacy version table from before user_version was used
+    cursor = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    )
+    if cursor.fetchone() is None:
+        return 0
 
-    return version
+    result = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return result[0] if result[0] is not None else 0
 
 
 def set_schema_version(conn: sqlite3.Connection, version: int) -> None:
@@ -42,12 +44,8 @@ def set_schema_version(conn: sqlite3.Connection, version: int) -> None:
         conn: SQLite connection
         version: Schema version to set
     """
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT OR REPLACE INTO schema_version (version) VALUES (?)",
-        (version,)
-    )
-    conn.commit()
+    # PRAGMA values cannot be bound as parameters
+    conn.execute(f"PRAGMA user_version = {int(version)}")
 
 
 # Migration functions - add new ones as schema changes
@@ -70,63 +68,110 @@ def migration_002(conn: sqlite3.Connection) -> None:
     """
     cursor = conn.cursor()
 
-    # Find all habits with type='binary' and recurrence like 'N/day'
+    # Single set-based UPDATE; the leading count of 'N/day' is parsed in SQL
     cursor.execute("""
-        SELECT id, name, recurrence
-        FROM habits
+        UPDATE habits
+        SET type = 'incremental'
         WHERE type = 'binary'
         AND recurrence LIKE '%/day'
+        AND CAST(substr(recurrence, 1, instr(recurrence, '/') - 1) AS INTEGER) > 1
     """)
+    fixed = cursor.rowcount
 
-    habits_to_update = []
-    for row in cursor.fetchall():
-        habit_id, name, recurrence = row
-        # Parse recurrence (e.g., "3/day" -> 3)
-        if '/' in recurrence:
-            count = int(recurrence.split('/')[0])
-            if count > 1:
-                habits_to_update.append((habit_id, name, recurrence))
+    if fixed > 0:
+        print(f"  Fixed {fixed} habit(s) to use incremental type")
 
-    # Update these habits to type='incremental'
-    for habit_id, name, recurrence in habits_to_update:
-        cursor.execute("""
-            UPDATE habits
-            SET type = 'incremental'
-            WHERE id = ?
-        """, (habit_id,))
-        print(f"  - Updated habit '{name}' ({recurrence}) to type='incremental'")
 
-    conn.commit()
+def migration_003(conn: sqlite3.Connection) -> None:
+    """Rebuild habit_logs so its habit_id foreign key cascades on delete.
 
-    if habits_to_update:
-        print(f"  Fixed {len(habits_to_update)} habit(s) to use incremental type")
+    SQLite cannot alter a foreign key in place, so the table is copied
+    into a new one with ON DELETE CASCADE. Logs whose habit no longer
+    exists are dropped during the copy. Runs inside the transaction
+    opened by run_migrations, so a failure leaves the old table intact.
+    """
+    cursor = conn.cursor()
+
+    # Skip if the table was created with the cascading key already
+    cursor.execute("PRAGMA foreign_key_list(habit_logs)")
+    if any(row[6] == "CASCADE" for row in cursor.fetchall()):
+        return
+
+    cursor.execute("""
+        CREATE TABLE habit_logs_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            habit_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            completed INTEGER DEFAULT 0,
+            skipped INTEGER DEFAULT 0,
+            quantity INTEGER DEFAULT 0,
+            points_earned INTEGER DEFAULT 0,
+            logged_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (habit_id) REFERENCES habits (id) ON DELETE CASCADE,
+            UNIQUE(habit_id, date)
+        )
+    """)
+    cursor.execute("""
+        INSERT INTO habit_logs_new
+            (id, habit_id, date, completed, skipped, quantity, points_earned, logged_at)
+        SELECT id, habit_id, date, completed, skipped, quantity, points_earned, logged_at
+        FROM habit_logs
+        WHERE habit_id IN (SELECT id FROM habits)
+    """)
+    cursor.execute("DROP TABLE habit_logs")
+    cursor.execute("ALTER TABLE habit_logs_new RENAME TO habit_logs")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_date ON habit_logs(date)")
+
+    print("  Rebuilt habit_logs with ON DELETE CASCADE")
 
 
 # List of all migrations (in order)
 MIGRATIONS: List[Tuple[int, str, Callable]] = [
     (1, "Initial schema", migration_001),
     (2, "Fix habit types for multi-count daily habits", migration_002),
+    (3, "Cascade habit log deletes", migration_003),
 ]
 
 
-def run_migrations(conn: sqlite3.Connection) -> List[str]:
+def run_migrations(
+    conn: sqlite3.Connection,
+    current_version: Optional[int] = None
+) -> List[str]:
     """Run all pending migrations.
 
+    All pending migrations and the version bump share one transaction, so
+    the upgrade costs a single commit and is rolled back as a whole if any
+    step fails.
+
     Args:
         conn: SQLite connection
+        current_version: Version already read by the caller, or None to
+            read it here
 
     Returns:
         List of applied migration descriptions
     """
-    current_version = get_schema_version(conn)
+    if current_version is None:
+        current_version = get_schema_version(conn)
     applied = []
 
-    for version, description, migration_func in MIGRATIONS:
-        if version > current_version:
-            print(f"Applying migration {version}: {description}")
-            migration_func(conn)
-            set_schema_version(conn, version)
-            applied.append(f"v{version}: {description}")
+    conn.execute("BEGIN")
+    try:
+        new_version = current_version
+        for version, description, migration_func in MIGRATIONS:
+            if version > current_version:
+                print(f"Applying migration {version}: {description}")
+                migration_func(conn)
+                new_version = version
+                applied.append(f"v{version}: {description}")
+
+        # One version write for the whole batch; it commits with the steps
+        if new_version != current_version:
+            set_schema_version(conn, new_version)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
 
     return applied
 
@@ -141,7 +186,7 @@ def check_and_migrate(conn: sqlite3.Connection) -> None:
 
     if current_version < CURRENT_SCHEMA_VERSION:
         print(f"Database schema outdated (v{current_version}), migrating to v{CURRENT_SCHEMA_VERSION}...")
-        applied = run_migrations(conn)
+        applied = run_migrations(conn, current_version)
         if applied:
             print(f"Applied {len(applied)} migration(s):")
             for migration in applied:
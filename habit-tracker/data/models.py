@@ -0,0 +1,61 @@
+"""Lightweight row types returned by the Database layer."""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+class _RowAccess:
+    """Mapping-style read access for slotted row records.
+
+    Lets callers that still treat rows as dicts (``row['name']``,
+    ``row.get('recurrence')``) keep working alongside attribute access.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+@dataclass(slots=True)
+class Habit(_RowAccess):
+    """A row of the habits table (fields in column order)."""
+    id: int
+    name: str
+    type: str
+    points_per: int
+    category: str
+    target_time: Optional[str]
+    grace_period: int
+    recurrence: str
+    active: int
+    created_at: str
+
+
+@dataclass(slots=True)
+class HabitLog(_RowAccess):
+    """A row of the habit_logs table (fields in column order)."""
+    id: int
+    habit_id: int
+    date: str
+    completed: int
+    skipped: int
+    quantity: int
+    points_earned: int
+    logged_at: str
+
+
+def habit_row_factory(cursor, row: tuple) -> Habit:
+    """sqlite3 row factory building Habit records positionally."""
+    return Habit(*row)
+
+
+def habit_log_row_factory(cursor, row: tuple) -> HabitLog:
+    """sqlite3 row factory building HabitLog records positionally."""
+    return HabitLog(*row)
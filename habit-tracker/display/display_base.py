@@ -19,7 +19,10 @@ class DisplayBase(ABC):
 
     @abstractmethod
     def get_buffer(self) -> Image.Image:
-        """Get a PIL Image buffer for drawing.
+        """Get the PIL Image buffer for drawing.
+
+        The same image is returned every frame and still holds the last
+        frame shown, so screens draw into it directly without a copy.
 
         Returns:
             PIL Image object of size (width, height) in RGB mode
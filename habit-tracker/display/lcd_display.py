@@ -1,5 +1,7 @@
 """LCD display driver for Waveshare 1.44" HAT with ST7735S controller."""
 
+import numpy as np
+from typing import Optional
 from PIL import Image
 from .display_base import DisplayBase
 
@@ -10,6 +12,12 @@ try:
 except ImportError:
     HAS_LCD = False
 
+# Fall back to a full-frame push once this share of rows has changed
+FULL_FRAME_THRESHOLD = 0.8
+
+# SPI transfer chunk size, matching the ST7735 driver's own display()
+SPI_CHUNK_SIZE = 4096
+
 
 class LCDDisplay(DisplayBase):
     """Display implementation for ST7735S LCD via SPI."""
@@ -56,26 +64,76 @@ class LCDDisplay(DisplayBase):
         # Create buffer
         self._buffer = Image.new('RGB', (width, height), color=(0, 0, 0))
 
+        # Pixels of the frame last sent to the panel, for partial updates
+        self._prev_frame: Optional[np.ndarray] = None
+
     def get_buffer(self) -> Image.Image:
-        """Get a PIL Image buffer for drawing.
+        """Get the PIL Image buffer for drawing.
+
+        The same image is returned every frame and still holds the last
+        frame shown, so screens draw into it directly without a copy.
 
         Returns:
             PIL Image object of size (width, height) in RGB mode
         """
-        return self._buffer.copy()
+        return self._buffer
 
     def update(self, buffer: Image.Image) -> None:
         """Update the display with the provided buffer.
 
+        Compares against the last frame sent and pushes only the band of
+        changed rows over SPI, falling back to a full frame when most of
+        the screen changed.
+
         Args:
             buffer: PIL Image to display
         """
-        # ST7735 library expects RGB mode PIL Image
-        # The display() method handles RGB565 conversion internally
-        self._lcd.display(buffer)
+        frame = np.asarray(buffer.convert('RGB') if buffer.mode != 'RGB' else buffer)
+        prev = self._prev_frame
+        self._prev_frame = frame
+
+        if prev is None or prev.shape != frame.shape:
+            # ST7735 library expects RGB mode PIL Image
+            # The display() method handles RGB565 conversion internally
+            self._lcd.display(buffer)
+        else:
+            # Only send the band of rows that changed (nothing if identical)
+            changed = np.flatnonzero(np.any(frame != prev, axis=(1, 2)))
+            if changed.size:
+                y0, y1 = int(changed[0]), int(changed[-1])
+                if y1 - y0 + 1 > FULL_FRAME_THRESHOLD * self.height:
+                    self._lcd.display(buffer)
+                else:
+                    self._send_rows(frame, y0, y1)
+
+        # Keep the shown frame as the next draw buffer
+        self._buffer = buffer
+
+    def _send_rows(self, frame: np.ndarray, y0: int, y1: int) -> None:
+        """Push image rows y0..y1 (inclusive) to the panel.
+
+        With rotation=90 the driver rotates each frame a quarter turn
+        counter-clockwise, so image rows land on panel columns. The stripe
+        is rotated the same way and written into a window spanning those
+        columns and every panel row.
 
-        # Store buffer
-        self._buffer = buffer.copy()
+        Args:
+            frame: (height, width, 3) uint8 pixels of the new frame
+            y0: First changed image row
+            y1: Last changed image row
+        """
+        stripe = np.rot90(frame[y0:y1 + 1], 1)
+
+        # RGB888 -> big-endian RGB565, as the driver's image_to_data does
+        r = stripe[..., 0].astype(np.uint16)
+        g = stripe[..., 1].astype(np.uint16)
+        b = stripe[..., 2].astype(np.uint16)
+        rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        data = rgb565.astype('>u2').tobytes()
+
+        self._lcd.set_window(y0, 0, y1, self.width - 1)
+        for i in range(0, len(data), SPI_CHUNK_SIZE):
+            self._lcd.data(list(data[i:i + SPI_CHUNK_SIZE]))
 
     def close(self) -> None:
         """Clean up LCD resources."""
@@ -1,6 +1,7 @@
 """Pygame-based display for laptop development."""
 
 import os
+import numpy as np
 import pygame
 from PIL import Image
 from .display_base import DisplayBase
@@ -21,22 +22,34 @@ class PygameDisplay(DisplayBase):
         self.scale = scale
 
         # CRITICAL: Force nearest-neighbor scaling for pixel-perfect rendering
-        # This must be set BEFORE pygame.init()
+        # This must be set BEFORE the video subsystem is initialized
         os.environ['SDL_RENDER_SCALE_QUALITY'] = '0'  # 0 = nearest, 1 = linear, 2 = best
 
-        pygame.init()
+        # Only video (which includes the event queue) is needed; fonts are
+        # rendered with PIL, and audio/joystick init is slow and unused
+        pygame.display.init()
         self.window = pygame.display.set_mode((width * scale, height * scale))
         pygame.display.set_caption("Habit Tracker - Pi Zero Simulator")
 
         self._buffer = Image.new('RGB', (width, height), color=(0, 0, 0))
 
+        # Window-sized surface and pixel scratch, reused every frame. The
+        # scratch is laid out (x, y, rgb) to match pygame.surfarray.
+        self._scaled_surface = pygame.Surface((width * scale, height * scale))
+        self._np_scratch = np.empty((width * scale, height * scale, 3), dtype=np.uint8)
+        # (x, dx, y, dy, rgb) view: each source pixel owns a scale x scale block
+        self._scratch_blocks = self._np_scratch.reshape(width, scale, height, scale, 3)
+
     def get_buffer(self) -> Image.Image:
-        """Get a PIL Image buffer for drawing.
+        """Get the PIL Image buffer for drawing.
+
+        The same image is returned every frame and still holds the last
+        frame shown, so screens draw into it directly without a copy.
 
         Returns:
             PIL Image object of size (width, height) in RGB mode
         """
-        return self._buffer.copy()
+        return self._buffer
 
     def update(self, buffer: Image.Image) -> None:
         """Update the display with the provided buffer.
@@ -44,27 +57,23 @@ class PygameDisplay(DisplayBase):
         Args:
             buffer: PIL Image to display
         """
-        # PIXEL-PERFECT SCALING: Scale the PIL image BEFORE converting to Pygame
-        # This avoids Pygame's transform altogether
-        scaled_pil = buffer.resize(
-            (self.width * self.scale, self.height * self.scale),
-            Image.NEAREST  # Nearest-neighbor, no interpolation
-        )
-
-        # Convert scaled PIL Image to Pygame surface
-        mode = scaled_pil.mode
-        size = scaled_pil.size
-        data = scaled_pil.tobytes()
-
-        surface = pygame.image.fromstring(data, size, mode)
-
-        # Draw to window (no scaling needed - already done in PIL)
-        self.window.blit(surface, (0, 0))
+        if buffer.mode != 'RGB':
+            buffer = buffer.convert('RGB')
+
+        # PIXEL-PERFECT SCALING: nearest-neighbor upscale by broadcasting
+        # each source pixel over its block of the preallocated scratch
+        arr = np.asarray(buffer)  # (y, x, rgb)
+        self._scratch_blocks[...] = arr.swapaxes(0, 1)[:, None, :, None, :]
+
+        pygame.surfarray.blit_array(self._scaled_surface, self._np_scratch)
+
+        # Draw to window (no scaling needed - already done above)
+        self.window.blit(self._scaled_surface, (0, 0))
         pygame.display.flip()
 
-        # Store original buffer
-        self._buffer = buffer.copy()
+        # Keep the shown frame as the next draw buffer
+        self._buffer = buffer
 
     def close(self) -> None:
         """Clean up Pygame resources."""
-        pygame.quit()
+        pygame.display.quit()
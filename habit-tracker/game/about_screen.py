@@ -1,12 +1,17 @@
 """About screen showing README content."""
 
-from PIL import Image, ImageDraw
-from typing import Optional
+from PIL import Image
+from typing import Dict, Optional
 from input.input_base import InputEvent, InputType
 from game.screens import ScreenBase
 from assets.sprite_loader import load_font
 from config import Config
+import json
 import os
+import re
+
+# Leading markdown header marks, e.g. "## "
+_HEADER_RE = re.compile(r'^#+\s*')
 
 
 class AboutScreen(ScreenBase):
@@ -22,24 +27,54 @@ class AboutScreen(ScreenBase):
     LINE_HEIGHT = 10
     VISIBLE_LINES = 10  # Number of lines visible on screen
 
+    # Static page: only redrawn after scrolling
+    redraw_every_frame = False
+
     def __init__(self):
         """Initialize about screen."""
+        super().__init__()
         # Load font
         self.font = load_font(Config.FONT_REGULAR, 8)
 
+        # Render colors, bound once instead of looked up on Config per call
+        self._c_bg = Config.COLOR_WHITE
+        self._c_title = Config.COLOR_BLUE_HIGHLIGHT
+        self._c_title_text = Config.COLOR_WHITE
+        self._c_text = Config.COLOR_TEXT_DARK
+
+        # Per-character advance widths, filled lazily while wrapping
+        self._char_widths: Dict[str, float] = {}
+        self._space_width = self.font.getlength(' ')
+
         # Load README content
         self.lines = self._load_readme()
         self.scroll_offset = 0
 
+        # Whether the buffer still holds this screen's static chrome
+        # (white page + title bar); other screens draw over it meanwhile
+        self._chrome_drawn = False
+
     def _load_readme(self) -> list[str]:
         """Load and wrap README.md content.
 
+        Wrapped lines are cached on disk keyed by the README's mtime and
+        size (plus the wrap settings), so unchanged READMEs skip wrapping.
+
         Returns:
             List of wrapped lines
         """
         readme_path = os.path.join(Config.BASE_DIR, "..", "README.md")
+        cache_path = os.path.join(Config.CACHE_PATH, "about_lines.json")
 
         try:
+            stat = os.stat(readme_path)
+            cache_key = [stat.st_mtime_ns, stat.st_size,
+                         Config.FONT_REGULAR, self.TEXT_WIDTH]
+
+            cached = self._read_lines_cache(cache_path, cache_key)
+            if cached is not None:
+                return cached
+
             with open(readme_path, 'r') as f:
                 content = f.read()
 
@@ -54,6 +89,7 @@ class AboutScreen(ScreenBase):
                 wrapped = self._wrap_line(paragraph)
                 lines.extend(wrapped)
 
+            self._write_lines_cache(cache_path, cache_key, lines)
             return lines
 
         except FileNotFoundError:
@@ -67,6 +103,43 @@ class AboutScreen(ScreenBase):
                 "README.md not found"
             ]
 
+    @staticmethod
+    def _read_lines_cache(cache_path: str, cache_key: list) -> Optional[list[str]]:
+        """Return cached wrapped lines if the cache matches cache_key.
+
+        Args:
+            cache_path: Path to the JSON cache file
+            cache_key: Expected key (README stat and wrap settings)
+
+        Returns:
+            Cached lines, or None if missing, stale or unreadable
+        """
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("key") != cache_key:
+            return None
+        return cached.get("lines")
+
+    @staticmethod
+    def _write_lines_cache(cache_path: str, cache_key: list, lines: list[str]) -> None:
+        """Write wrapped lines to the cache, ignoring filesystem errors.
+
+        Args:
+            cache_path: Path to the JSON cache file
+            cache_key: Key to store alongside the lines
+            lines: Wrapped lines
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump({"key": cache_key, "lines": lines}, f)
+        except OSError:
+            pass
+
     def _wrap_line(self, text: str) -> list[str]:
         """Wrap a line to fit within TEXT_WIDTH.
 
@@ -80,31 +153,52 @@ class AboutScreen(ScreenBase):
             return ['']
 
         # Remove markdown headers
-        if text.startswith('#'):
-            text = text.lstrip('#').strip()
+        text = _HEADER_RE.sub('', text, count=1)
 
-        words = text.split()
         lines = []
-        current_line = ""
+        current_words: list[str] = []
+        current_width = 0.0
 
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            # Measure actual pixel width
-            bbox = self.font.getbbox(test_line)
-            text_width = bbox[2] - bbox[0]
+        for word in text.split():
+            word_width = self._text_width(word)
+            if current_words:
+                test_width = current_width + self._space_width + word_width
+            else:
+                test_width = word_width
 
-            if text_width <= self.TEXT_WIDTH:
-                current_line = test_line
+            if test_width <= self.TEXT_WIDTH:
+                current_words.append(word)
+                current_width = test_width
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+                # Only materialize a line when it is flushed
+                if current_words:
+                    lines.append(" ".join(current_words))
+                current_words = [word]
+                current_width = word_width
 
-        if current_line:
-            lines.append(current_line)
+        if current_words:
+            lines.append(" ".join(current_words))
 
         return lines if lines else ['']
 
+    def _text_width(self, text: str) -> float:
+        """Measure text width by summing cached character advances.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Width in pixels
+        """
+        widths = self._char_widths
+        total = 0.0
+        for ch in text:
+            width = widths.get(ch)
+            if width is None:
+                width = widths[ch] = self.font.getlength(ch)
+            total += width
+        return total
+
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input for scrolling and navigation.
 
@@ -119,13 +213,19 @@ class AboutScreen(ScreenBase):
 
         max_scroll = max(0, len(self.lines) - self.VISIBLE_LINES)
 
+        previous_offset = self.scroll_offset
+
         if event.input_type == InputType.UP:
             self.scroll_offset = max(0, self.scroll_offset - 1)
         elif event.input_type == InputType.DOWN:
             self.scroll_offset = min(max_scroll, self.scroll_offset + 1)
         elif event.input_type == InputType.LEFT or event.input_type == InputType.BUTTON_B:
+            self._chrome_drawn = False  # Next screen draws over the buffer
             return "settings"  # Back to settings
 
+        if self.scroll_offset != previous_offset:
+            self.dirty = True
+
         return None
 
     def update(self, delta_time: float) -> None:
@@ -142,21 +242,32 @@ class AboutScreen(ScreenBase):
         Args:
             buffer: PIL Image to draw to
         """
-        # Clear background
-        buffer.paste((255, 255, 255), (0, 0, 128, 128))
-
-        draw = ImageDraw.Draw(buffer)
-
-        # Draw title bar
-        draw.rectangle([0, 0, 128, 15], fill=Config.COLOR_BLUE_HIGHLIGHT)
-        draw.text((5, 3), "ABOUT", fill=Config.COLOR_WHITE, font=self.font)
+        draw = self._get_draw(buffer)
+
+        if self._chrome_drawn:
+            # Title bar is still on the buffer; clear only the text area,
+            # which also covers the scroll indicator column
+            buffer.paste(self._c_bg, (
+                self.TEXT_X - 2, self.TEXT_Y - 2,
+                128, self.TEXT_Y + self.VISIBLE_LINES * self.LINE_HEIGHT + 2
+            ))
+        else:
+            # Clear background
+            buffer.paste(self._c_bg, (0, 0, 128, 128))
+
+            # Draw title bar
+            draw.rectangle([0, 0, 128, 15], fill=self._c_title)
+            draw.text((5, 3), "ABOUT", fill=self._c_title_text, font=self.font)
+            self._chrome_drawn = True
 
         # Draw scrollable text
         y_offset = self.TEXT_Y
         visible_lines = self.lines[self.scroll_offset:self.scroll_offset + self.VISIBLE_LINES]
 
+        text_color = self._c_text
+        font = self.font
         for line in visible_lines:
-            draw.text((self.TEXT_X, y_offset), line, fill=Config.COLOR_TEXT_DARK, font=self.font)
+            draw.text((self.TEXT_X, y_offset), line, fill=text_color, font=font)
             y_offset += self.LINE_HEIGHT
 
         # Draw scroll indicator if needed
@@ -164,4 +275,4 @@ class AboutScreen(ScreenBase):
             total_lines = len(self.lines)
             scroll_pct = self.scroll_offset / max(1, total_lines - self.VISIBLE_LINES)
             indicator_y = 20 + int(scroll_pct * 88)  # 88 = 108 - 20 (usable height)
-            draw.rectangle([125, indicator_y, 127, indicator_y + 10], fill=Config.COLOR_BLUE_HIGHLIGHT)
+            draw.rectangle([125, indicator_y, 127, indicator_y + 10], fill=self._c_title)
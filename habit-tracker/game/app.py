@@ -1,16 +1,29 @@
 """Main application class and game loop."""
 
 import time
-from typing import Dict
+from typing import Callable, Dict
 from PIL import ImageDraw, ImageFont
 from display.display_base import DisplayBase
 from input.input_base import InputBase, InputType
 from game.screens import ScreenBase
+from game.view_habits_screen import ViewHabitsScreen
+from game.edit_habit_screen import EditHabitScreen
+from game.habit_checker_screen import HabitCheckerScreen
+
+# pygame is only installed for desktop development; the Pi build paces
+# frames with time.sleep instead
+try:
+    import pygame
+except ImportError:
+    pygame = None
 
 
 class App:
     """Main application with game loop."""
 
+    # Longest time to block waiting for input while a static screen is clean
+    IDLE_WAIT_TIMEOUT = 1.0
+
     def __init__(
         self,
         display: DisplayBase,
@@ -37,6 +50,17 @@ class App:
         self._frame_time = 1.0 / target_fps
         self.running = False
 
+        # Hooks run when switching to a screen, keyed by screen name
+        self._transition_hooks: Dict[str, Callable[[ScreenBase], None]] = {
+            "edit_habit": self._load_selected_habit,
+            "view_habits": self._reload_habit_list,
+            "habit_checker": self._reload_habit_list,
+        }
+
+        # Frame pacing: SDL's high-resolution wait when pygame is available
+        self._clock = pygame.time.Clock() if pygame is not None else None
+        self._last_tick = 0.0
+
         # FPS tracking
         self._fps_counter = 0
         self._fps_timer = 0.0
@@ -45,14 +69,22 @@ class App:
     def run(self) -> None:
         """Start the main game loop."""
         self.running = True
-        last_time = time.time()
+        self._last_tick = time.perf_counter()
+        if self._clock is not None:
+            self._clock.tick()  # Reset so the first frame's delta is ~0
 
         print(f"Starting game loop at {self.target_fps} FPS...")
         print("Controls: WASD (joystick), P (Button A), L (Button B), M (Button C)")
 
         while self.running:
-            current_time = time.time()
-            delta_time = current_time - last_time
+            # Static screens with nothing to redraw sleep until input
+            # arrives instead of spinning through empty frames
+            screen = self.current_screen
+            if not (screen.dirty or screen.has_animations()):
+                self.input_handler.wait(self.IDLE_WAIT_TIMEOUT)
+
+            # Wait out the previous frame and measure its length
+            delta_time = self._tick()
 
             # Process input
             self._handle_input()
@@ -66,17 +98,33 @@ class App:
             # FPS tracking
             self._update_fps(delta_time)
 
-            # Frame rate limiting
-            elapsed = time.time() - current_time
-            sleep_time = self._frame_time - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-
-            last_time = current_time
-
         self.display.close()
         print("Game loop stopped.")
 
+    def close_screens(self) -> None:
+        """Let every screen flush pending state before shutdown."""
+        for screen in self.screens.values():
+            screen.close()
+
+    def _tick(self) -> float:
+        """Limit the frame rate to target_fps.
+
+        Returns:
+            Time since the previous tick in seconds
+        """
+        if self._clock is not None:
+            return self._clock.tick(self.target_fps) / 1000.0
+
+        now = time.perf_counter()
+        sleep_time = self._frame_time - (now - self._last_tick)
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+            now = time.perf_counter()
+
+        delta_time = now - self._last_tick
+        self._last_tick = now
+        return delta_time
+
     def _handle_input(self) -> None:
         """Process input events."""
         event = self.input_handler.poll()
@@ -89,35 +137,36 @@ class App:
             self.running = False
             return
 
+        # Screens only act on presses; drop releases before dispatch
+        if not event.pressed:
+            return
+
         # Delegate to current screen
         next_screen = self.current_screen.handle_input(event)
 
         # Handle screen transitions
         if next_screen and next_screen in self.screens:
-            # Special handling for edit_habit screen - load selected habit data
-            if next_screen == "edit_habit":
-                from game.view_habits_screen import ViewHabitsScreen
-                from game.edit_habit_screen import EditHabitScreen
-                edit_screen = self.screens[next_screen]
-                if isinstance(edit_screen, EditHabitScreen):
-                    edit_screen.load_habit_data(ViewHabitsScreen.selected_habit_data)
-            # Special handling for view_habits screen - reload habit list
-            elif next_screen == "view_habits":
-                from game.view_habits_screen import ViewHabitsScreen
-                view_screen = self.screens[next_screen]
-                if isinstance(view_screen, ViewHabitsScreen):
-                    view_screen.reload_habits()
-            # Special handling for habit_checker screen - reload habit list
-            elif next_screen == "habit_checker":
-                from game.habit_checker_screen import HabitCheckerScreen
-                checker_screen = self.screens[next_screen]
-                if isinstance(checker_screen, HabitCheckerScreen):
-                    checker_screen.reload_habits()
+            hook = self._transition_hooks.get(next_screen)
+            if hook is not None:
+                hook(self.screens[next_screen])
 
             self.current_screen_name = next_screen
             self.current_screen = self.screens[next_screen]
+            self.current_screen.dirty = True  # Always draw a newly shown screen
             print(f"Switched to screen: {next_screen}")
 
+    @staticmethod
+    def _load_selected_habit(screen: ScreenBase) -> None:
+        """Load the habit picked in the habit list into the edit screen."""
+        if isinstance(screen, EditHabitScreen):
+            screen.load_habit_data(ViewHabitsScreen.selected_habit_data)
+
+    @staticmethod
+    def _reload_habit_list(screen: ScreenBase) -> None:
+        """Refresh a habit list screen from the database."""
+        if isinstance(screen, (ViewHabitsScreen, HabitCheckerScreen)):
+            screen.reload_habits()
+
     def _update(self, delta_time: float) -> None:
         """Update game state.
 
@@ -128,15 +177,24 @@ class App:
         self.current_screen.update(delta_time)
 
     def _render(self) -> None:
-        """Render the current frame."""
+        """Render the current frame.
+
+        Static screens that are not dirty keep the frame already on the
+        display, skipping both the redraw and the display update.
+        """
+        screen = self.current_screen
+        if not (screen.redraw_every_frame or screen.dirty):
+            return
+
         # Get drawing buffer
         buffer = self.display.get_buffer()
 
         # Delegate to current screen
-        self.current_screen.render(buffer)
+        screen.render(buffer)
 
         # Update display
         self.display.update(buffer)
+        screen.dirty = False
 
     def _update_fps(self, delta_time: float) -> None:
         """Update FPS counter.
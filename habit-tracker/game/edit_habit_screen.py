@@ -1,11 +1,14 @@
 """Edit habit screen with multi-field form for creating/editing habits."""
 
+import math
 from PIL import Image, ImageDraw
-from typing import Optional
+from typing import List, Optional
 from input.input_base import InputEvent, InputType
 from game.screens import ScreenBase
 from game.text_input import TextInputWidget
-from assets.sprite_loader import SpriteSheet, render_text
+from assets.sprite_loader import (
+    SpriteSheet, render_text, render_text_sprite, paste_text_sprite, load_image, load_flat_image
+)
 from assets import icons
 from config import Config
 from data.db import Database
@@ -34,9 +37,42 @@ class EditHabitScreen(ScreenBase):
     LABEL_X = 13  # Labels start at x=13
     VALUE_X = 73  # Right column starts at x=73
 
+    # Field navigation: index of the next/previous field (-1 = buttons)
+    NEXT_FIELD = (1, 2, 3, 4, 5, -1)
+    PREV_FIELD = (5, 0, 1, 2, 3, 4)
+
     # Frequency period options
     FREQ_PERIODS = ["day", "week"]
 
+    # Inputs that adjust values or move between the save/cancel buttons
+    _HORIZONTAL = frozenset((InputType.LEFT, InputType.RIGHT))
+
+    # Only redrawn when dirty (input, name scroll step, cursor blink)
+    redraw_every_frame = False
+
+    # Per-instance state read on every input/update/render. dirty and
+    # _draw are ScreenBase slots, so instances carry no __dict__.
+    __slots__ = (
+        # Assets and layout
+        'icons_sheet', '_checkbox_on', '_checkbox_off', 'background', 'font',
+        'input_popup', 'input_popup_crop', 'input_popup_offset',
+        'save_cancel_normal', 'save_highlighted', 'cancel_highlighted',
+        'save_highlighted_crop', 'save_highlighted_pos',
+        'cancel_highlighted_crop', 'cancel_highlighted_pos',
+        # Render caches
+        '_label_cache', '_base_frame', '_digit_width', '_glyph_cache',
+        '_freq_display_key', '_freq_display_cache',
+        '_extended_name_source', '_extended_name_cache',
+        '_marquee_name', '_marquee_frames', '_field_renderers',
+        # Habit being edited
+        'db', 'habit_id', 'name', 'freq_number', 'freq_period', 'points',
+        'is_good', 'active', 'reminder',
+        # Editing state
+        'text_input', 'selected_field', 'editing_name', 'editing_freq',
+        'freq_edit_stage', 'editing_points', 'selected_button',
+        'scroll_offset', 'scroll_timer', 'scroll_delay',
+    )
+
     def __init__(self, db: Database, habit_data: Optional[dict] = None):
         """Initialize edit habit screen.
 
@@ -44,29 +80,65 @@ class EditHabitScreen(ScreenBase):
             db: Database instance for saving habits
             habit_data: Dict with habit fields (None for new habit, must include 'id' for edit)
         """
-        self.icons_sheet = SpriteSheet(Config.ICONS_SPRITE_SHEET, 16, 16)
+        super().__init__()
+        self.icons_sheet = SpriteSheet.get(Config.ICONS_SPRITE_SHEET, 16, 16)
+        self._checkbox_on = self.icons_sheet.get_sprite(*icons.CHECKED_BOX_SMALL)
+        self._checkbox_off = self.icons_sheet.get_sprite(*icons.UNCHECKED_BOX_SMALL)
 
-        # Load background - convert RGBA to RGB to avoid transparency
-        bg_rgba = Image.open(Config.EDIT_HABIT_BG).convert("RGBA")
-        self.background = Image.new("RGB", bg_rgba.size, (255, 255, 255))
-        self.background.paste(bg_rgba, (0, 0), bg_rgba)
+        # Load background - composited onto white as RGB to avoid transparency
+        self.background = load_flat_image(Config.EDIT_HABIT_BG)
 
         # Store database and habit_id
         self.db = db
         self.habit_id = habit_data.get('id') if habit_data else None
 
         # Load input popup (shown when editing name)
-        self.input_popup = Image.open(Config.INPUT_TEXT_POPUP).convert("RGBA")
+        self.input_popup = load_image(Config.INPUT_TEXT_POPUP)
+        self.input_popup_crop, self.input_popup_offset = self._crop_to_content(self.input_popup)
 
         # Load button sprites
-        self.save_cancel_normal = Image.open(Config.SAVE_CANCEL_NORMAL).convert("RGBA")
-        self.save_highlighted = Image.open(Config.SAVE_BUTTON_HIGHLIGHTED).convert("RGBA")
-        self.cancel_highlighted = Image.open(Config.CANCEL_BUTTON_HIGHLIGHTED).convert("RGBA")
+        self.save_cancel_normal = load_image(Config.SAVE_CANCEL_NORMAL)
+        self.save_highlighted = load_image(Config.SAVE_BUTTON_HIGHLIGHTED)
+        self.cancel_highlighted = load_image(Config.CANCEL_BUTTON_HIGHLIGHTED)
+
+        # Highlight overlays are full-screen images with one small opaque
+        # region; keep just that region and where it goes
+        self.save_highlighted_crop, self.save_highlighted_pos = self._crop_to_content(self.save_highlighted)
+        self.cancel_highlighted_crop, self.cancel_highlighted_pos = self._crop_to_content(self.cancel_highlighted)
 
         # Load font for crisp text rendering
         from assets.sprite_loader import load_font
         self.font = load_font(Config.FONT_REGULAR, 8)
 
+        # Field labels never change: rasterize each in both colors once
+        self._label_cache = {
+            (field_name, color): render_text_sprite(field_name + ":", Config.FONT_REGULAR, 8, color)
+            for field_name in self.FIELD_NAMES
+            for color in (Config.COLOR_TEXT_DARK, Config.COLOR_BLUE_HIGHLIGHT)
+        }
+
+        # Static base frame: background, unhighlighted buttons and dark
+        # labels, so each frame starts with a single paste
+        self._base_frame = self.background.copy()
+        self._base_frame.paste(self.save_cancel_normal, (0, 0), self.save_cancel_normal)
+        for i, field_name in enumerate(self.FIELD_NAMES):
+            y = self.FIELD_START_Y + (i * self.LINE_HEIGHT)
+            paste_text_sprite(self._base_frame, self._label_cache[(field_name, Config.COLOR_TEXT_DARK)],
+                              self.LABEL_X, y)
+
+        # Pixel widths of the freq numbers, used to place the period after them
+        self._digit_width = {str(n): self._text_width(str(n)) for n in range(1, 7)}
+
+        # Values drawn from small fixed sets (type, freq period, 1-20 for
+        # points and freq number), also in both colors
+        value_texts = ["Good", "Bad"] + [f"/{period}" for period in self.FREQ_PERIODS]
+        value_texts += [str(n) for n in range(1, 21)]
+        self._glyph_cache = {
+            (text, color): render_text_sprite(text, Config.FONT_REGULAR, 8, color)
+            for text in value_texts
+            for color in (Config.COLOR_TEXT_DARK, Config.COLOR_BLUE_HIGHLIGHT)
+        }
+
         # Text input widget for name editing
         self.text_input = TextInputWidget(max_length=20)
 
@@ -106,6 +178,38 @@ class EditHabitScreen(ScreenBase):
         self.scroll_timer = 0.0
         self.scroll_delay = 0.15  # Seconds between scroll steps
 
+        # Formatted display strings, keyed by the state they were built from
+        self._freq_display_key: Optional[tuple] = None
+        self._freq_display_cache = ""
+        self._extended_name_source: Optional[str] = None
+        self._extended_name_cache = ""
+
+        # Pre-rendered marquee windows for the scrolling name, one per
+        # scroll_offset; rebuilt when the name changes
+        self._marquee_name: Optional[str] = None
+        self._marquee_frames: List[Image.Image] = []
+
+        # Value renderer per field, in FIELD_NAMES order
+        self._field_renderers = (
+            self._render_name, self._render_freq, self._render_points,
+            self._render_type, self._render_active, self._render_reminder,
+        )
+
+    @staticmethod
+    def _crop_to_content(image: Image.Image) -> tuple:
+        """Crop an RGBA overlay to its non-transparent bounding box.
+
+        Args:
+            image: RGBA overlay image
+
+        Returns:
+            (cropped image, (x, y) paste position)
+        """
+        bbox = image.getbbox()
+        if bbox is None:
+            return image, (0, 0)
+        return image.crop(bbox), (bbox[0], bbox[1])
+
     def load_habit_data(self, habit_data: Optional[dict] = None):
         """Load habit data for editing (called when navigating to this screen).
 
@@ -140,6 +244,7 @@ class EditHabitScreen(ScreenBase):
         self.editing_points = False
         self.selected_button = None
         self.text_input.value = self.name
+        self.dirty = True
 
     def save_habit(self) -> None:
         """Save habit to database (create new or update existing)."""
@@ -155,26 +260,16 @@ class EditHabitScreen(ScreenBase):
         else:
             habit_type = "binary"
 
-        if self.habit_id is None:
-            # Create new habit
-            self.habit_id = self.db.add_habit(
-                name=self.name,
-                habit_type=habit_type,
-                points_per=self.points,
-                category=category,
-                recurrence=recurrence
-            )
-        else:
-            # Update existing habit
-            self.db.update_habit(
-                habit_id=self.habit_id,
-                name=self.name,
-                habit_type=habit_type,
-                points_per=self.points,
-                category=category,
-                recurrence=recurrence,
-                active=self.active
-            )
+        # One upsert covers both the create and update paths
+        self.habit_id = self.db.save_habit(
+            habit_id=self.habit_id,
+            name=self.name,
+            habit_type=habit_type,
+            points_per=self.points,
+            category=category,
+            recurrence=recurrence,
+            active=self.active
+        )
 
     def _get_display_name(self) -> str:
         """Get display name with scrolling when selected, truncated when not.
@@ -186,22 +281,103 @@ class EditHabitScreen(ScreenBase):
             return self.name
 
         # If Name field is selected (not editing), show scrolling text
-        if self.selected_field == 0 and not self.editing_name:
+        if self._is_name_scrolling():
             # Show 6 characters starting from scroll_offset
             # Wrap around with padding for smooth loop
-            extended_name = self.name + "   " + self.name  # Add spacing and repeat
+            extended_name = self._get_extended_name()
             return extended_name[self.scroll_offset:self.scroll_offset + 6]
         else:
             # Not selected - show first 5 chars + "..."
             return self.name[:5] + "..."
 
+    def _is_name_scrolling(self) -> bool:
+        """Whether the Name value is shown as a scrolling marquee."""
+        return self.selected_field == 0 and not self.editing_name and len(self.name) > 6
+
+    def _get_marquee_frame(self) -> Image.Image:
+        """Get the marquee window for the current scroll_offset.
+
+        Returns:
+            RGBA image showing the same 6 characters _get_display_name returns
+        """
+        if self._marquee_name != self.name:
+            self._marquee_frames = self._build_marquee_frames(self.name)
+            self._marquee_name = self.name
+        return self._marquee_frames[self.scroll_offset % len(self._marquee_frames)]
+
+    def _build_marquee_frames(self, name: str) -> List[Image.Image]:
+        """Render the looping name once and cut a window per scroll step.
+
+        Args:
+            name: Habit name (longer than 6 characters)
+
+        Returns:
+            One RGBA window per scroll offset (len(name) + 1 of them)
+        """
+        extended_name = name + "   " + name
+        height = max(1, self.font.getbbox(extended_name, mode='1')[3])
+        strip = Image.new('RGBA', (math.ceil(self.font.getlength(extended_name)), height), color=None)
+        draw = ImageDraw.Draw(strip)
+        draw.fontmode = '1'
+        draw.text((0, 0), extended_name, fill=Config.COLOR_TEXT_DARK, font=self.font)
+
+        frames = []
+        for offset in range(len(name) + 1):
+            x0 = int(self.font.getlength(extended_name[:offset]))
+            x1 = int(self.font.getlength(extended_name[:offset + 6]))
+            frames.append(strip.crop((x0, 0, x1, height)))
+        return frames
+
+    def _get_extended_name(self) -> str:
+        """Get the looping marquee text, rebuilt only when the name changes.
+
+        Returns:
+            The name, three spaces, and the name again
+        """
+        if self._extended_name_source != self.name:
+            self._extended_name_cache = self.name + "   " + self.name  # Add spacing and repeat
+            self._extended_name_source = self.name
+        return self._extended_name_cache
+
     def _get_freq_display(self) -> str:
         """Get frequency display string.
 
         Returns:
             String like "1/day" or "3/week"
         """
-        return f"{self.freq_number}/{self.freq_period}"
+        key = (self.freq_number, self.freq_period)
+        if self._freq_display_key != key:
+            self._freq_display_cache = f"{self.freq_number}/{self.freq_period}"
+            self._freq_display_key = key
+        return self._freq_display_cache
+
+    def _text_width(self, text: str) -> int:
+        """Measure text ink width the way draw.textbbox does with fontmode '1'.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Width in pixels
+        """
+        bbox = self.font.getbbox(text, mode='1')
+        return bbox[2] - bbox[0]
+
+    def _paste_value(self, buffer: Image.Image, text: str, x: int, y: int, color: tuple) -> None:
+        """Paste a value from the glyph cache as draw.text would draw it.
+
+        Args:
+            buffer: PIL Image to draw to
+            text: Value text
+            x: Text X position
+            y: Text Y position
+            color: Text color
+        """
+        sprite = self._glyph_cache.get((text, color))
+        if sprite is None:
+            # Outside the precomputed set (names, points > 20 from the db)
+            sprite = render_text_sprite(text, Config.FONT_REGULAR, 8, color)
+        paste_text_sprite(buffer, sprite, x, y)
 
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input events.
@@ -215,6 +391,9 @@ class EditHabitScreen(ScreenBase):
         if not event.pressed:
             return None
 
+        # Any press may change what is shown
+        self.dirty = True
+
         # If editing name, delegate to text input widget
         if self.editing_name:
             result = self.text_input.handle_input(event)
@@ -234,7 +413,7 @@ class EditHabitScreen(ScreenBase):
             return None
 
         # LEFT/RIGHT: Adjust values when editing, navigate buttons, or go back
-        if event.input_type in [InputType.LEFT, InputType.RIGHT]:
+        if event.input_type in self._HORIZONTAL:
             # If on buttons, navigate between save/cancel
             if self.selected_button is not None:
                 if event.input_type == InputType.LEFT:
@@ -264,16 +443,15 @@ class EditHabitScreen(ScreenBase):
                     self.selected_button = None
                     self.selected_field = len(self.FIELD_NAMES) - 1  # Select last field
                 else:
-                    self.selected_field = (self.selected_field - 1) % len(self.FIELD_NAMES)
+                    self.selected_field = self.PREV_FIELD[self.selected_field]
 
         elif event.input_type == InputType.DOWN:
             if not (self.editing_freq or self.editing_points or self.editing_name):
-                if self.selected_field == len(self.FIELD_NAMES) - 1:
-                    # At last field, move down to buttons
-                    self.selected_button = "save"  # Default to save button
-                    self.selected_field = -1  # Deselect fields
-                elif self.selected_button is None:
-                    self.selected_field = (self.selected_field + 1) % len(self.FIELD_NAMES)
+                if self.selected_button is None:
+                    self.selected_field = self.NEXT_FIELD[self.selected_field]
+                    if self.selected_field == -1:
+                        # Moved past the last field onto the buttons
+                        self.selected_button = "save"  # Default to save button
 
         # BUTTON_A: Edit field / toggle checkbox / trigger button action
         elif event.input_type == InputType.BUTTON_A:
@@ -333,141 +511,170 @@ class EditHabitScreen(ScreenBase):
         """
         # Update text input widget if active
         if self.editing_name:
+            show_cursor = self.text_input.show_cursor
             self.text_input.update(delta_time)
+            if self.text_input.show_cursor != show_cursor:
+                self.dirty = True
 
         # Scroll long name text when Name field is selected (not editing)
-        if self.selected_field == 0 and not self.editing_name and len(self.name) > 6:
+        if self._is_name_scrolling():
             self.scroll_timer += delta_time
             if self.scroll_timer >= self.scroll_delay:
                 self.scroll_timer = 0.0
-                self.scroll_offset = (self.scroll_offset + 1) % (len(self.name) + 1)
+                # Wrap after len(name) steps (the marquee has len + 1 windows)
+                self.scroll_offset += 1
+                if self.scroll_offset > len(self.name):
+                    self.scroll_offset = 0
+                self.dirty = True
         else:
             # Reset scroll when not on Name field
+            if self.scroll_offset != 0:
+                self.dirty = True
             self.scroll_offset = 0
             self.scroll_timer = 0.0
 
-    def render(self, buffer: Image.Image) -> None:
-        """Render edit habit screen.
+    def has_animations(self) -> bool:
+        """Whether the name marquee or the text cursor is running.
+
+        Returns:
+            True while update() can change the screen without input
+        """
+        return self.editing_name or self._is_name_scrolling()
+
+    def _render_name(self, buffer: Image.Image, y: int) -> None:
+        """Render the Name value.
 
         Args:
             buffer: PIL Image to draw to
+            y: Field row Y position
         """
-        # Draw background (RGB, no transparency)
-        buffer.paste(self.background, (0, 0))
+        if self._is_name_scrolling():
+            # Scrolling name - paste the pre-rendered marquee window
+            frame = self._get_marquee_frame()
+            buffer.paste(frame, (self.VALUE_X, y), frame)
+        else:
+            # Free-form, but it only changes on edits, so the shared text
+            # sprite cache serves repeat frames
+            color = Config.COLOR_BLUE_HIGHLIGHT if self.editing_name else Config.COLOR_TEXT_DARK
+            self._paste_value(buffer, self._get_display_name(), self.VALUE_X, y, color)
 
-        # Draw directly on buffer for crisp text
-        draw = ImageDraw.Draw(buffer)
-        draw.fontmode = '1'  # Disable anti-aliasing for pixel-perfect text
+    def _render_freq(self, buffer: Image.Image, y: int) -> None:
+        """Render the Freq value, always split so positioning stays consistent.
 
-        # Render each field
-        for i, field_name in enumerate(self.FIELD_NAMES):
-            y = self.FIELD_START_Y + (i * self.LINE_HEIGHT)
-            is_selected = (i == self.selected_field)
-
-            # Determine field value and editing state
-            if i == 0:  # Name
-                value = self._get_display_name()
-                is_editing = self.editing_name
-            elif i == 1:  # Freq
-                value = self._get_freq_display()
-                is_editing = self.editing_freq
-            elif i == 2:  # Points
-                value = str(self.points)
-                is_editing = self.editing_points
-            elif i == 3:  # Type (Good/Bad)
-                value = "Good" if self.is_good else "Bad"
-                is_editing = False
-            elif i == 4:  # Active
-                value = None  # Checkbox
-                is_editing = False
-            else:  # Reminder
-                value = None  # Checkbox
-                is_editing = False
-
-            # Render label directly
-            # When editing freq/points, label should be black (focus moves to value)
-            if i in [1, 2] and is_editing:
-                label_color = Config.COLOR_TEXT_DARK
+        Args:
+            buffer: PIL Image to draw to
+            y: Field row Y position
+        """
+        # Split "3/day" into "3" and "/day"
+        freq_num_str = str(self.freq_number)
+        freq_period_str = f"/{self.freq_period}"
+
+        # Highlight whichever part is being edited
+        num_color = period_color = Config.COLOR_TEXT_DARK
+        if self.editing_freq:
+            if self.freq_edit_stage == 0:
+                num_color = Config.COLOR_BLUE_HIGHLIGHT
             else:
-                label_color = Config.COLOR_BLUE_HIGHLIGHT if is_selected else Config.COLOR_TEXT_DARK
-            draw.text((self.LABEL_X, y), field_name + ":", fill=label_color, font=self.font)
-
-            # Render value or checkbox
-            if value is not None:
-                # Special handling for Freq field - always split to keep positioning consistent
-                if i == 1:
-                    # Split "3/day" into "3" and "/day"
-                    freq_num_str = str(self.freq_number)
-                    freq_period_str = f"/{self.freq_period}"
-
-                    # Color based on editing state
-                    if self.editing_freq:
-                        if self.freq_edit_stage == 0:
-                            # Editing number - highlight number only
-                            num_color = Config.COLOR_BLUE_HIGHLIGHT
-                            period_color = Config.COLOR_TEXT_DARK
-                        else:
-                            # Editing period - highlight period only
-                            num_color = Config.COLOR_TEXT_DARK
-                            period_color = Config.COLOR_BLUE_HIGHLIGHT
-                    else:
-                        # Not editing - both same color
-                        num_color = Config.COLOR_TEXT_DARK
-                        period_color = Config.COLOR_TEXT_DARK
+                period_color = Config.COLOR_BLUE_HIGHLIGHT
 
-                    # Draw number
-                    draw.text((self.VALUE_X, y), freq_num_str, fill=num_color, font=self.font)
+        self._paste_value(buffer, freq_num_str, self.VALUE_X, y, num_color)
 
-                    # Calculate x offset for period (after number) using font metrics
-                    bbox = draw.textbbox((0, 0), freq_num_str, font=self.font)
-                    num_width = bbox[2] - bbox[0]
-                    period_x = self.VALUE_X + num_width
+        # Period goes right after the number, measured with font metrics
+        num_width = self._digit_width.get(freq_num_str)
+        if num_width is None:
+            num_width = self._text_width(freq_num_str)
+        self._paste_value(buffer, freq_period_str, self.VALUE_X + num_width, y, period_color)
 
-                    # Draw period
-                    draw.text((period_x, y), freq_period_str, fill=period_color, font=self.font)
+    def _render_points(self, buffer: Image.Image, y: int) -> None:
+        """Render the Points value.
 
-                # Special handling for Type field - show text only (no checkbox)
-                elif i == 3:
-                    # Draw "Good" or "Bad" text
-                    value_color = Config.COLOR_TEXT_DARK
-                    draw.text((self.VALUE_X, y), value, fill=value_color, font=self.font)
+        Args:
+            buffer: PIL Image to draw to
+            y: Field row Y position
+        """
+        color = Config.COLOR_BLUE_HIGHLIGHT if self.editing_points else Config.COLOR_TEXT_DARK
+        self._paste_value(buffer, str(self.points), self.VALUE_X, y, color)
 
-                else:
-                    # Text value - draw directly
-                    value_color = Config.COLOR_BLUE_HIGHLIGHT if is_editing else Config.COLOR_TEXT_DARK
-                    draw.text((self.VALUE_X, y), value, fill=value_color, font=self.font)
-            else:
-                # Checkbox (for Active and Reminder fields)
-                if i == 4:  # Active
-                    checked = self.active
-                else:  # Reminder
-                    checked = self.reminder
-
-                if checked:
-                    checkbox = self.icons_sheet.get_sprite(*icons.CHECKED_BOX_SMALL)
-                else:
-                    checkbox = self.icons_sheet.get_sprite(*icons.UNCHECKED_BOX_SMALL)
+    def _render_type(self, buffer: Image.Image, y: int) -> None:
+        """Render the Type value as "Good" or "Bad" text (no checkbox).
 
-                # Center checkbox vertically with text (checkbox is 8px, move up 6px)
-                # Moved 7 pixels right for better spacing with 8pt text
-                buffer.paste(checkbox, (self.VALUE_X + 7, y - 6), checkbox)
+        Args:
+            buffer: PIL Image to draw to
+            y: Field row Y position
+        """
+        self._paste_value(buffer, "Good" if self.is_good else "Bad", self.VALUE_X, y, Config.COLOR_TEXT_DARK)
+
+    def _render_active(self, buffer: Image.Image, y: int) -> None:
+        """Render the Active checkbox.
+
+        Args:
+            buffer: PIL Image to draw to
+            y: Field row Y position
+        """
+        self._paste_checkbox(buffer, y, self.active)
+
+    def _render_reminder(self, buffer: Image.Image, y: int) -> None:
+        """Render the Reminder checkbox.
+
+        Args:
+            buffer: PIL Image to draw to
+            y: Field row Y position
+        """
+        self._paste_checkbox(buffer, y, self.reminder)
+
+    def _paste_checkbox(self, buffer: Image.Image, y: int, checked: bool) -> None:
+        """Paste a checkbox in the value column.
+
+        Args:
+            buffer: PIL Image to draw to
+            y: Field row Y position
+            checked: Whether to show the checked box
+        """
+        checkbox = self._checkbox_on if checked else self._checkbox_off
+
+        # Center checkbox vertically with text (checkbox is 8px, move up 6px)
+        # Moved 7 pixels right for better spacing with 8pt text
+        buffer.paste(checkbox, (self.VALUE_X + 7, y - 6), checkbox)
+
+    def render(self, buffer: Image.Image) -> None:
+        """Render edit habit screen.
+
+        Args:
+            buffer: PIL Image to draw to
+        """
+        start_y = self.FIELD_START_Y
+        line_height = self.LINE_HEIGHT
+
+        # Draw background, buttons and dark labels (RGB, no transparency)
+        buffer.paste(self._base_frame, (0, 0))
+
+        # Dark labels are in the base frame; overlay the highlighted one.
+        # When editing freq/points, label stays dark (focus moves to value)
+        selected = self.selected_field
+        if selected >= 0 and not ((selected == 1 and self.editing_freq) or
+                                  (selected == 2 and self.editing_points)):
+            label = self._label_cache[(self.FIELD_NAMES[selected], Config.COLOR_BLUE_HIGHLIGHT)]
+            paste_text_sprite(buffer, label, self.LABEL_X, start_y + selected * line_height)
+
+        # Render each field's value
+        for i, render_field in enumerate(self._field_renderers):
+            render_field(buffer, start_y + i * line_height)
 
         # Render input popup at bottom if editing name
         if self.editing_name:
             # Paste popup background at bottom of screen
             popup_y = 128 - self.input_popup.height
-            buffer.paste(self.input_popup, (0, popup_y), self.input_popup)
+            popup_pos = (self.input_popup_offset[0], popup_y + self.input_popup_offset[1])
+            buffer.paste(self.input_popup_crop, popup_pos, self.input_popup_crop)
 
             # Render text input widget on top of popup
             # Position it centered in the popup area
             self.text_input.render(buffer, x=10, y=popup_y + 8)
 
-        # Render save/cancel buttons at bottom (always visible)
-        # Base layer - both buttons not highlighted
-        buffer.paste(self.save_cancel_normal, (0, 0), self.save_cancel_normal)
-
+        # Save/cancel buttons (unhighlighted) are part of the base frame;
+        # they don't overlap the fields or the name popup
         # Overlay highlighted button if one is selected
         if self.selected_button == "save":
-            buffer.paste(self.save_highlighted, (0, 0), self.save_highlighted)
+            buffer.paste(self.save_highlighted_crop, self.save_highlighted_pos, self.save_highlighted_crop)
         elif self.selected_button == "cancel":
-            buffer.paste(self.cancel_highlighted, (0, 0), self.cancel_highlighted)
+            buffer.paste(self.cancel_highlighted_crop, self.cancel_highlighted_pos, self.cancel_highlighted_crop)
@@ -7,16 +7,21 @@ Two navigation modes:
 - Checkbox mode: LEFT/RIGHT to select day, BUTTON_A to toggle, BUTTON_B to exit
 """
 
-from datetime import datetime, timedelta
-from PIL import Image, ImageDraw
+import logging
+from datetime import date, timedelta
+from PIL import Image
 from game.screens import ScreenBase
-from assets.sprite_loader import render_text, SpriteSheet
+from assets.sprite_loader import (
+    render_text, render_text_sprite, paste_text_sprite, SpriteSheet, load_flat_image
+)
 from input.input_base import InputEvent, InputType
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from assets import icons
 from config import Config
 from data.db import Database
 
+logger = logging.getLogger(__name__)
+
 
 class HabitCheckerScreen(ScreenBase):
     """
@@ -39,7 +44,21 @@ class HabitCheckerScreen(ScreenBase):
     NAME_X = 9  # Moved right 2px (was 7)
     CHECKBOX_START_X = 74  # Moved right 2px (was 72)
     CHECKBOX_SPACING = 14
+    # X of each day column (2 days ago, yesterday, today)
+    CHECKBOX_XS = (
+        CHECKBOX_START_X,
+        CHECKBOX_START_X + CHECKBOX_SPACING,
+        CHECKBOX_START_X + 2 * CHECKBOX_SPACING,
+    )
     MAX_NAME_LENGTH = 8  # Truncate long habit names
+    FLUSH_DELAY = 2.0  # Seconds without toggles before queued writes are saved
+
+    # Header letter per date.weekday() (Monday = 0); Thursday and Sunday
+    # get two letters to tell them apart from Tuesday and Saturday
+    DAY_LETTERS = ("M", "T", "W", "Th", "F", "S", "Su")
+
+    # Only redrawn when dirty (input, name scroll step, reload)
+    redraw_every_frame = False
 
     def __init__(self, db: Database):
         """Initialize HabitCheckerScreen.
@@ -47,16 +66,19 @@ class HabitCheckerScreen(ScreenBase):
         Args:
             db: Database instance for loading/saving habit logs
         """
+        super().__init__()
         # Load background sprite - convert RGBA to RGB with white base
-        bg_rgba = Image.open(Config.HABIT_CHECKER_BG).convert('RGBA')
-        self.background = Image.new("RGB", bg_rgba.size, (255, 255, 255))
-        self.background.paste(bg_rgba, (0, 0), bg_rgba)
+        self.background = load_flat_image(Config.HABIT_CHECKER_BG)
 
         # Load icons sprite sheet
-        self.icons_sheet = SpriteSheet(Config.ICONS_SPRITE_SHEET)
+        self.icons_sheet = SpriteSheet.get(Config.ICONS_SPRITE_SHEET)
+
+        # Plain checkbox sprites, resolved once instead of per cell per frame
+        self.checked_box = self.icons_sheet.get_sprite(*icons.CHECKED_BOX_SMALL)
+        self.unchecked_box = self.icons_sheet.get_sprite(*icons.UNCHECKED_BOX_SMALL)
 
         # Load highlighted checkbox sprites (16x16 tiles)
-        self.highlight_sheet = SpriteSheet(Config.HIGHLIGHTED_CHECKBOXES, 16, 16)
+        self.highlight_sheet = SpriteSheet.get(Config.HIGHLIGHTED_CHECKBOXES, 16, 16)
         self.checked_highlight = self.highlight_sheet.get_sprite(0, 0)  # Top tile
         self.unchecked_highlight = self.highlight_sheet.get_sprite(0, 1)  # Bottom tile
 
@@ -86,18 +108,46 @@ class HabitCheckerScreen(ScreenBase):
 
         # Store database and load habits
         self.db = db
+        # Checkbox changes not yet written: (habit_id, date) -> (completed,
+        # quantity, points). Flushed on leaving the screen or after a pause.
+        self._pending_writes: Dict[Tuple[int, str], Tuple[bool, int, int]] = {}
+        self._flush_timer = 0.0
         self._load_habits()
         self.selected_habit = 0  # Currently highlighted habit (row)
         self.selected_day = 2  # Currently selected day column (0-2, default to today)
         self.checkbox_mode = False  # False: habit selection, True: checkbox selection
 
+        # Input dispatch per navigation mode
+        self._habit_mode_handlers = {
+            InputType.UP: self._select_prev_habit,
+            InputType.DOWN: self._select_next_habit,
+            InputType.BUTTON_A: self._enter_checkbox_mode,
+            InputType.LEFT: self._back_to_menu,
+        }
+        self._checkbox_mode_handlers = {
+            InputType.LEFT: self._select_prev_day,
+            InputType.RIGHT: self._select_next_day,
+            InputType.BUTTON_A: self._toggle_selected_checkbox,
+            InputType.BUTTON_B: self._exit_checkbox_mode,
+        }
+
         # Text scrolling state for long habit names
         self.scroll_offset = 0
         self.scroll_timer = 0.0
         self.scroll_delay = 0.15  # Seconds between scroll steps
 
-        # Get day letters dynamically based on current date
+        # Composed checkbox grid and the (highlight, checks) it was built from
+        self._grid_layer: Optional[Image.Image] = None
+        self._grid_key: Optional[tuple] = None
+
+        # Looping marquee text for the selected name, rebuilt when it changes
+        self._extended_name_source: Optional[str] = None
+        self._extended_name_cache = ""
+
+        # Get day letters dynamically based on current date, and bake them
+        # into the background (they only change when the date does)
         self.day_letters = self._get_past_3_days()
+        self._composed_bg = self._compose_background()
 
     def _get_past_3_days(self) -> list[str]:
         """
@@ -106,74 +156,95 @@ class HabitCheckerScreen(ScreenBase):
         Returns:
             List of 3 single-letter day abbreviations (e.g., ["S", "S", "M"])
         """
-        today = datetime.now()
-        days = []
-        for i in range(2, -1, -1):  # 2 days ago to today
-            day = today - timedelta(days=i)
-            day_abbr = day.strftime("%a")  # Mon, Tue, Wed, etc.
-
-            # Handle Thursday and Sunday specially (2 letters)
-            if day_abbr == "Thu":
-                days.append("Th")
-            elif day_abbr == "Sun":
-                days.append("Su")
+        today = date.today()
+        return [self.DAY_LETTERS[(today - timedelta(days=i)).weekday()]
+                for i in range(2, -1, -1)]  # 2 days ago to today
+
+    def _compose_background(self) -> Image.Image:
+        """Build the static frame: background plus the day letter headers.
+
+        Returns:
+            RGB image to paste at the start of every render
+        """
+        composed = self.background.copy()
+
+        # Render day letter headers
+        for i, day_letter in enumerate(self.day_letters):
+            x = self.CHECKBOX_XS[i]
+
+            # Center text over 8px-wide checkboxes
+            if len(day_letter) == 2:
+                # 2-letter days (Th, Su) - roughly 8-10px wide, add 1px to center
+                x += 1
             else:
-                days.append(day_abbr[0])  # First letter only
+                # Single-letter days - roughly 4-5px wide, add 3px to center over 8px checkbox
+                x += 3
+
+            # Pre-rasterized glyphs; same pixels as draw.text with fontmode '1'
+            sprite = render_text_sprite(day_letter, Config.FONT_REGULAR, 8, Config.COLOR_TEXT_DARK)
+            paste_text_sprite(composed, sprite, x, self.DAY_LETTER_Y)
 
-        return days
+        return composed
 
     def _load_habits(self):
         """Load habits and their completion status from database."""
         db_habits = self.db.get_all_habits(active_only=True)
-        print(f"[DEBUG] HabitCheckerScreen._load_habits: Found {len(db_habits)} active habits")
-        for h in db_habits:
-            print(f"  - Habit ID {h['id']}: {h['name']} (active={h.get('active', 'N/A')})")
+        logger.debug("HabitCheckerScreen._load_habits: Found %d active habits", len(db_habits))
+
+        # Dates for past 2 days + today, kept for the grid's lifetime so
+        # checkbox saves write to the same day the column shows
+        today = date.today()
+        dates = [(today - timedelta(days=i)).isoformat() for i in range(2, -1, -1)]
+        self._dates = dates
 
-        # Get dates for past 2 days + today
-        today = datetime.now()
-        dates = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(2, -1, -1)]
+        # One query for every habit's logs in the window, bucketed by (habit, date)
+        logs = self.db.get_habit_logs_bulk([h.id for h in db_habits], dates[0], dates[2])
+        log_map = {(log.habit_id, log.date): log for log in logs}
 
         self.habits = []
         for h in db_habits:
             # Check if this is a daily incremental habit
-            is_daily_incremental = (h['type'] == 'incremental' and
-                                   '/day' in h.get('recurrence', ''))
-
-            # Get logs for this habit for the 3-day range
-            logs = self.db.get_habit_logs(h['id'], start_date=dates[0], end_date=dates[2])
+            is_daily_incremental = (h.type == 'incremental' and
+                                   '/day' in (h.recurrence or ''))
 
             # Build checks array
             # For daily incrementals: store quantity (0-6)
             # For binary/weekly incrementals: store True/False
             checks = []
-            for date in dates:
-                log = next((l for l in logs if l['date'] == date), None)
+            for day_str in dates:
+                log = log_map.get((h.id, day_str))
                 if is_daily_incremental:
                     # Store quantity (0 if not completed, 1-6 if completed)
-                    quantity = log['quantity'] if log and log['completed'] else 0
+                    quantity = log.quantity if log and log.completed else 0
                     # Clamp to 0-6 range
                     checks.append(max(0, min(6, quantity)))
                 else:
                     # Binary check
-                    checks.append(bool(log and log['completed']) if log else False)
+                    checks.append(bool(log.completed) if log else False)
 
             self.habits.append({
-                "id": h['id'],
-                "name": h['name'],
-                "type": h['type'],
-                "recurrence": h.get('recurrence', 'daily'),
+                "id": h.id,
+                "name": h.name,
+                "type": h.type,
+                "recurrence": h.recurrence or 'daily',
+                "points_per": h.points_per,
                 "is_daily_incremental": is_daily_incremental,
                 "checks": checks
             })
 
     def reload_habits(self):
         """Reload habits from database (called when returning to this screen)."""
+        self.flush_pending()
         self._load_habits()
+        self.dirty = True
         # Reset selection if out of bounds
         if self.selected_habit >= len(self.habits):
             self.selected_habit = 0
         # Recalculate day letters in case date changed
-        self.day_letters = self._get_past_3_days()
+        day_letters = self._get_past_3_days()
+        if day_letters != self.day_letters:
+            self.day_letters = day_letters
+            self._composed_bg = self._compose_background()
 
     def _save_checkbox(self, habit_idx: int, day_idx: int, value):
         """Save checkbox state to database.
@@ -187,34 +258,43 @@ class HabitCheckerScreen(ScreenBase):
         habit = self.habits[habit_idx]
         habit_id = habit['id']
 
-        # Calculate date for this day index
-        today = datetime.now()
-        target_date = (today - timedelta(days=(2 - day_idx))).strftime("%Y-%m-%d")
+        # Date of this column, as loaded by _load_habits
+        target_date = self._dates[day_idx]
 
-        # Get habit details for points calculation
-        db_habit = self.db.get_habit_by_id(habit_id)
+        # Points come from the row loaded in _load_habits, not a fresh SELECT
+        points_per = habit["points_per"]
 
         # Determine completed status and quantity based on habit type
         if habit["is_daily_incremental"]:
             # Incremental habit: value is count (0-6)
             quantity = value
             completed = (quantity > 0)
-            points = db_habit['points_per'] * quantity
+            points = points_per * quantity
         else:
             # Binary habit: value is boolean
             completed = value
             quantity = 1 if completed else 0
-            points = db_habit['points_per'] if completed else 0
-
-        # Save to database
-        self.db.log_habit_completion(
-            habit_id=habit_id,
-            date=target_date,
-            completed=completed,
-            skipped=False,
-            quantity=quantity,
-            points_earned=points
-        )
+            points = points_per if completed else 0
+
+        # Queue the write; the latest value per (habit, day) wins and the
+        # batch is committed together by flush_pending()
+        self._pending_writes[(habit_id, target_date)] = (completed, quantity, points)
+        self._flush_timer = 0.0
+
+    def flush_pending(self) -> None:
+        """Write all queued checkbox changes to the database in one transaction."""
+        if not self._pending_writes:
+            return
+        self.db.log_habit_completions_bulk([
+            (habit_id, date_str, completed, False, quantity, points)
+            for (habit_id, date_str), (completed, quantity, points) in self._pending_writes.items()
+        ])
+        self._pending_writes.clear()
+        self._flush_timer = 0.0
+
+    def close(self) -> None:
+        """Flush queued checkbox changes before shutdown."""
+        self.flush_pending()
 
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """
@@ -233,103 +313,132 @@ class HabitCheckerScreen(ScreenBase):
         if not event.pressed:
             return None
 
+        # Any press may change what is shown
+        self.dirty = True
+
         # If no habits, only allow going back
         if not self.habits:
             if event.input_type == InputType.LEFT:
-                return "menu"
+                return self._back_to_menu()
             return None
 
-        if not self.checkbox_mode:
-            # Habit selection mode
-            if event.input_type == InputType.UP:
-                self.selected_habit = (self.selected_habit - 1) % len(self.habits)
-            elif event.input_type == InputType.DOWN:
-                self.selected_habit = (self.selected_habit + 1) % len(self.habits)
-            elif event.input_type == InputType.BUTTON_A:
-                # Enter checkbox mode
-                self.checkbox_mode = True
-            elif event.input_type == InputType.LEFT:
-                # Go back to menu
-                return "menu"
-        else:
-            # Checkbox mode
-            if event.input_type == InputType.LEFT:
-                self.selected_day = (self.selected_day - 1) % 3
-            elif event.input_type == InputType.RIGHT:
-                self.selected_day = (self.selected_day + 1) % 3
-            elif event.input_type == InputType.BUTTON_A:
-                # Toggle checkbox or cycle through numbers
-                habit = self.habits[self.selected_habit]
+        handlers = self._checkbox_mode_handlers if self.checkbox_mode else self._habit_mode_handlers
+        handler = handlers.get(event.input_type)
+        return handler() if handler is not None else None
 
-                if habit["is_daily_incremental"]:
-                    # Cycle through 0 → 1 → 2 → 3 → 4 → 5 → 6 → 0
-                    current_count = habit["checks"][self.selected_day]
-                    new_count = (current_count + 1) % 7
-                    habit["checks"][self.selected_day] = new_count
+    # Habit selection mode handlers
 
-                    # Save to database
-                    self._save_checkbox(self.selected_habit, self.selected_day, new_count)
-                else:
-                    # Binary toggle
-                    old_state = habit["checks"][self.selected_day]
-                    new_state = not old_state
-                    habit["checks"][self.selected_day] = new_state
+    def _select_prev_habit(self) -> None:
+        """Move the habit highlight up, wrapping to the bottom."""
+        self.selected_habit = (self.selected_habit - 1) % len(self.habits)
+
+    def _select_next_habit(self) -> None:
+        """Move the habit highlight down, wrapping to the top."""
+        self.selected_habit = (self.selected_habit + 1) % len(self.habits)
+
+    def _enter_checkbox_mode(self) -> None:
+        """Start picking a day for the selected habit."""
+        self.checkbox_mode = True
+
+    def _back_to_menu(self) -> str:
+        """Save queued changes and leave for the menu.
+
+        Returns:
+            The menu screen name
+        """
+        self.flush_pending()
+        return "menu"
+
+    # Checkbox mode handlers
+
+    def _select_prev_day(self) -> None:
+        """Move the day highlight left, wrapping to today."""
+        self.selected_day = (self.selected_day - 1) % 3
+
+    def _select_next_day(self) -> None:
+        """Move the day highlight right, wrapping to 2 days ago."""
+        self.selected_day = (self.selected_day + 1) % 3
+
+    def _toggle_selected_checkbox(self) -> None:
+        """Toggle the selected checkbox, or step a daily incremental count."""
+        habit = self.habits[self.selected_habit]
+
+        if habit["is_daily_incremental"]:
+            # Cycle through 0 → 1 → 2 → 3 → 4 → 5 → 6 → 0
+            new_value = (habit["checks"][self.selected_day] + 1) % 7
+        else:
+            # Binary toggle
+            new_value = not habit["checks"][self.selected_day]
+        habit["checks"][self.selected_day] = new_value
 
-                    # Save to database
-                    self._save_checkbox(self.selected_habit, self.selected_day, new_state)
-            elif event.input_type == InputType.BUTTON_B:
-                # Exit checkbox mode
-                self.checkbox_mode = False
+        # Save to database
+        self._save_checkbox(self.selected_habit, self.selected_day, new_value)
 
-        return None
+    def _exit_checkbox_mode(self) -> None:
+        """Return to habit selection."""
+        self.checkbox_mode = False
 
     def update(self, delta_time: float) -> None:
         """Update screen state - handle text scrolling for long habit names."""
+        # Commit queued checkbox changes once toggling pauses
+        if self._pending_writes:
+            self._flush_timer += delta_time
+            if self._flush_timer >= self.FLUSH_DELAY:
+                self.flush_pending()
+
         # Scroll selected habit name if long and in habit selection mode
-        if not self.checkbox_mode and self.selected_habit < len(self.habits):
+        if self._is_name_scrolling():
             habit_name = self.habits[self.selected_habit]["name"]
-            if len(habit_name) > self.MAX_NAME_LENGTH:
-                self.scroll_timer += delta_time
-                if self.scroll_timer >= self.scroll_delay:
-                    self.scroll_timer = 0.0
-                    self.scroll_offset = (self.scroll_offset + 1) % (len(habit_name) + 1)
-            else:
-                self.scroll_offset = 0
+            self.scroll_timer += delta_time
+            if self.scroll_timer >= self.scroll_delay:
                 self.scroll_timer = 0.0
+                self.scroll_offset = (self.scroll_offset + 1) % (len(habit_name) + 1)
+                self.dirty = True
         else:
-            # Reset scroll when in checkbox mode or no habit selected
+            # Reset scroll for short names, in checkbox mode or with no habit selected
+            if self.scroll_offset != 0:
+                self.dirty = True
             self.scroll_offset = 0
             self.scroll_timer = 0.0
 
-    def render(self, buffer: Image.Image) -> None:
-        """
-        Render the habit checker screen.
+    def _is_name_scrolling(self) -> bool:
+        """Whether the selected habit's name is shown as a scrolling marquee."""
+        return (not self.checkbox_mode and self.selected_habit < len(self.habits)
+                and len(self.habits[self.selected_habit]["name"]) > self.MAX_NAME_LENGTH)
+
+    def _get_extended_name(self, name: str) -> str:
+        """Get the looping marquee text, rebuilt only when the name changes.
 
         Args:
-            buffer: 128x128 PIL Image to render onto
+            name: Full habit name
+
+        Returns:
+            The name, three spaces, and the name again
         """
-        # Draw background
-        buffer.paste(self.background, (0, 0))
+        if self._extended_name_source != name:
+            self._extended_name_cache = name + "   " + name  # Add spacing and repeat
+            self._extended_name_source = name
+        return self._extended_name_cache
 
-        draw = ImageDraw.Draw(buffer)
-        draw.fontmode = '1'  # Disable anti-aliasing for pixel-perfect text
+    def has_animations(self) -> bool:
+        """Whether the selected habit name is scrolling.
 
-        # Render day letter headers
-        for i, day_letter in enumerate(self.day_letters):
-            x = self.CHECKBOX_START_X + i * self.CHECKBOX_SPACING
+        Returns:
+            True while update() can change the screen without input
+        """
+        return self._is_name_scrolling()
 
-            # Center text over 8px-wide checkboxes
-            if len(day_letter) == 2:
-                # 2-letter days (Th, Su) - roughly 8-10px wide, add 1px to center
-                x += 1
-            else:
-                # Single-letter days - roughly 4-5px wide, add 3px to center over 8px checkbox
-                x += 3
+    def render(self, buffer: Image.Image) -> None:
+        """
+        Render the habit checker screen.
 
-            # Draw text directly for crisp rendering
-            draw.text((x, self.DAY_LETTER_Y), day_letter, fill=Config.COLOR_TEXT_DARK, font=self.font)
+        Args:
+            buffer: 128x128 PIL Image to render onto
+        """
+        # Draw background with the day letter headers already on it
+        buffer.paste(self._composed_bg, (0, 0))
 
-        # Render habits and checkboxes
+        # Render habit names
         for habit_idx, habit in enumerate(self.habits):
             y = self.HABIT_LIST_START_Y + habit_idx * self.LINE_HEIGHT
 
@@ -340,7 +449,7 @@ class HabitCheckerScreen(ScreenBase):
             if len(name) > self.MAX_NAME_LENGTH:
                 if is_selected:
                     # Show scrolling text for selected habit
-                    extended_name = name + "   " + name  # Add spacing and repeat
+                    extended_name = self._get_extended_name(name)
                     name = extended_name[self.scroll_offset:self.scroll_offset + self.MAX_NAME_LENGTH]
                 else:
                     # Show truncated text for non-selected habits
@@ -349,25 +458,48 @@ class HabitCheckerScreen(ScreenBase):
             # Highlight selected habit name (only in habit selection mode)
             text_color = Config.COLOR_BLUE_HIGHLIGHT if is_selected else Config.COLOR_TEXT_DARK
 
-            # Draw text directly for crisp rendering
-            draw.text((self.NAME_X, y), name, fill=text_color, font=self.font)
+            # Cached per (shown text, color), so each scroll window renders once
+            paste_text_sprite(buffer, render_text_sprite(name, Config.FONT_REGULAR, 8, text_color), self.NAME_X, y)
+
+        # Checkbox grid as one layer, recomposed only when a value or the
+        # highlighted cell changes (checkbox sprites are moved up 5 pixels)
+        if self.habits:
+            highlight = (self.selected_habit, self.selected_day) if self.checkbox_mode else None
+            grid_key = (highlight, tuple(tuple(habit["checks"]) for habit in self.habits))
+            if grid_key != self._grid_key:
+                self._grid_layer = self._compose_checkbox_grid(highlight)
+                self._grid_key = grid_key
+            buffer.paste(self._grid_layer, (self.CHECKBOX_START_X, self.HABIT_LIST_START_Y - 5), self._grid_layer)
+
+    def _compose_checkbox_grid(self, highlight: Optional[Tuple[int, int]]) -> Image.Image:
+        """Paste every habit's day checkboxes into one transparent layer.
+
+        Sprite alpha is binary, so pasting the layer gives the same pixels
+        as pasting each sprite onto the buffer.
+
+        Args:
+            highlight: (habit index, day index) of the selected cell, or None
+
+        Returns:
+            RGBA layer whose origin is the first checkbox's paste position
+        """
+        tile = self.checked_box.width
+        layer = Image.new("RGBA", (self.CHECKBOX_XS[-1] - self.CHECKBOX_START_X + tile,
+                                   (len(self.habits) - 1) * self.LINE_HEIGHT + tile), (0, 0, 0, 0))
+
+        for habit_idx, habit in enumerate(self.habits):
+            y = habit_idx * self.LINE_HEIGHT
 
             # Render checkboxes or numbered boxes for each day
             for day_idx, value in enumerate(habit["checks"]):
-                checkbox_x = self.CHECKBOX_START_X + day_idx * self.CHECKBOX_SPACING
-
-                # Check if this checkbox is selected in checkbox mode
-                is_selected = self.checkbox_mode and habit_idx == self.selected_habit and day_idx == self.selected_day
+                is_selected = highlight == (habit_idx, day_idx)
 
                 # Choose sprite based on habit type
                 if habit["is_daily_incremental"]:
                     # Daily incremental: show numbered boxes (value = 0-6)
                     if value == 0:
                         # Unchecked
-                        if is_selected:
-                            sprite = self.unchecked_highlight
-                        else:
-                            sprite = self.icons_sheet.get_sprite(*icons.UNCHECKED_BOX_SMALL)
+                        sprite = self.unchecked_highlight if is_selected else self.unchecked_box
                     else:
                         # Numbered box 1-6
                         if is_selected:
@@ -377,15 +509,11 @@ class HabitCheckerScreen(ScreenBase):
                 else:
                     # Binary habit: show checkboxes (value = True/False)
                     if is_selected:
-                        # Use highlighted sprite
                         sprite = self.checked_highlight if value else self.unchecked_highlight
                     else:
-                        # Use normal sprite
-                        if value:
-                            sprite = self.icons_sheet.get_sprite(*icons.CHECKED_BOX_SMALL)
-                        else:
-                            sprite = self.icons_sheet.get_sprite(*icons.UNCHECKED_BOX_SMALL)
+                        sprite = self.checked_box if value else self.unchecked_box
+
+                # Sheet tiles are always RGBA, so the sprite is its own mask
+                layer.paste(sprite, (self.CHECKBOX_XS[day_idx] - self.CHECKBOX_START_X, y), sprite)
 
-                # Paste checkbox sprite (moved up 5 pixels)
-                checkbox_y = y - 5
-                buffer.paste(sprite, (checkbox_x, checkbox_y), sprite if sprite.mode == "RGBA" else None)
+        return layer
@@ -1,6 +1,6 @@
 """Habit form screen for adding/editing habits (UI demo)."""
 
-from PIL import Image, ImageDraw
+from PIL import Image
 from typing import Optional
 from game.screens import ScreenBase
 from game.text_input import TextInputWidget
@@ -37,6 +37,7 @@ class HabitFormScreen(ScreenBase):
         Args:
             edit_mode: True if editing existing habit, False if adding new
         """
+        super().__init__()
         self.edit_mode = edit_mode
         self.text_input = TextInputWidget(max_length=16)
 
@@ -63,6 +64,42 @@ class HabitFormScreen(ScreenBase):
         self.editing_field = None
         self.days_selected_index = 0  # For navigating days toggles
 
+        # Input dispatch while editing days / while navigating fields
+        self._days_handlers = {
+            InputType.LEFT: self._prev_day,
+            InputType.RIGHT: self._next_day,
+            InputType.BUTTON_A: self._toggle_day,
+            InputType.BUTTON_B: self._finish_days,
+        }
+        self._field_handlers = {
+            InputType.UP: self._prev_field,
+            InputType.DOWN: self._next_field,
+            InputType.BUTTON_A: self._activate_field,
+            InputType.LEFT: lambda: self._cycle_type(-1),
+            InputType.RIGHT: lambda: self._cycle_type(1),
+            InputType.BUTTON_B: self._back,
+            InputType.BUTTON_C: self._save,
+        }
+
+        # Static text, rendered once: titles and each field label in its
+        # selected (black) and unselected (grey) colors
+        self._title_img = render_text("Edit Habit" if edit_mode else "Add Habit",
+                                      Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        self._label_imgs = {
+            (field_name, color): render_text(f"{field_name}:", Config.FONT_REGULAR,
+                                             Config.FONT_SIZE_SMALL, color=color)
+            for field_name in self.fields
+            for color in ((0, 0, 0), (100, 100, 100))
+        }
+
+        # Day toggle letters in enabled/disabled colors, and the highlight
+        # patch behind the selected day
+        self._day_imgs_on = [render_text(d, Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(0, 0, 0))
+                             for d in self.DAYS_OF_WEEK]
+        self._day_imgs_off = [render_text(d, Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(180, 180, 180))
+                              for d in self.DAYS_OF_WEEK]
+        self._day_highlight = Image.new("RGB", (9, 11), (200, 200, 200))
+
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input for form navigation and editing."""
         if not event.pressed:
@@ -82,62 +119,76 @@ class HabitFormScreen(ScreenBase):
                 self.editing_field = None
             return None
 
-        # If editing days field
-        if self.editing_field == "Days":
-            if event.input_type == InputType.LEFT:
-                self.days_selected_index = (self.days_selected_index - 1) % 7
-            elif event.input_type == InputType.RIGHT:
-                self.days_selected_index = (self.days_selected_index + 1) % 7
-            elif event.input_type == InputType.BUTTON_A:
-                # Toggle selected day
-                self.form_data["Days"][self.days_selected_index] = not self.form_data["Days"][self.days_selected_index]
-            elif event.input_type == InputType.BUTTON_B:
-                # Done editing days
-                self.editing_field = None
-            return None
+        # Editing the days field, or navigating between fields
+        handlers = self._days_handlers if self.editing_field == "Days" else self._field_handlers
+        handler = handlers.get(event.input_type)
+        return handler() if handler is not None else None
+
+    # Days field handlers
+
+    def _prev_day(self) -> None:
+        """Move the day cursor left."""
+        self.days_selected_index = (self.days_selected_index - 1) % 7
+
+    def _next_day(self) -> None:
+        """Move the day cursor right."""
+        self.days_selected_index = (self.days_selected_index + 1) % 7
+
+    def _toggle_day(self) -> None:
+        """Toggle the day under the cursor."""
+        self.form_data["Days"][self.days_selected_index] = not self.form_data["Days"][self.days_selected_index]
+
+    def _finish_days(self) -> None:
+        """Done editing days."""
+        self.editing_field = None
 
-        # Normal navigation
-        if event.input_type == InputType.UP:
-            self.current_field_index = (self.current_field_index - 1) % len(self.fields)
-        elif event.input_type == InputType.DOWN:
-            self.current_field_index = (self.current_field_index + 1) % len(self.fields)
-
-        # Activate field for editing
-        elif event.input_type == InputType.BUTTON_A:
-            current_field = self.fields[self.current_field_index]
-
-            if current_field == "Name":
-                self.editing_field = "Name"
-                self.text_input.activate()
-                self.text_input.value = self.form_data["Name"]
-            elif current_field == "Points":
-                self.editing_field = "Points"
-                self.text_input.activate()
-                self.text_input.value = self.form_data["Points"]
-            elif current_field == "Time":
-                self.editing_field = "Time"
-                self.text_input.activate()
-                self.text_input.value = self.form_data["Time"]
-            elif current_field == "Days":
-                self.editing_field = "Days"
-                self.days_selected_index = 0
-
-        # Cycle Type field with left/right
-        elif event.input_type in [InputType.LEFT, InputType.RIGHT]:
-            if self.fields[self.current_field_index] == "Type":
-                direction = 1 if event.input_type == InputType.RIGHT else -1
-                self.form_data["Type"] = (self.form_data["Type"] + direction) % len(self.HABIT_TYPES)
-
-        # Cancel/Back
-        elif event.input_type == InputType.BUTTON_B:
-            return "habits"
-
-        # Save (demo - just go back)
-        elif event.input_type == InputType.BUTTON_C:
-            # In real app, would save to database here
-            return "habits"
-
-        return None
+    # Field navigation handlers
+
+    def _prev_field(self) -> None:
+        """Select the previous field."""
+        self.current_field_index = (self.current_field_index - 1) % len(self.fields)
+
+    def _next_field(self) -> None:
+        """Select the next field."""
+        self.current_field_index = (self.current_field_index + 1) % len(self.fields)
+
+    def _activate_field(self) -> None:
+        """Start editing the selected field."""
+        current_field = self.fields[self.current_field_index]
+
+        if current_field in ("Name", "Points", "Time"):
+            self.editing_field = current_field
+            self.text_input.activate()
+            self.text_input.value = self.form_data[current_field]
+        elif current_field == "Days":
+            self.editing_field = "Days"
+            self.days_selected_index = 0
+
+    def _cycle_type(self, direction: int) -> None:
+        """Cycle the Type field when it is selected.
+
+        Args:
+            direction: 1 for next type, -1 for previous
+        """
+        if self.fields[self.current_field_index] == "Type":
+            self.form_data["Type"] = (self.form_data["Type"] + direction) % len(self.HABIT_TYPES)
+
+    def _back(self) -> str:
+        """Cancel/Back.
+
+        Returns:
+            The habits screen name
+        """
+        return "habits"
+
+    def _save(self) -> str:
+        """Save (demo - just go back).
+
+        Returns:
+            The habits screen name
+        """
+        # In real app, would save to database here
+        return "habits"
 
     def update(self, delta_time: float) -> None:
         """Update form screen state."""
@@ -145,10 +196,10 @@ class HabitFormScreen(ScreenBase):
 
     def render(self, buffer: Image.Image) -> None:
         """Render habit form screen."""
-        draw = ImageDraw.Draw(buffer)
+        draw = self._get_draw(buffer)
 
-        # White background
-        draw.rectangle([(0, 0), (128, 128)], fill=(255, 255, 255))
+        # White background (tuple paste is a plain fill, no draw dispatch)
+        buffer.paste((255, 255, 255), (0, 0, 128, 128))
 
         # If text input is active, render it instead
         if self.text_input.is_active():
@@ -158,17 +209,16 @@ class HabitFormScreen(ScreenBase):
             title_x = (128 - title_img.width) // 2
             buffer.paste(title_img, (title_x, 8), title_img)
 
-            draw_divider(buffer, 20)
+            draw_divider(buffer, 20, draw=draw)
             self.text_input.render(buffer, x=4, y=24)
             return
 
         # Title
-        title_text = "Edit Habit" if self.edit_mode else "Add Habit"
-        title_img = render_text(title_text, Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        title_img = self._title_img
         title_x = (128 - title_img.width) // 2
         buffer.paste(title_img, (title_x, 4), title_img)
 
-        draw_divider(buffer, 16)
+        draw_divider(buffer, 16, draw=draw)
 
         # Form fields
         y_offset = 20
@@ -179,7 +229,7 @@ class HabitFormScreen(ScreenBase):
 
             # Field label
             label_color = (0, 0, 0) if is_selected or is_editing else (100, 100, 100)
-            label_img = render_text(f"{field_name}:", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=label_color)
+            label_img = self._label_imgs[(field_name, label_color)]
             buffer.paste(label_img, (4, y_offset), label_img)
 
             # Field value
@@ -209,16 +259,15 @@ class HabitFormScreen(ScreenBase):
             elif field_name == "Days":
                 # Draw day toggles
                 day_x = value_x
-                for day_idx, day_label in enumerate(self.DAYS_OF_WEEK):
+                for day_idx in range(len(self.DAYS_OF_WEEK)):
                     is_enabled = self.form_data["Days"][day_idx]
                     is_day_selected = is_editing and (day_idx == self.days_selected_index)
 
-                    # Background for selected day
+                    # Background for selected day (same area draw.rectangle filled)
                     if is_day_selected:
-                        draw.rectangle((day_x - 1, y_offset - 1, day_x + 7, y_offset + 9), fill=(200, 200, 200))
+                        buffer.paste(self._day_highlight, (day_x - 1, y_offset - 1))
 
-                    day_color = (0, 0, 0) if is_enabled else (180, 180, 180)
-                    day_img = render_text(day_label, Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=day_color)
+                    day_img = (self._day_imgs_on if is_enabled else self._day_imgs_off)[day_idx]
                     buffer.paste(day_img, (day_x, y_offset), day_img)
                     day_x += 10
 
@@ -229,7 +278,7 @@ class HabitFormScreen(ScreenBase):
             y_offset += 16
 
         # Button hints
-        draw_divider(buffer, 108)
+        draw_divider(buffer, 108, draw=draw)
         if self.editing_field == "Days":
             draw_button_hint(buffer, 4, 112, "P=Toggle L/R=Day L=Done")
         else:
@@ -1,13 +1,48 @@
 """Popup confirmation dialog screen."""
 
+from functools import lru_cache
 from PIL import Image, ImageDraw
-from typing import Optional
+from typing import Optional, Tuple
 from input.input_base import InputEvent, InputType
 from game.screens import ScreenBase
-from assets.sprite_loader import render_text
+from assets.sprite_loader import render_text, load_image, load_font
 from config import Config
 
 
+@lru_cache(maxsize=64)
+def _wrap_text(text: str, font_path: str, font_size: int, max_width: int) -> Tuple[str, ...]:
+    """Word-wrap text to a pixel width using the font's real advances.
+
+    Cached, so popups built again with the same message skip the layout.
+
+    Args:
+        text: Text to wrap
+        font_path: Path to the TTF font the text is rendered with
+        font_size: Font size in pixels
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Tuple of lines
+    """
+    font = load_font(font_path, font_size)
+    lines = []
+    current_line = ""
+
+    for word in text.split():
+        test_line = f"{current_line} {word}".strip()
+        if font.getlength(test_line) <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+
+    if current_line:
+        lines.append(current_line)
+
+    return tuple(lines)
+
+
 class PopupScreen(ScreenBase):
     """Reusable popup dialog with OK/Cancel buttons.
 
@@ -24,6 +59,9 @@ class PopupScreen(ScreenBase):
     CANCEL_BUTTON_X = 55
     BUTTON_Y = 107
 
+    # Static dialog: only redrawn when the selected button changes
+    redraw_every_frame = False
+
     def __init__(self, message: str, on_ok_screen: str, on_cancel_screen: str):
         """Initialize popup screen.
 
@@ -32,49 +70,27 @@ class PopupScreen(ScreenBase):
             on_ok_screen: Screen to navigate to if OK pressed
             on_cancel_screen: Screen to navigate to if Cancel pressed
         """
+        super().__init__()
         self.message = message
         self.on_ok_screen = on_ok_screen
         self.on_cancel_screen = on_cancel_screen
         self.selected_button = 0  # 0 = OK, 1 = Cancel
 
         # Load background and button sprites
-        self.bg_sprite = Image.open(Config.POPUP_BG).convert("RGBA")
-        self.ok_highlighted = Image.open(Config.POPUP_OK_HIGHLIGHTED).convert("RGBA")
-        self.cancel_highlighted = Image.open(Config.POPUP_CANCEL_HIGHLIGHTED).convert("RGBA")
+        # (decoded once per process and shared; never drawn on)
+        self.bg_sprite = load_image(Config.POPUP_BG)
+        self.ok_highlighted = load_image(Config.POPUP_OK_HIGHLIGHTED)
+        self.cancel_highlighted = load_image(Config.POPUP_CANCEL_HIGHLIGHTED)
 
         # Wrap message text
-        self.wrapped_lines = self._wrap_text(message)
+        self.wrapped_lines = list(_wrap_text(message, Config.FONT_REGULAR, Config.FONT_SIZE_TINY, self.TEXT_WIDTH))
 
-    def _wrap_text(self, text: str) -> list[str]:
-        """Wrap text to fit within TEXT_WIDTH.
-
-        Simple word-based wrapping using rough estimate of 4 pixels
-        per character for 6pt font.
-
-        Args:
-            text: Text to wrap
-
-        Returns:
-            List of lines
-        """
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            # Rough estimate: 4 pixels per char for 6pt font
-            if len(test_line) * 4 <= self.TEXT_WIDTH:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-
-        if current_line:
-            lines.append(current_line)
-
-        return lines
+        # The message is fixed, so rasterize each line once with its position
+        self._line_imgs = [
+            (render_text(line, Config.FONT_REGULAR, Config.FONT_SIZE_TINY, Config.COLOR_TEXT_DARK),
+             self.TEXT_Y + i * 10)  # Line spacing
+            for i, line in enumerate(self.wrapped_lines)
+        ]
 
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input for button selection.
@@ -85,6 +101,8 @@ class PopupScreen(ScreenBase):
         Returns:
             Screen name to navigate to, or None
         """
+        self.dirty = True
+
         if event.input_type == InputType.LEFT:
             self.selected_button = 0  # OK
             return None
@@ -117,17 +135,9 @@ class PopupScreen(ScreenBase):
         # Draw background with caution icon
         buffer.paste(self.bg_sprite, (0, 0), self.bg_sprite)
 
-        # Draw wrapped message text
-        y_offset = self.TEXT_Y
-        for line in self.wrapped_lines:
-            line_img = render_text(
-                line,
-                Config.FONT_REGULAR,
-                Config.FONT_SIZE_TINY,
-                Config.COLOR_TEXT_DARK
-            )
-            buffer.paste(line_img, (self.TEXT_X, y_offset), line_img)
-            y_offset += 10  # Line spacing
+        # Draw pre-rendered message lines
+        for line_img, y in self._line_imgs:
+            buffer.paste(line_img, (self.TEXT_X, y), line_img)
 
         # Draw only the highlighted button for selected option
         if self.selected_button == 0:
@@ -1,18 +1,68 @@
 """Screen implementations for the habit tracker UI."""
 
 from abc import ABC, abstractmethod
+import numpy as np
 from PIL import Image, ImageDraw
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timedelta
 from input.input_base import InputEvent, InputType
-from assets.sprite_loader import SpriteSheet, get_progress_bar_for_percentage, load_font, render_text
+from assets.sprite_loader import (
+    SpriteSheet, get_progress_bar_for_percentage, load_font, load_image, render_text, upscale2x
+)
 from assets import icons
 from config import Config
 from game.speech_bubble import SpeechBubbleWidget
 
 
 class ScreenBase(ABC):
-    """Abstract base class for screens."""
+    """Abstract base class for screens.
+
+    Screens are redrawn every frame by default. A screen whose output only
+    changes in response to input can set redraw_every_frame = False and
+    raise dirty whenever its state changes; App then skips rendering and
+    display updates while it is clean.
+    """
+
+    redraw_every_frame: bool = True
+
+    # Slots for the base state, so subclasses that declare __slots__ of
+    # their own drop the per-instance __dict__
+    __slots__ = ('dirty', '_draw')
+
+    def __init__(self):
+        """Initialize shared screen state; subclasses must call this first."""
+        self.dirty = True  # Always draw on first show
+
+        # Drawing context reused across frames while the buffer is unchanged
+        self._draw: Optional[ImageDraw.ImageDraw] = None
+
+    def has_animations(self) -> bool:
+        """Whether update() must run every frame even while the screen is clean.
+
+        The game loop only idles (blocking on input) when this is False and
+        the screen is not dirty.
+
+        Returns:
+            True if the screen changes over time without input
+        """
+        return self.redraw_every_frame
+
+    def _get_draw(self, buffer: Image.Image) -> ImageDraw.ImageDraw:
+        """Get an ImageDraw for buffer, reusing the one from the last frame.
+
+        Displays hand out the same persistent buffer every frame, so the
+        draw object only needs rebuilding if the buffer's storage changes.
+
+        Args:
+            buffer: PIL Image being rendered to
+
+        Returns:
+            ImageDraw bound to buffer
+        """
+        draw = self._draw
+        if draw is None or draw.im is not buffer.im:
+            draw = self._draw = ImageDraw.Draw(buffer)
+        return draw
 
     @abstractmethod
     def handle_input(self, event: InputEvent) -> Optional[str]:
@@ -44,34 +94,46 @@ class ScreenBase(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Persist any pending state before the app shuts down.
+
+        Called once per screen on exit, before the database is closed.
+        """
+        pass
+
 
 class HomeScreen(ScreenBase):
     """Home screen showing layered character with animated expressions."""
 
     def __init__(self):
         """Initialize home screen with animated character sprites."""
-        # Load and scale background to 128x128 (2x from 64x64 source)
-        bg_raw = Image.open(Config.BACKGROUND_SPRITE)
-        self.background = bg_raw.resize((128, 128), Image.NEAREST)
+        super().__init__()
+        # Load background (already 128x128, no scaling needed)
+        self.background = load_image(Config.BACKGROUND_SPRITE)
 
         # Load animated body sprite sheet (4 frames, 64x64 each)
-        body_sheet = SpriteSheet(Config.CHARACTER_ANIM_SPRITE, 64, 64)
+        body_sheet = SpriteSheet.get(Config.CHARACTER_ANIM_SPRITE, 64, 64)
         self.body_frames = []
         for i in range(4):  # 4 frames
             frame_64 = body_sheet.get_sprite(i, 0)  # Get 64x64 frame
-            frame_128 = frame_64.resize((128, 128), Image.NEAREST)  # Scale to 128x128
+            frame_128 = upscale2x(frame_64)  # Scale to 128x128
             self.body_frames.append(frame_128)
 
-        # Load animated face sprite sheets (4 frames each, 64x64)
+        # Flatten the static background under each body frame so the two
+        # layers are a single opaque paste per frame
+        self._bg_body = []
+        for body_frame in self.body_frames:
+            composite = self.background.convert("RGB")
+            composite.paste(body_frame, (0, 0), body_frame)
+            self._bg_body.append(composite)
+
+        # Animated face sprite sheets (4 frames each, 64x64) are loaded
+        # lazily the first time each expression is shown
+        self._face_paths = Config.FACE_ANIM_SPRITES
         self.face_animations = {}
-        for face_name, face_path in Config.FACE_ANIM_SPRITES.items():
-            face_sheet = SpriteSheet(face_path, 64, 64)
-            frames = []
-            for i in range(4):  # 4 frames per expression
-                frame_64 = face_sheet.get_sprite(i, 0)
-                frame_128 = frame_64.resize((128, 128), Image.NEAREST)
-                frames.append(frame_128)
-            self.face_animations[face_name] = frames
+
+        # Fully flattened background + body + face frames, per expression
+        self._composed = {}
 
         # Animation state
         self.current_frame = 0
@@ -79,12 +141,54 @@ class HomeScreen(ScreenBase):
         self.frame_delay = Config.ANIM_FRAME_DELAY
 
         # Current facial expression
-        self.face_names = list(self.face_animations.keys())
+        self.face_names = list(self._face_paths.keys())
         self.current_face_index = 0
 
         # Speech bubble widget
         self.speech_bubble = SpeechBubbleWidget()
 
+    def _get_face_frames(self, face_name: str) -> List[Image.Image]:
+        """Get the scaled animation frames for an expression, loading on first use.
+
+        Args:
+            face_name: Expression name from Config.FACE_ANIM_SPRITES
+
+        Returns:
+            List of 4 RGBA frames scaled to 128x128
+        """
+        frames = self.face_animations.get(face_name)
+        if frames is None:
+            face_sheet = SpriteSheet.get(self._face_paths[face_name], 64, 64)
+            frames = []
+            for i in range(4):  # 4 frames per expression
+                frame_64 = face_sheet.get_sprite(i, 0)
+                frame_128 = upscale2x(frame_64)
+                frames.append(frame_128)
+            self.face_animations[face_name] = frames
+        return frames
+
+    def _get_composed_frames(self, face_name: str) -> List[Image.Image]:
+        """Get opaque background + body + face frames for an expression.
+
+        Built the first time the expression is shown, from the flattened
+        background/body frames and the expression's face frames.
+
+        Args:
+            face_name: Expression name from Config.FACE_ANIM_SPRITES
+
+        Returns:
+            List of 4 RGB frames, one per animation step
+        """
+        frames = self._composed.get(face_name)
+        if frames is None:
+            frames = []
+            for bg_body, face_frame in zip(self._bg_body, self._get_face_frames(face_name)):
+                composite = bg_body.copy()
+                composite.paste(face_frame, (0, 0), face_frame)
+                frames.append(composite)
+            self._composed[face_name] = frames
+        return frames
+
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input - Button B toggles speech, Button C cycles faces, L/R navigate."""
         if not event.pressed:
@@ -125,17 +229,10 @@ class HomeScreen(ScreenBase):
 
     def render(self, buffer: Image.Image) -> None:
         """Render layered animated character sprites."""
-        # Layer 1: Background (sky) - static
-        buffer.paste(self.background, (0, 0))
-
-        # Layer 2: Character body - animated
-        body_frame = self.body_frames[self.current_frame]
-        buffer.paste(body_frame, (0, 0), body_frame)
-
-        # Layer 3: Current facial expression - animated
+        # Layers 1-3: Background (sky), character body and current facial
+        # expression, pre-flattened per (expression, frame)
         current_face_name = self.face_names[self.current_face_index]
-        face_frame = self.face_animations[current_face_name][self.current_frame]
-        buffer.paste(face_frame, (0, 0), face_frame)
+        buffer.paste(self._get_composed_frames(current_face_name)[self.current_frame], (0, 0))
 
         # Layer 4: Speech bubble (if visible)
         self.speech_bubble.render(buffer)
@@ -146,7 +243,8 @@ class MenuScreen(ScreenBase):
 
     def __init__(self):
         """Initialize menu screen."""
-        self.icons_sheet = SpriteSheet(Config.ICONS_SPRITE_SHEET)
+        super().__init__()
+        self.icons_sheet = SpriteSheet.get(Config.ICONS_SPRITE_SHEET)
         self.menu_items = [
             ("Home", icons.HOME_ICON),
             ("Habits", icons.CHECKED_BOX_LARGE),
@@ -155,6 +253,17 @@ class MenuScreen(ScreenBase):
         ]
         self.selected_index = 0
 
+        # Static text never changes, so render it once
+        self._title_img = render_text("MENU", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        self._item_imgs = [
+            render_text(name, Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
+            for name, _ in self.menu_items
+        ]
+
+        # Sprites are invariant too
+        self._pointer = self.icons_sheet.get_sprite(*icons.POINTER_SMALL)
+        self._icons = [self.icons_sheet.get_sprite(*coords) for _, coords in self.menu_items]
+
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input - up/down to navigate, P to select, left to go back."""
         if not event.pressed:
@@ -182,31 +291,28 @@ class MenuScreen(ScreenBase):
 
     def render(self, buffer: Image.Image) -> None:
         """Render menu screen."""
-        draw = ImageDraw.Draw(buffer)
-
-        # White background
-        draw.rectangle([(0, 0), (128, 128)], fill=(255, 255, 255))
+        # White background (tuple paste is a plain fill, no draw dispatch)
+        buffer.paste((255, 255, 255), (0, 0, 128, 128))
 
         # Draw title
-        title_text = render_text("MENU", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        title_text = self._title_img
         title_x = (128 - title_text.width) // 2
         buffer.paste(title_text, (title_x, 10), title_text)
 
         # Draw menu items
         y_offset = 40
-        pointer = self.icons_sheet.get_sprite(*icons.POINTER_SMALL)
+        pointer = self._pointer
 
-        for i, (name, icon_coords) in enumerate(self.menu_items):
+        for i, icon in enumerate(self._icons):
             # Draw pointer if selected
             if i == self.selected_index:
                 buffer.paste(pointer, (10, y_offset), pointer)
 
             # Draw icon
-            icon = self.icons_sheet.get_sprite(*icon_coords)
             buffer.paste(icon, (30, y_offset), icon)
 
             # Draw text
-            text = render_text(name, Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
+            text = self._item_imgs[i]
             buffer.paste(text, (50, y_offset + 4), text)
 
             y_offset += 20
@@ -215,9 +321,13 @@ class MenuScreen(ScreenBase):
 class HabitsScreen(ScreenBase):
     """Habits screen with toggleable checkboxes."""
 
+    # Only redrawn when dirty (input)
+    redraw_every_frame = False
+
     def __init__(self):
         """Initialize habits screen."""
-        self.icons_sheet = SpriteSheet(Config.ICONS_SPRITE_SHEET)
+        super().__init__()
+        self.icons_sheet = SpriteSheet.get(Config.ICONS_SPRITE_SHEET)
         self.habits = [
             {"name": "Gym", "completed": False, "icon": icons.STAR_SMALL},
             {"name": "Meditate", "completed": False, "icon": icons.HEART_SMALL},
@@ -228,11 +338,29 @@ class HabitsScreen(ScreenBase):
         self.menu_items = self.habits + [{"name": "+ Add Habit", "is_add_button": True}]
         self.selected_index = 0
 
+        # Static text never changes, so render it once
+        self._title_img = render_text("HABITS", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        self._hint_img = render_text("P=Select L=Edit", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(128, 128, 128))
+        self._item_imgs = [
+            render_text(item["name"], Config.FONT_BOLD, Config.FONT_SIZE_NORMAL, color=(0, 128, 0))
+            if item.get("is_add_button")
+            else render_text(item["name"], Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
+            for item in self.menu_items
+        ]
+
+        # Sprites are invariant too
+        self._pointer = self.icons_sheet.get_sprite(*icons.POINTER_SMALL)
+        self._checked_box = self.icons_sheet.get_sprite(*icons.CHECKED_BOX_SMALL)
+        self._unchecked_box = self.icons_sheet.get_sprite(*icons.UNCHECKED_BOX_SMALL)
+        self._habit_icons = [self.icons_sheet.get_sprite(*habit["icon"]) for habit in self.habits]
+
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input - up/down to navigate, P to toggle or add, left to go back."""
         if not event.pressed:
             return None
 
+        self.dirty = True
+
         if event.input_type == InputType.UP:
             self.selected_index = (self.selected_index - 1) % len(self.menu_items)
         elif event.input_type == InputType.DOWN:
@@ -265,19 +393,17 @@ class HabitsScreen(ScreenBase):
 
     def render(self, buffer: Image.Image) -> None:
         """Render habits screen."""
-        draw = ImageDraw.Draw(buffer)
-
-        # White background
-        draw.rectangle([(0, 0), (128, 128)], fill=(255, 255, 255))
+        # White background (tuple paste is a plain fill, no draw dispatch)
+        buffer.paste((255, 255, 255), (0, 0, 128, 128))
 
         # Draw title
-        title_text = render_text("HABITS", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        title_text = self._title_img
         title_x = (128 - title_text.width) // 2
         buffer.paste(title_text, (title_x, 5), title_text)
 
         # Draw menu items (habits + add button)
         y_offset = 25
-        pointer = self.icons_sheet.get_sprite(*icons.POINTER_SMALL)
+        pointer = self._pointer
 
         for i, item in enumerate(self.menu_items):
             # Draw pointer if selected
@@ -287,43 +413,51 @@ class HabitsScreen(ScreenBase):
             # Check if this is the add button
             if item.get("is_add_button"):
                 # Draw "+" icon or text
-                plus_text = render_text(item["name"], Config.FONT_BOLD, Config.FONT_SIZE_NORMAL, color=(0, 128, 0))
+                plus_text = self._item_imgs[i]
                 buffer.paste(plus_text, (20, y_offset + 2), plus_text)
             else:
                 # Draw checkbox
-                if item["completed"]:
-                    checkbox = self.icons_sheet.get_sprite(*icons.CHECKED_BOX_SMALL)
-                else:
-                    checkbox = self.icons_sheet.get_sprite(*icons.UNCHECKED_BOX_SMALL)
+                checkbox = self._checked_box if item["completed"] else self._unchecked_box
                 buffer.paste(checkbox, (20, y_offset), checkbox)
 
                 # Draw habit icon
-                habit_icon = self.icons_sheet.get_sprite(*item["icon"])
+                habit_icon = self._habit_icons[i]
                 buffer.paste(habit_icon, (40, y_offset), habit_icon)
 
                 # Draw habit name
-                text = render_text(item["name"], Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
+                text = self._item_imgs[i]
                 buffer.paste(text, (60, y_offset + 4), text)
 
             y_offset += 16
 
         # Draw navigation hint
-        hint_text = render_text("P=Select L=Edit", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(128, 128, 128))
+        hint_text = self._hint_img
         buffer.paste(hint_text, (8, 112), hint_text)
 
 
 class StatsScreen(ScreenBase):
     """Stats screen showing character metrics with progress bars."""
 
+    # Only redrawn when dirty (input)
+    redraw_every_frame = False
+
     def __init__(self, db=None):
         """Initialize stats screen.
 
         Args:
             db: Database instance for loading stats (None for mock mode)
         """
+        super().__init__()
         self.db = db
-        self.icons_sheet = SpriteSheet(Config.ICONS_SPRITE_SHEET)
-        self.progress_sheet = SpriteSheet(Config.PROGRESS_BARS_SPRITE_SHEET)
+        self.icons_sheet = SpriteSheet.get(Config.ICONS_SPRITE_SHEET)
+        self.progress_sheet = SpriteSheet.get(Config.PROGRESS_BARS_SPRITE_SHEET)
+
+        # Progress bar sheets, keyed by ProgressBarInfo.sheet_name
+        self._bar_sheets = {'icons': self.icons_sheet, 'progress-bars': self.progress_sheet}
+
+        # Frame is assembled in NumPy: static layer + two progress bar blits
+        self._scratch = np.empty((128, 128, 3), dtype=np.uint8)
+        self._static_pixels = None
 
         # Character state (demo values that cycle)
         self.hunger = 50
@@ -335,6 +469,17 @@ class StatsScreen(ScreenBase):
         self.total_points = 0
         self.completion_rate = 0
 
+        # Static text never changes, so render it once
+        self._title_img = render_text("STATS", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        self._hunger_img = render_text("HUNGER", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(0, 0, 0))
+        self._happy_img = render_text("HAPPY", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(0, 0, 0))
+        self._hint_img = render_text("P=Cycle L/R=Nav", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(128, 128, 128))
+
+        # Stat text only changes when stats are reloaded
+        self._points_img = None
+        self._completion_img = None
+        self._breakdown_imgs = []
+
         # Load stats from database
         self._load_stats()
 
@@ -342,6 +487,7 @@ class StatsScreen(ScreenBase):
         """Load stats from database for past 7 days."""
         if self.db is None:
             # Mock data mode
+            self._render_stat_text()
             return
 
         # Get date range (past 7 days)
@@ -366,11 +512,26 @@ class StatsScreen(ScreenBase):
         else:
             self.completion_rate = 0
 
+        self._render_stat_text()
+
+    def _render_stat_text(self):
+        """Render the text derived from the loaded stats."""
+        self._points_img = render_text(f"Points: {self.total_points}", Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
+        self._completion_img = render_text(f"Done: {self.completion_rate:.0f}%", Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
+        self._breakdown_imgs = [
+            render_text(f"{stat['habit_name'][:8]} {stat['completed_count']}/{stat['total_days']}",
+                        Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(80, 80, 80))
+            for stat in self.completion_stats[:3]  # Top 3 habits, names truncated to 8 chars
+        ]
+        self._static_pixels = None  # Rebuild the static layer with the new text
+
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input - buttons cycle progress bars."""
         if not event.pressed:
             return None
 
+        self.dirty = True
+
         # Cycle progress bars on button press
         if event.input_type in [InputType.BUTTON_A, InputType.BUTTON_B, InputType.BUTTON_C]:
             self.hunger = (self.hunger + 10) % 110  # 0-100 cycling
@@ -391,66 +552,64 @@ class StatsScreen(ScreenBase):
         """Update stats screen."""
         pass
 
-    def render(self, buffer: Image.Image) -> None:
-        """Render stats screen."""
-        draw = ImageDraw.Draw(buffer)
+    def _compose_static_pixels(self) -> np.ndarray:
+        """Render everything except the progress bars into a pixel array.
 
-        # White background
-        draw.rectangle([(0, 0), (128, 128)], fill=(255, 255, 255))
+        The bars' opaque pixels don't overlap any text, so drawing them on
+        top of this layer matches drawing every layer in order.
+
+        Returns:
+            (128, 128, 3) uint8 RGB array
+        """
+        layer = Image.new("RGB", (128, 128), (255, 255, 255))
 
         # Draw title
-        title_text = render_text("STATS", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        title_text = self._title_img
         title_x = (128 - title_text.width) // 2
-        buffer.paste(title_text, (title_x, 5), title_text)
+        layer.paste(title_text, (title_x, 5), title_text)
 
         # Display stats
         stats_y = 25
 
         # Total points (past 7 days)
-        points_text = render_text(f"Points: {self.total_points}", Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
-        buffer.paste(points_text, (10, stats_y), points_text)
+        points_text = self._points_img
+        layer.paste(points_text, (10, stats_y), points_text)
 
         # Completion rate
-        completion_text = render_text(f"Done: {self.completion_rate:.0f}%", Config.FONT_REGULAR, Config.FONT_SIZE_NORMAL, color=(0, 0, 0))
-        buffer.paste(completion_text, (10, stats_y + 15), completion_text)
+        completion_text = self._completion_img
+        layer.paste(completion_text, (10, stats_y + 15), completion_text)
 
-        # Draw "HUNGER" label
-        hunger_text = render_text("HUNGER", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(0, 0, 0))
-        buffer.paste(hunger_text, (10, 55), hunger_text)
+        # Draw "HUNGER" and "HAPPY" labels (bars go at y=65 and y=90)
+        layer.paste(self._hunger_img, (10, 55), self._hunger_img)
+        layer.paste(self._happy_img, (10, 80), self._happy_img)
 
-        # Draw hunger progress bar
-        hunger_info = get_progress_bar_for_percentage(self.hunger)
-        if hunger_info.sheet_name == 'icons':
-            hunger_bar = self.icons_sheet.get_row(hunger_info.row)
-        else:
-            hunger_bar = self.progress_sheet.get_row(hunger_info.row)
-        buffer.paste(hunger_bar, (0, 65), hunger_bar)
+        # Habit breakdown (top 3 habits)
+        breakdown_y = 105
+        for habit_text in self._breakdown_imgs:
+            layer.paste(habit_text, (5, breakdown_y), habit_text)
+            breakdown_y += 8
 
-        # Draw "HAPPY" label
-        happy_text = render_text("HAPPY", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(0, 0, 0))
-        buffer.paste(happy_text, (10, 80), happy_text)
+        # Draw navigation hint
+        hint_text = self._hint_img
+        layer.paste(hint_text, (10, 112), hint_text)
 
-        # Draw happiness progress bar
-        happy_info = get_progress_bar_for_percentage(self.happiness)
-        if happy_info.sheet_name == 'icons':
-            happy_bar = self.icons_sheet.get_row(happy_info.row)
-        else:
-            happy_bar = self.progress_sheet.get_row(happy_info.row)
-        buffer.paste(happy_bar, (0, 90), happy_bar)
+        return np.array(layer)
 
-        # Habit breakdown (top 3 habits)
-        if self.completion_stats:
-            breakdown_y = 105
-            for i, stat in enumerate(self.completion_stats[:3]):
-                habit_name = stat['habit_name'][:8]  # Truncate to 8 chars
-                habit_text = render_text(f"{habit_name} {stat['completed_count']}/{stat['total_days']}",
-                                         Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(80, 80, 80))
-                buffer.paste(habit_text, (5, breakdown_y), habit_text)
-                breakdown_y += 8
+    def render(self, buffer: Image.Image) -> None:
+        """Render stats screen."""
+        if self._static_pixels is None:
+            self._static_pixels = self._compose_static_pixels()
 
-        # Draw navigation hint
-        hint_text = render_text("P=Cycle L/R=Nav", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(128, 128, 128))
-        buffer.paste(hint_text, (10, 112), hint_text)
+        scratch = self._scratch
+        np.copyto(scratch, self._static_pixels)
+
+        # Draw hunger and happiness progress bars straight into the array
+        for value, y in ((self.hunger, 65), (self.happiness, 90)):
+            info = get_progress_bar_for_percentage(value)
+            self._bar_sheets[info.sheet_name].blit_row_into(scratch, 0, y, info.row)
+
+        # Hand the finished frame to PIL once
+        buffer.paste(Image.frombuffer("RGB", (128, 128), scratch, "raw", "RGB", 0, 1), (0, 0))
 
 
 class SettingsScreen(ScreenBase):
@@ -458,7 +617,9 @@ class SettingsScreen(ScreenBase):
 
     def __init__(self):
         """Initialize settings screen."""
-        pass
+        super().__init__()
+        self._title_img = render_text("SETTINGS", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        self._hint_img = render_text("(Coming soon...)", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(128, 128, 128))
 
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input - just allow navigation back."""
@@ -476,13 +637,12 @@ class SettingsScreen(ScreenBase):
 
     def render(self, buffer: Image.Image) -> None:
         """Render placeholder settings screen."""
-        draw = ImageDraw.Draw(buffer)
-        draw.rectangle([(0, 0), (128, 128)], fill=(255, 255, 255))
+        buffer.paste((255, 255, 255), (0, 0, 128, 128))
 
-        title_text = render_text("SETTINGS", Config.FONT_BOLD, Config.FONT_SIZE_LARGE, color=(0, 0, 0))
+        title_text = self._title_img
         title_x = (128 - title_text.width) // 2
         buffer.paste(title_text, (title_x, 50), title_text)
 
-        hint_text = render_text("(Coming soon...)", Config.FONT_REGULAR, Config.FONT_SIZE_SMALL, color=(128, 128, 128))
+        hint_text = self._hint_img
         hint_x = (128 - hint_text.width) // 2
         buffer.paste(hint_text, (hint_x, 70), hint_text)
@@ -20,18 +20,48 @@ class SettingsScreen(ScreenBase):
 
     def __init__(self):
         """Initialize settings screen."""
+        super().__init__()
         # Convert background to RGB to avoid transparency overlay issues
         bg_rgba = Image.open(Config.SETTINGS_BG).convert("RGBA")
         self.background = Image.new("RGB", bg_rgba.size, (255, 255, 255))
         self.background.paste(bg_rgba, (0, 0), bg_rgba)
 
-        self.icons_sheet = SpriteSheet(Config.ICONS_SPRITE_SHEET, 16, 16)
+        self.icons_sheet = SpriteSheet.get(Config.ICONS_SPRITE_SHEET, 16, 16)
         self.selected_index = 0
 
         # Load font once
         from assets.sprite_loader import load_font
         self.font = load_font(Config.FONT_REGULAR, 8)  # Use size 8 instead of 6 for clarity
 
+        # Only the selection changes, so bake one full frame per selected item
+        pointer = self.icons_sheet.get_sprite(*icons.POINTER_SMALL)
+        self._pointer_flipped = pointer.transpose(Image.FLIP_LEFT_RIGHT)  # Point left
+        self._frames = [self._compose_frame(i) for i in range(len(self.MENU_ITEMS))]
+
+    def _compose_frame(self, selected_index: int) -> Image.Image:
+        """Render the background, menu items and pointer for one selection.
+
+        Args:
+            selected_index: Index of the highlighted menu item
+
+        Returns:
+            RGB image of the complete screen
+        """
+        frame = self.background.copy()
+        draw = ImageDraw.Draw(frame)
+
+        for i, item in enumerate(self.MENU_ITEMS):
+            y_pos = self.MENU_START_Y + (i * self.MENU_LINE_HEIGHT)
+
+            # Determine color (blue if selected, dark if not)
+            color = Config.COLOR_BLUE_HIGHLIGHT if i == selected_index else Config.COLOR_TEXT_DARK
+            draw.text((self.TEXT_X, y_pos), item, fill=color, font=self.font)
+
+            if i == selected_index:
+                frame.paste(self._pointer_flipped, (self.POINTER_X, y_pos - 6), self._pointer_flipped)
+
+        return frame
+
     def handle_input(self, event: InputEvent) -> Optional[str]:
         """Handle input - UP/DOWN navigate, BUTTON_A select, LEFT back."""
         if not event.pressed:
@@ -60,24 +90,4 @@ class SettingsScreen(ScreenBase):
 
     def render(self, buffer: Image.Image) -> None:
         """Render settings screen with menu and pointer."""
-        # Paste background (now RGB, no transparency issues)
-        buffer.paste(self.background, (0, 0))
-
-        # Draw directly on buffer
-        draw = ImageDraw.Draw(buffer)
-
-        # Draw menu items
-        for i, item in enumerate(self.MENU_ITEMS):
-            y_pos = self.MENU_START_Y + (i * self.MENU_LINE_HEIGHT)
-
-            # Determine color (blue if selected, dark if not)
-            color = Config.COLOR_BLUE_HIGHLIGHT if i == self.selected_index else Config.COLOR_TEXT_DARK
-
-            # Draw text directly on buffer
-            draw.text((self.TEXT_X, y_pos), item, fill=color, font=self.font)
-
-            # Draw pointer if selected (flip horizontally to point left)
-            if i == self.selected_index:
-                pointer = self.icons_sheet.get_sprite(*icons.POINTER_SMALL)
-                pointer_flipped = pointer.transpose(Image.FLIP_LEFT_RIGHT)
-                buffer.paste(pointer_flipped, (self.POINTER_X, y_pos - 6), pointer_flipped)
+        buffer.paste(self._frames[self.selected_index], (0, 0))
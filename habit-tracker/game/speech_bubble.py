@@ -1,7 +1,7 @@
 """Speech bubble widget for character dialogue."""
 
 from PIL import Image, ImageDraw
-from assets.sprite_loader import SpriteSheet, load_font
+from assets.sprite_loader import SpriteSheet, load_font, load_image, upscale2x
 from config import Config
 
 
@@ -18,15 +18,14 @@ class SpeechBubbleWidget:
     def __init__(self):
         """Initialize speech bubble widget."""
         # Load static bubble (64x64) and scale to 128x128
-        bubble_64 = Image.open(Config.SPEECH_BUBBLE_STATIC).convert("RGBA")
-        self.static_bubble = bubble_64.resize((128, 128), Image.NEAREST)
+        self.static_bubble = upscale2x(load_image(Config.SPEECH_BUBBLE_STATIC))
 
         # Load animation sprite sheet (5 frames, 64x64 each) and scale to 128x128
-        bubble_sheet_64 = SpriteSheet(Config.SPEECH_BUBBLE_ANIM_SHEET, 64, 64)
+        bubble_sheet_64 = SpriteSheet.get(Config.SPEECH_BUBBLE_ANIM_SHEET, 64, 64)
         self.anim_frames = []
         for i in range(5):
             frame_64 = bubble_sheet_64.get_sprite(i, 0)
-            frame_128 = frame_64.resize((128, 128), Image.NEAREST)
+            frame_128 = upscale2x(frame_64)
             self.anim_frames.append(frame_128)
 
         # Load font for text
@@ -39,6 +38,8 @@ class SpeechBubbleWidget:
 
         # Text state
         self.text = ""
+        self._needs_scroll = False
+        self._extended_text = ""  # Text as drawn; "text   text" when scrolling
         self.scroll_offset = 0
         self.scroll_timer = 0.0
         self.scroll_delay = 0.15  # Seconds between scroll steps
@@ -51,6 +52,9 @@ class SpeechBubbleWidget:
         """
         if self.state == "hidden":
             self.text = text
+            # Measure once; the text can't change while the bubble is up
+            self._needs_scroll = self.font.getlength(text) > self.TEXT_MAX_WIDTH
+            self._extended_text = text + "   " + text if self._needs_scroll else text
             self.state = "animating_in"
             self.current_frame = 4  # Start at end of animation (largest bubble)
             self.frame_timer = 0.0
@@ -144,10 +148,9 @@ class SpeechBubbleWidget:
         """Check if text should scroll.
 
         Returns:
-            True if text exceeds max width
+            True if text exceeds max width (measured in show())
         """
-        # Check if text exceeds visible character limit
-        return len(self.text) > self.MAX_CHARS_VISIBLE
+        return self._needs_scroll
 
     def _render_text(self, buffer: Image.Image):
         """Render text with scrolling if needed.
@@ -158,13 +161,12 @@ class SpeechBubbleWidget:
         draw = ImageDraw.Draw(buffer)
         # Anti-aliasing enabled for 12pt font readability
 
-        if self._should_scroll():
-            # Create scrolling text: "text   text"
-            extended_text = self.text + "   " + self.text
-            display_text = extended_text[self.scroll_offset:self.scroll_offset + self.MAX_CHARS_VISIBLE]
+        if self._needs_scroll:
+            # Window into the looping "text   text" string
+            display_text = self._extended_text[self.scroll_offset:self.scroll_offset + self.MAX_CHARS_VISIBLE]
         else:
-            # Truncate to max visible chars
-            display_text = self.text[:self.MAX_CHARS_VISIBLE]
+            # Fits within TEXT_MAX_WIDTH as-is
+            display_text = self._extended_text
 
         # Draw text at specified position
         draw.text(
@@ -41,6 +41,7 @@ class TextInputWidget:
         self.active = False
         self.cursor_blink_timer = 0
         self.show_cursor = True
+        self._draw = None  # ImageDraw reused while render() gets the same buffer
 
     def activate(self) -> None:
         """Activate the widget for input."""
@@ -175,8 +176,11 @@ class TextInputWidget:
         # Load font for text rendering
         font = load_font(Config.FONT_REGULAR, 8)
 
-        # Draw typed text with cursor at absolute position x=12, y=47
-        draw = ImageDraw.Draw(buffer)
+        # Draw typed text with cursor at absolute position x=12, y=47.
+        # The screen hands in the same buffer every frame, so keep its draw.
+        draw = self._draw
+        if draw is None or draw.im is not buffer.im:
+            draw = self._draw = ImageDraw.Draw(buffer)
 
         # Text box bounds: x=12 to x=113 (101px wide)
         TEXT_BOX_START = 12
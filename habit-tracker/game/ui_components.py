@@ -1,5 +1,6 @@
 """UI component drawing helpers using PIL ImageDraw."""
 
+from typing import Optional
 from PIL import Image, ImageDraw
 from assets.sprite_loader import render_text
 from config import Config
@@ -102,13 +103,16 @@ def draw_button_hint(buffer: Image.Image, x: int, y: int, text: str) -> None:
     buffer.paste(hint_img, (x, y), hint_img)
 
 
-def draw_divider(buffer: Image.Image, y: int, color: tuple = (128, 128, 128)) -> None:
+def draw_divider(buffer: Image.Image, y: int, color: tuple = (128, 128, 128),
+                 draw: Optional[ImageDraw.ImageDraw] = None) -> None:
     """Draw a horizontal divider line across the screen.
 
     Args:
         buffer: PIL Image to draw on
         y: Y position for line
         color: Line color (default: gray)
+        draw: Existing ImageDraw for buffer to reuse (created if None)
     """
-    draw = ImageDraw.Draw(buffer)
+    if draw is None:
+        draw = ImageDraw.Draw(buffer)
     draw.line((0, y, 128, y), fill=color, width=1)
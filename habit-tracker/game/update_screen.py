@@ -2,7 +2,7 @@
 
 import subprocess
 import sys
-from PIL import Image, ImageDraw
+from PIL import Image
 from typing import Optional
 from input.input_base import InputEvent, InputType
 from game.screens import ScreenBase
@@ -37,6 +37,7 @@ class UpdateScreen(ScreenBase):
 
     def __init__(self):
         """Initialize update screen."""
+        super().__init__()
         # Load background and button sprites
         self.bg_sprite = Image.open(Config.UPDATE_POPUP_BG).convert("RGBA")
         self.ok_highlighted = Image.open(Config.POPUP_OK_HIGHLIGHTED).convert("RGBA")
@@ -308,7 +309,7 @@ class UpdateScreen(ScreenBase):
         buffer.paste(self.bg_sprite, (0, 0), self.bg_sprite)
 
         # Draw message text with wrapping and auto-centering
-        draw = ImageDraw.Draw(buffer)
+        draw = self._get_draw(buffer)
 
         # Wrap text to fit within TEXT_X to TEXT_MAX_X
         lines = self._wrap_text(self.message)
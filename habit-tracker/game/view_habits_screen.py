@@ -1,6 +1,6 @@
 """View Habits screen showing habit list with NEW HABIT button."""
 
-from PIL import Image, ImageDraw
+from PIL import Image
 from typing import Optional
 from game.screens import ScreenBase
 from input.input_base import InputEvent, InputType
@@ -32,6 +32,7 @@ class ViewHabitsScreen(ScreenBase):
         Args:
             db: Database instance for loading habits
         """
+        super().__init__()
         # Convert background RGBA to RGB to avoid transparency overlay
         bg_rgba = Image.open(Config.HABIT_SETTINGS_BG).convert("RGBA")
         self.background = Image.new("RGB", bg_rgba.size, (255, 255, 255))
@@ -42,10 +43,10 @@ class ViewHabitsScreen(ScreenBase):
         self.button_highlighted = Image.open(Config.NEW_HABIT_BUTTON_HIGHLIGHTED).convert('RGBA')
 
         # Load icons
-        self.icons_sheet = SpriteSheet(Config.ICONS_SPRITE_SHEET, 16, 16)
+        self.icons_sheet = SpriteSheet.get(Config.ICONS_SPRITE_SHEET, 16, 16)
 
         # Load highlighted-checkboxes sprite sheet for the shorter pointer
-        self.highlight_sheet = SpriteSheet(Config.HIGHLIGHTED_CHECKBOXES, 16, 16)
+        self.highlight_sheet = SpriteSheet.get(Config.HIGHLIGHTED_CHECKBOXES, 16, 16)
 
         # Load font
         self.font = load_font(Config.FONT_REGULAR, 8)
@@ -81,7 +82,7 @@ class ViewHabitsScreen(ScreenBase):
         self.habits = []
         for h in db_habits:
             # Parse recurrence into freq_num and freq_period
-            recurrence = h.get('recurrence', 'daily')
+            recurrence = h.recurrence or 'daily'
             if '/' in recurrence:
                 parts = recurrence.split('/')
                 freq_num = int(parts[0])
@@ -92,12 +93,12 @@ class ViewHabitsScreen(ScreenBase):
                 freq_period = "day"
 
             self.habits.append({
-                "id": h['id'],
-                "name": h['name'],
-                "points": h['points_per'],
+                "id": h.id,
+                "name": h.name,
+                "points": h.points_per,
                 "freq_num": freq_num,
                 "freq_period": freq_period,
-                "active": bool(h['active']),
+                "active": bool(h.active),
                 "reminder": False  # TODO: Add reminder field to DB
             })
 
@@ -207,7 +208,7 @@ class ViewHabitsScreen(ScreenBase):
             buffer.paste(self.button_normal, (0, 0), self.button_normal)
 
         # Draw directly on buffer
-        draw = ImageDraw.Draw(buffer)
+        draw = self._get_draw(buffer)
         draw.fontmode = '1'  # CRITICAL: Disable anti-aliasing for pixel-perfect text
 
         # Draw habit list
@@ -6,6 +6,7 @@ except (ImportError, RuntimeError):
     # Fallback for non-Pi environments (testing, development)
     GPIO = None
 
+import threading
 from .input_base import InputBase, InputEvent, InputType
 
 
@@ -57,6 +58,17 @@ class GPIOInput(InputBase):
         for pin in self.pin_map.keys():
             self.prev_state[pin] = GPIO.input(pin)
 
+        # Set from the GPIO edge-callback thread so wait() can sleep until
+        # a pin changes; falls back to plain sleeping if the kernel refuses
+        # edge detection
+        self._edge = threading.Event()
+        self._has_edge_detect = True
+        try:
+            for pin in self.pin_map.keys():
+                GPIO.add_event_detect(pin, GPIO.BOTH, callback=self._on_edge)
+        except RuntimeError:
+            self._has_edge_detect = False
+
     def poll(self) -> InputEvent | None:
         """Poll for GPIO input events.
 
@@ -87,6 +99,23 @@ class GPIOInput(InputBase):
 
         return None
 
+    def _on_edge(self, channel: int) -> None:
+        """GPIO callback: note that a pin changed."""
+        self._edge.set()
+
+    def wait(self, timeout: float) -> None:
+        """Block until a pin changes or the timeout elapses.
+
+        Args:
+            timeout: Maximum time to block in seconds
+        """
+        if not self._has_edge_detect:
+            super().wait(timeout)
+            return
+
+        self._edge.wait(timeout)
+        self._edge.clear()
+
     def cleanup(self):
         """Clean up GPIO resources."""
         if GPIO is not None:
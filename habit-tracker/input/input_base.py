@@ -1,5 +1,6 @@
 """Base classes and types for input handling."""
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -44,3 +45,15 @@ class InputBase(ABC):
             InputEvent if an event occurred, None otherwise.
         """
         pass
+
+    def wait(self, timeout: float) -> None:
+        """Block until input may be available or the timeout elapses.
+
+        Used by the game loop to idle cheaply on static screens. The
+        default just sleeps; implementations that can wake on input
+        should override it. Events must be left for poll() to return.
+
+        Args:
+            timeout: Maximum time to block in seconds
+        """
+        time.sleep(timeout)
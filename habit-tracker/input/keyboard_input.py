@@ -16,7 +16,9 @@ class KeyboardInput(InputBase):
 
     def __init__(self):
         """Initialize keyboard input handler."""
-        pygame.init()
+        # Keyboard events come from the video subsystem; no-op if the
+        # display already initialized it
+        pygame.display.init()
 
         # Map pygame key constants to InputType
         self.key_map = {
@@ -32,13 +34,21 @@ class KeyboardInput(InputBase):
             pygame.K_m: InputType.BUTTON_C,
         }
 
+        # Event that woke wait(), handed to the next poll() ahead of the queue
+        self._pending_event = None
+
     def poll(self) -> InputEvent | None:
         """Poll for keyboard events.
 
         Returns:
             InputEvent if a mapped key was pressed/released, None otherwise.
         """
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self._pending_event is not None:
+            events.insert(0, self._pending_event)
+            self._pending_event = None
+
+        for event in events:
             # Handle quit event
             if event.type == pygame.QUIT:
                 return InputEvent(input_type=InputType.QUIT, pressed=True)
@@ -58,3 +68,18 @@ class KeyboardInput(InputBase):
                     )
 
         return None
+
+    def wait(self, timeout: float) -> None:
+        """Block until a pygame event arrives or the timeout elapses.
+
+        Args:
+            timeout: Maximum time to block in seconds
+        """
+        if self._pending_event is not None:
+            return
+
+        event = pygame.event.wait(int(timeout * 1000))
+        if event.type != pygame.NOEVENT:
+            # Keep it for poll() rather than re-posting, which would put it
+            # behind anything queued since and reorder presses/releases
+            self._pending_event = event
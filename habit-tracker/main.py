@@ -14,6 +14,7 @@ from game.update_screen import UpdateScreen
 from game.about_screen import AboutScreen
 from config import Config
 from data.db import Database
+from assets.sprite_loader import SpriteSheet
 
 
 def is_raspberry_pi() -> bool:
@@ -54,6 +55,13 @@ def main():
     # Initialize database
     db = Database("habit_tracker.db")
 
+    # Decode shared sprite sheets before the first frame
+    SpriteSheet.preload_all([
+        Config.ICONS_SPRITE_SHEET,
+        Config.PROGRESS_BARS_SPRITE_SHEET,
+        Config.HIGHLIGHTED_CHECKBOXES,
+    ])
+
     # Create screens
     screens = {
         "home": HomeScreen(),
@@ -89,6 +97,7 @@ def main():
     except KeyboardInterrupt:
         print("\nShutting down...")
     finally:
+        app.close_screens()
         if hasattr(input_handler, 'cleanup'):
             input_handler.cleanup()
         db.close()
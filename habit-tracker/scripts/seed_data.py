@@ -16,64 +16,42 @@ def seed_database(db_path: str = "habit_tracker.db"):
 
     print("Seeding database with sample data...")
 
-    # Add sample habits
-    gym_id = db.add_habit(
-        name="GYM",
-        habit_type="binary",
-        points_per=8,
-        category="good",
-        recurrence="4/week"
-    )
-    print(f"Added habit: GYM (id={gym_id})")
-
-    water_id = db.add_habit(
-        name="WATER",
-        habit_type="incremental",
-        points_per=1,
-        category="good",
-        recurrence="8/day"
-    )
-    print(f"Added habit: WATER (id={water_id})")
-
-    vitamins_id = db.add_habit(
-        name="VITAMINS",
-        habit_type="binary",
-        points_per=2,
-        category="good",
-        recurrence="1/day"
-    )
-    print(f"Added habit: VITAMINS (id={vitamins_id})")
-
-    meditation_id = db.add_habit(
-        name="MEDITATE",
-        habit_type="binary",
-        points_per=5,
-        category="good",
-        recurrence="1/day"
-    )
-    print(f"Added habit: MEDITATE (id={meditation_id})")
-
-    # Add logs for past 7 days
+    # Add sample habits (written in one transaction)
+    habits = [
+        ("GYM", "binary", 8, "good", None, 60, "4/week"),
+        ("WATER", "incremental", 1, "good", None, 60, "8/day"),
+        ("VITAMINS", "binary", 2, "good", None, 60, "1/day"),
+        ("MEDITATE", "binary", 5, "good", None, 60, "1/day"),
+    ]
+    habit_ids = db.add_habits_bulk(habits)
+    for habit, habit_id in zip(habits, habit_ids):
+        print(f"Added habit: {habit[0]} (id={habit_id})")
+    gym_id, water_id, vitamins_id, meditation_id = habit_ids
+
+    # Add logs for past 7 days (written in one transaction)
     today = datetime.now()
+    logs = []
 
     for i in range(7):
         date = (today - timedelta(days=i)).strftime("%Y-%m-%d")
 
         # Gym: completed 4/7 days
         if i % 2 == 0:
-            db.log_habit_completion(gym_id, date, completed=True, points_earned=8)
+            logs.append((gym_id, date, True, False, 0, 8))
 
         # Water: completed daily with varying amounts
         quantity = 5 + (i % 3)
-        db.log_habit_completion(water_id, date, completed=True, quantity=quantity, points_earned=quantity)
+        logs.append((water_id, date, True, False, quantity, quantity))
 
         # Vitamins: missed 2 days
         if i not in [1, 4]:
-            db.log_habit_completion(vitamins_id, date, completed=True, points_earned=2)
+            logs.append((vitamins_id, date, True, False, 0, 2))
 
         # Meditation: completed 5/7 days
         if i not in [2, 5]:
-            db.log_habit_completion(meditation_id, date, completed=True, points_earned=5)
+            logs.append((meditation_id, date, True, False, 0, 5))
+
+    db.log_habit_completions_bulk(logs)
 
     print(f"Added 7 days of logs for {4} habits")
     print("Database seeded successfully!")
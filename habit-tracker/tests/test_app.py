@@ -47,3 +47,68 @@ def test_app_frame_time_calculation():
     assert app._frame_time == 0.05
 
     display.close()
+
+
+def test_app_skips_render_for_clean_static_screen():
+    """Test that static screens are only redrawn while dirty."""
+    from PIL import Image
+    from display.display_base import DisplayBase
+    from game.screens import ScreenBase
+
+    class CountingDisplay(DisplayBase):
+        def __init__(self):
+            super().__init__(128, 128)
+            self.updates = 0
+            self._buffer = Image.new('RGB', (128, 128))
+
+        def get_buffer(self):
+            return self._buffer
+
+        def update(self, buffer):
+            self.updates += 1
+
+        def close(self):
+            pass
+
+    class StaticScreen(ScreenBase):
+        redraw_every_frame = False
+
+        def handle_input(self, event):
+            return None
+
+        def update(self, delta_time):
+            pass
+
+        def render(self, buffer):
+            pass
+
+    display = CountingDisplay()
+    screen = StaticScreen()
+    app = App(display=display, input_handler=None, screens={"home": screen})
+
+    app._render()
+    app._render()
+    assert display.updates == 1
+
+    screen.dirty = True
+    app._render()
+    assert display.updates == 2
+
+
+def test_app_does_not_dispatch_release_events():
+    """Test that key releases never reach the current screen."""
+    from unittest.mock import Mock
+    from input.input_base import InputEvent, InputType
+
+    screen = Mock()
+    screen.handle_input.return_value = None
+    input_handler = Mock()
+    app = App(display=None, input_handler=input_handler, screens={"home": screen})
+
+    input_handler.poll.return_value = InputEvent(InputType.BUTTON_A, pressed=False)
+    app._handle_input()
+    screen.handle_input.assert_not_called()
+
+    input_handler.poll.return_value = InputEvent(InputType.BUTTON_A, pressed=True)
+    app._handle_input()
+    screen.handle_input.assert_called_once()
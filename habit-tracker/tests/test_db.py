@@ -46,6 +46,38 @@ def test_database_initialization(temp_db):
     assert cursor.fetchone() is not None
 
 
+def test_database_creates_indexes(temp_db):
+    """Test that query indexes are created with the schema."""
+    cursor = temp_db.conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    index_names = {row[0] for row in cursor.fetchall()}
+
+    assert "idx_logs_date" in index_names
+    assert "idx_habits_active" in index_names
+
+
+def test_database_uses_wal_journal(temp_db):
+    """Test that the connection is configured for WAL journaling."""
+    cursor = temp_db.conn.cursor()
+    cursor.execute("PRAGMA journal_mode")
+    assert cursor.fetchone()[0] == "wal"
+
+    cursor.execute("PRAGMA synchronous")
+    assert cursor.fetchone()[0] == 1  # NORMAL
+
+
+def test_schema_version_stored_in_user_version(temp_db):
+    """Test that the schema version lives in PRAGMA user_version."""
+    from data.migrations import CURRENT_SCHEMA_VERSION
+
+    cursor = temp_db.conn.cursor()
+    cursor.execute("PRAGMA user_version")
+    assert cursor.fetchone()[0] == CURRENT_SCHEMA_VERSION
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE name = 'schema_version'")
+    assert cursor.fetchone() is None
+
+
 def test_add_habit(temp_db):
     """Test adding a habit to the database."""
     habit_id = temp_db.add_habit(
@@ -101,6 +133,26 @@ def test_save_and_load_character_state(temp_db):
     assert loaded_state['last_updated'] == '2026-01-30T10:30:00'
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_character_state_codecs_agree(temp_db, monkeypatch, use_orjson):
+    """Test that the orjson fast path and the json fallback round-trip alike."""
+    import data.db
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(data.db, "orjson", None)
+
+    temp_db.save_character_state({'hunger': 75, 'streaks': {1: 3, 2: 0}})
+
+    cursor = temp_db.conn.cursor()
+    cursor.execute("SELECT state_json FROM character_state WHERE id = 1")
+    assert isinstance(cursor.fetchone()[0], str)
+
+    # Non-str keys come back as strings with either codec
+    assert temp_db.load_character_state() == {'hunger': 75, 'streaks': {'1': 3, '2': 0}}
+
+
 def test_update_habit(temp_db):
     """Test updating an existing habit."""
     # Create initial habit
@@ -131,6 +183,43 @@ def test_update_habit(temp_db):
     assert updated['active'] == 0  # SQLite stores bool as int
 
 
+def test_save_habit_upsert(temp_db):
+    """Test that save_habit creates a habit, then updates it in place."""
+    habit_id = temp_db.save_habit(None, "Gym", "binary", 8, "good", recurrence="4/week")
+    created = temp_db.get_habit_by_id(habit_id)
+    assert created.name == "Gym"
+    assert created.active == 1
+
+    assert temp_db.save_habit(habit_id, "Gym Updated", "binary", 10, "good", active=False) == habit_id
+
+    habits = temp_db.get_all_habits(active_only=False)
+    assert len(habits) == 1
+    updated = habits[0]
+    assert updated.name == "Gym Updated"
+    assert updated.points_per == 10
+    assert updated.recurrence == "daily"
+    assert updated.active == 0
+    assert updated.created_at == created.created_at
+
+
+def test_save_habit_new_habit_starts_active(temp_db):
+    """Test that creating through save_habit keeps add_habit's active default."""
+    habit_id = temp_db.save_habit(None, "Gym", "binary", 8, "good", active=False)
+    assert temp_db.get_habit_by_id(habit_id).active == 1
+
+
+def test_add_habits_bulk(temp_db):
+    """Test adding several habits in one transaction."""
+    ids = temp_db.add_habits_bulk([
+        ("Gym", "binary", 8, "good", None, 60, "4/week"),
+        ("Water", "incremental", 1, "good", None, 60, "8/day"),
+    ])
+
+    habits = temp_db.get_all_habits()
+    assert [h.id for h in habits] == ids
+    assert [h.name for h in habits] == ["Gym", "Water"]
+
+
 def test_delete_habit(temp_db):
     """Test deleting a habit."""
     # Create habit
@@ -153,6 +242,127 @@ def test_delete_habit(temp_db):
     assert len(habits) == 0
 
 
+def test_delete_habit_cascades_to_logs(temp_db):
+    """Test that deleting a habit also deletes its logs."""
+    gym_id = temp_db.add_habit("Gym", "binary", 8, "good")
+    water_id = temp_db.add_habit("Water", "incremental", 1, "good")
+    temp_db.log_habit_completion(gym_id, "2026-02-01", completed=True, points_earned=8)
+    temp_db.log_habit_completion(water_id, "2026-02-01", completed=True, quantity=2, points_earned=2)
+
+    temp_db.delete_habit(gym_id)
+
+    assert temp_db.get_habit_logs(gym_id) == []
+    assert len(temp_db.get_habit_logs(water_id)) == 1
+
+
+def test_migration_adds_cascade_to_existing_logs_table():
+    """Test that a v2 database is migrated to cascading log deletes."""
+    import sqlite3
+
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    # Build a v2 database with the old, non-cascading foreign key
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE habits (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            points_per INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            target_time TEXT,
+            grace_period INTEGER DEFAULT 60,
+            recurrence TEXT DEFAULT 'daily',
+            active INTEGER DEFAULT 1,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE habit_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            habit_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            completed INTEGER DEFAULT 0,
+            skipped INTEGER DEFAULT 0,
+            quantity INTEGER DEFAULT 0,
+            points_earned INTEGER DEFAULT 0,
+            logged_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (habit_id) REFERENCES habits (id),
+            UNIQUE(habit_id, date)
+        );
+        CREATE TABLE schema_version (
+            version INTEGER PRIMARY KEY,
+            applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO schema_version (version) VALUES (1), (2);
+        INSERT INTO habits (name, type, points_per, category) VALUES ('Gym', 'binary', 8, 'good');
+        INSERT INTO habit_logs (habit_id, date, completed) VALUES (1, '2026-02-01', 1);
+    """)
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    try:
+        cursor = db.conn.cursor()
+        cursor.execute("PRAGMA foreign_key_list(habit_logs)")
+        assert cursor.fetchone()['on_delete'] == "CASCADE"
+
+        # Legacy schema_version table is picked up and superseded
+        cursor.execute("PRAGMA user_version")
+        assert cursor.fetchone()[0] == 3
+
+        # Existing logs survive the rebuild and now cascade
+        assert len(db.get_habit_logs(1)) == 1
+        db.delete_habit(1)
+        assert db.get_habit_logs(1) == []
+    finally:
+        db.close()
+        os.unlink(path)
+
+
+def test_migration_002_fixes_multi_count_daily_habits(temp_db):
+    """Test that binary N/day habits with N > 1 become incremental."""
+    from data.migrations import migration_002
+
+    once_id = temp_db.add_habit("Gym", "binary", 8, "good", recurrence="1/day")
+    multi_id = temp_db.add_habit("Water", "binary", 1, "good", recurrence="3/day")
+    weekly_id = temp_db.add_habit("Run", "binary", 5, "good", recurrence="3/week")
+
+    migration_002(temp_db.conn)
+
+    assert temp_db.get_habit_by_id(once_id).type == "binary"
+    assert temp_db.get_habit_by_id(multi_id).type == "incremental"
+    assert temp_db.get_habit_by_id(weekly_id).type == "binary"
+
+
+def test_failed_migration_rolls_back_all_pending_steps():
+    """Test that pending migrations commit or roll back as one unit."""
+    import sqlite3
+    from data import migrations
+
+    def add_table(conn):
+        conn.execute("CREATE TABLE scratch (id INTEGER)")
+
+    def fail(conn):
+        raise sqlite3.OperationalError("boom")
+
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    original = migrations.MIGRATIONS
+    migrations.MIGRATIONS = [(1, "Add scratch", add_table), (2, "Fail", fail)]
+    try:
+        try:
+            migrations.run_migrations(conn)
+            assert False, "expected the failing migration to raise"
+        except sqlite3.OperationalError:
+            pass
+
+        assert migrations.get_schema_version(conn) == 0
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE name = 'scratch'")
+        assert cursor.fetchone() is None
+    finally:
+        migrations.MIGRATIONS = original
+        conn.close()
+
+
 def test_get_habit_by_id(temp_db):
     """Test retrieving a single habit by ID."""
     # Create habit
@@ -204,6 +414,46 @@ def test_get_habit_logs(temp_db):
     assert logs[2]['skipped'] == 1
 
 
+def test_rows_are_slotted_records(temp_db):
+    """Test that habits and logs come back as attribute records."""
+    from data import Habit, HabitLog
+
+    habit_id = temp_db.add_habit("Gym", "binary", 8, "good", recurrence="3/week")
+    temp_db.log_habit_completion(habit_id, "2026-02-01", completed=True, points_earned=8)
+
+    habit = temp_db.get_habit_by_id(habit_id)
+    assert isinstance(habit, Habit)
+    assert not hasattr(habit, '__dict__')
+    assert habit.name == "Gym"
+    assert habit['points_per'] == 8
+    assert habit.get('recurrence') == "3/week"
+    assert habit.get('missing', 'default') == 'default'
+
+    log = temp_db.get_logs_for_date("2026-02-01")[0]
+    assert isinstance(log, HabitLog)
+    assert log.habit_id == habit_id
+    assert log['points_earned'] == 8
+
+
+def test_log_habit_completions_bulk(temp_db):
+    """Test logging several completions in one call."""
+    gym_id = temp_db.add_habit("Gym", "binary", 8, "good")
+    water_id = temp_db.add_habit("Water", "incremental", 1, "good")
+
+    temp_db.log_habit_completions_bulk([
+        (gym_id, "2026-02-01", True, False, 1, 8),
+        (water_id, "2026-02-01", True, False, 4, 4),
+        (water_id, "2026-02-02", False, True, 0, 0),
+    ])
+
+    logs = temp_db.get_habit_logs(water_id)
+    assert len(logs) == 2
+    assert logs[0]['quantity'] == 4
+    assert logs[1]['skipped'] == 1
+
+    assert len(temp_db.get_logs_for_date("2026-02-01")) == 2
+
+
 def test_get_logs_for_date(temp_db):
     """Test retrieving all habit logs for a specific date."""
     # Create multiple habits
@@ -271,3 +521,80 @@ def test_get_completion_stats(temp_db):
     assert water_stat['habit_name'] == "Water"
     assert water_stat['completed_count'] == 1
     assert water_stat['total_days'] == 2  # Only 2 logs exist
+
+
+def test_get_completion_stats_includes_habits_without_logs(temp_db):
+    """Test that habits with no logs in range are reported with zero counts."""
+    gym_id = temp_db.add_habit("Gym", "binary", 8, "good")
+    read_id = temp_db.add_habit("Read", "binary", 5, "good")
+
+    temp_db.log_habit_completion(gym_id, "2026-02-01", completed=True, points_earned=8)
+    temp_db.log_habit_completion(read_id, "2026-01-01", completed=True, points_earned=5)
+
+    stats = temp_db.get_completion_stats(start_date="2026-02-01", end_date="2026-02-03")
+
+    assert len(stats) == 2
+    read_stat = next(s for s in stats if s['habit_id'] == read_id)
+    assert read_stat['completed_count'] == 0
+    assert read_stat['total_days'] == 0
+
+
+def test_database_usable_from_other_thread(temp_db):
+    """Test that the shared connection can be used from a worker thread."""
+    import threading
+
+    habit_id = temp_db.add_habit("Gym", "binary", 8, "good")
+    errors = []
+
+    def worker():
+        try:
+            temp_db.log_habit_completion(habit_id, "2026-02-01", completed=True, points_earned=8)
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert errors == []
+    assert len(temp_db.get_logs_for_date("2026-02-01")) == 1
+
+
+def test_get_habit_logs_bulk(temp_db):
+    """Test fetching logs for several habits in one call."""
+    gym_id = temp_db.add_habit("Gym", "binary", 8, "good")
+    water_id = temp_db.add_habit("Water", "incremental", 1, "good")
+    other_id = temp_db.add_habit("Read", "binary", 5, "good")
+
+    temp_db.log_habit_completions_bulk([
+        (gym_id, "2026-01-29", True, False, 1, 8),
+        (gym_id, "2026-01-31", True, False, 1, 8),
+        (water_id, "2026-01-30", True, False, 3, 3),
+        (water_id, "2026-02-01", True, False, 4, 4),  # Outside the range
+        (other_id, "2026-01-30", True, False, 1, 5),  # Not requested
+    ])
+
+    logs = temp_db.get_habit_logs_bulk([gym_id, water_id], "2026-01-29", "2026-01-31")
+
+    assert [(log.habit_id, log.date) for log in logs] == [
+        (gym_id, "2026-01-29"),
+        (gym_id, "2026-01-31"),
+        (water_id, "2026-01-30"),
+    ]
+    assert temp_db.get_habit_logs_bulk([], "2026-01-29", "2026-01-31") == []
+
+
+def test_log_habit_completion_updates_in_place(temp_db):
+    """Test that re-logging the same day updates the existing row."""
+    habit_id = temp_db.add_habit("Water", "incremental", 1, "good")
+
+    temp_db.log_habit_completion(habit_id, "2026-01-30", completed=True, quantity=2, points_earned=2)
+    first = temp_db.get_logs_for_date("2026-01-30")[0]
+
+    temp_db.log_habit_completion(habit_id, "2026-01-30", completed=True, quantity=5, points_earned=5)
+    logs = temp_db.get_logs_for_date("2026-01-30")
+
+    assert len(logs) == 1
+    assert logs[0].id == first.id
+    assert logs[0].quantity == 5
+    assert logs[0].points_earned == 5
@@ -93,3 +93,30 @@ def test_display_name_truncation():
     # Another long name
     screen.name = "MEDITATION"
     assert screen._get_display_name() == "TATION"  # Last 6 chars of "MEDITATION"
+
+
+def test_dirty_flag_tracks_input_and_scrolling():
+    """Test that the screen only asks for redraws when something changed."""
+    screen = EditHabitScreen(None, habit_data={"name": "DRINK WATER"})
+    screen.dirty = False
+
+    # Marquee steps at scroll_delay, not every frame
+    screen.update(screen.scroll_delay / 2)
+    assert screen.dirty is False
+    screen.update(screen.scroll_delay / 2)
+    assert screen.dirty is True
+    assert screen.has_animations() is True
+
+    screen.dirty = False
+    screen.handle_input(InputEvent(InputType.DOWN, pressed=True))
+    assert screen.dirty is True
+    assert screen.has_animations() is False
+
+
+def test_screen_has_no_instance_dict():
+    """Test that __slots__ covers every attribute, so no __dict__ is allocated."""
+    screen = EditHabitScreen(None, habit_data={"name": "DRINK WATER"})
+    assert not hasattr(screen, "__dict__")
+
+    with pytest.raises(AttributeError):
+        screen.not_a_field = 1
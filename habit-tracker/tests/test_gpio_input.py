@@ -138,3 +138,20 @@ def test_gpio_input_poll_button_release(mock_gpio):
     assert event is not None
     assert event.input_type == InputType.BUTTON_A
     assert event.pressed is False
+
+
+@patch('input.gpio_input.GPIO')
+def test_gpio_input_wait_wakes_on_edge(mock_gpio):
+    """Test that wait() returns as soon as an edge callback fires."""
+    import time
+
+    input_handler = GPIOInput()
+
+    # Edge detection registered on every pin
+    assert mock_gpio.add_event_detect.call_count == len(input_handler.pin_map)
+    callback = mock_gpio.add_event_detect.call_args[1]['callback']
+
+    callback(21)
+    start = time.monotonic()
+    input_handler.wait(5.0)
+    assert time.monotonic() - start < 1.0
@@ -78,3 +78,94 @@ def test_habit_checker_checkbox_mode(habit_checker_screen):
     # Exit checkbox mode
     habit_checker_screen.handle_input(InputEvent(InputType.BUTTON_B, True))
     assert habit_checker_screen.checkbox_mode is False
+
+
+def test_habit_checker_loads_logs_from_db(tmp_path):
+    """Test that the screen builds against a real database and reads its logs."""
+    from datetime import date
+    from data.db import Database
+
+    db = Database(str(tmp_path / "habits.db"))
+    habit_id = db.add_habit("Gym", "binary", 8, "good")
+    db.log_habit_completion(habit_id, date.today().isoformat(), completed=True, points_earned=8)
+
+    screen = HabitCheckerScreen(db)
+
+    assert len(screen.habits) == 1
+    assert screen.habits[0]["checks"] == [False, False, True]
+
+    screen.reload_habits()
+    assert screen.habits[0]["checks"] == [False, False, True]
+
+    db.close()
+
+
+def test_habit_checker_batches_checkbox_writes(tmp_path):
+    """Test that toggles are queued and written together on leaving the screen."""
+    from data.db import Database
+
+    db = Database(str(tmp_path / "habits.db"))
+    habit_id = db.add_habit("Gym", "binary", 8, "good")
+    screen = HabitCheckerScreen(db)
+
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Enter checkbox mode
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Check today
+    assert db.get_habit_logs(habit_id) == []
+
+    screen.handle_input(InputEvent(InputType.BUTTON_B, True))  # Exit checkbox mode
+    assert screen.handle_input(InputEvent(InputType.LEFT, True)) == "menu"
+
+    logs = db.get_habit_logs(habit_id)
+    assert len(logs) == 1
+    assert logs[0].completed == 1
+    assert logs[0].points_earned == 8
+
+    db.close()
+
+
+def test_habit_checker_flushes_on_close(tmp_path):
+    """Test that close() writes toggles still queued at shutdown."""
+    from data.db import Database
+
+    db = Database(str(tmp_path / "habits.db"))
+    habit_id = db.add_habit("Gym", "binary", 8, "good")
+    screen = HabitCheckerScreen(db)
+
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Enter checkbox mode
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Check today
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Uncheck today
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Check today again
+    assert db.get_habit_logs(habit_id) == []
+
+    screen.close()
+
+    # Only the latest state per (habit, date) is written
+    logs = db.get_habit_logs(habit_id)
+    assert len(logs) == 1
+    assert logs[0].completed == 1
+
+    db.close()
+
+
+def test_habit_checker_flushes_after_idle_delay(tmp_path):
+    """Test that queued toggles are written once toggling pauses for FLUSH_DELAY."""
+    from data.db import Database
+
+    db = Database(str(tmp_path / "habits.db"))
+    habit_id = db.add_habit("Gym", "binary", 8, "good")
+    screen = HabitCheckerScreen(db)
+
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Enter checkbox mode
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Check today
+    screen.handle_input(InputEvent(InputType.LEFT, True))      # Move to yesterday
+    screen.handle_input(InputEvent(InputType.BUTTON_A, True))  # Check yesterday
+
+    screen.update(screen.FLUSH_DELAY / 2)
+    assert db.get_habit_logs(habit_id) == []
+
+    screen.update(screen.FLUSH_DELAY / 2)
+    logs = db.get_habit_logs(habit_id)
+    assert len(logs) == 2
+    assert all(log.completed == 1 for log in logs)
+
+    db.close()
@@ -41,3 +41,21 @@ def test_keyboard_input_mapping():
     assert input_handler.key_map[pygame.K_p] == InputType.BUTTON_A
     assert input_handler.key_map[pygame.K_l] == InputType.BUTTON_B
     assert input_handler.key_map[pygame.K_m] == InputType.BUTTON_C
+
+
+def test_keyboard_input_wait_keeps_event_order():
+    """Test that the event that wakes wait() is still returned first."""
+    pygame.init()
+    input_handler = KeyboardInput()
+    pygame.event.clear()
+
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+    input_handler.wait(0.1)
+    # Release arrives after wait() took the press off the queue
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_p))
+
+    event = input_handler.poll()
+    assert event.input_type == InputType.BUTTON_A
+    assert event.pressed is True
+
+    pygame.quit()
@@ -61,6 +61,24 @@ def test_lcd_display_get_buffer():
     display.close()
 
 
+def test_lcd_display_get_buffer_is_persistent():
+    """Test that get_buffer hands out the same image every frame."""
+    mock_st7735_module.reset_mock()
+    mock_st7735_module.ST7735.return_value = MagicMock()
+
+    from display.lcd_display import LCDDisplay
+
+    display = LCDDisplay(width=128, height=128)
+    buffer = display.get_buffer()
+    buffer.putpixel((0, 0), (255, 0, 0))
+    display.update(buffer)
+
+    assert display.get_buffer() is buffer
+    assert display.get_buffer().getpixel((0, 0)) == (255, 0, 0)
+
+    display.close()
+
+
 def test_lcd_display_update():
     """Test that update sends buffer to LCD via ST7735 display method."""
     # Reset the mock
@@ -89,6 +107,35 @@ def test_lcd_display_update():
     display.close()
 
 
+def test_lcd_display_update_sends_only_changed_rows():
+    """Test that later frames push only the changed row band."""
+    mock_st7735_module.reset_mock()
+
+    mock_instance = MagicMock()
+    mock_st7735_module.ST7735.return_value = mock_instance
+
+    from display.lcd_display import LCDDisplay
+
+    display = LCDDisplay(width=128, height=128)
+    buffer = display.get_buffer()
+    display.update(buffer)
+    mock_instance.display.assert_called_once()
+
+    # Unchanged frame: nothing sent
+    display.update(buffer)
+    mock_instance.set_window.assert_not_called()
+
+    # Rows 10-11 changed: one window over those panel columns
+    buffer.paste((255, 0, 0), (0, 10, 128, 12))
+    display.update(buffer)
+    assert mock_instance.display.call_count == 1
+    mock_instance.set_window.assert_called_once_with(10, 0, 11, 127)
+    sent = sum(len(call.args[0]) for call in mock_instance.data.call_args_list)
+    assert sent == 2 * 128 * 2  # 2 rows x 128 pixels x RGB565
+
+    display.close()
+
+
 def test_lcd_display_close():
     """Test that close cleans up resources."""
     # Reset the mock
@@ -69,3 +69,32 @@ def test_home_screen_render():
 
     # Verify buffer is still 128x128 (not resized)
     assert buffer.size == (128, 128)
+
+
+def test_screen_reuses_draw_for_same_buffer():
+    """Test that screens keep one ImageDraw per persistent buffer."""
+    screen = HomeScreen()
+    buffer = Image.new('RGB', (128, 128))
+
+    draw = screen._get_draw(buffer)
+    assert screen._get_draw(buffer) is draw
+
+    other = Image.new('RGB', (128, 128))
+    assert screen._get_draw(other) is not draw
+
+
+def test_home_screen_render_matches_layered_sprites():
+    """Test that the pre-flattened frame matches pasting each layer in order."""
+    screen = HomeScreen()
+    buffer = Image.new('RGB', (128, 128))
+    screen.render(buffer)
+
+    face_path = Config.FACE_ANIM_SPRITES[screen.face_names[0]]
+    expected = Image.open(Config.BACKGROUND_SPRITE).convert('RGBA').convert('RGB')
+    for path in (Config.CHARACTER_ANIM_SPRITE, face_path):
+        layer = Image.open(path).convert('RGBA').crop((0, 0, 64, 64)).resize((128, 128), Image.NEAREST)
+        expected.paste(layer, (0, 0), layer)
+
+    assert screen.background.size == (128, 128)
+    assert all(frame.size == (128, 128) for frame in screen._bg_body)
+    assert buffer.tobytes() == expected.tobytes()
@@ -27,6 +27,17 @@ def test_stats_screen_cycles_values_on_button():
     assert screen.happiness == 85  # Incremented
 
 
+def test_stats_screen_redraws_only_when_dirty():
+    """Stats should only be redrawn after input changes it."""
+    screen = StatsScreen()
+    assert screen.redraw_every_frame is False
+    assert screen.has_animations() is False
+
+    screen.dirty = False
+    screen.handle_input(InputEvent(InputType.BUTTON_A, pressed=True))
+    assert screen.dirty is True
+
+
 def test_stats_screen_navigates_left():
     """Left should navigate to home."""
     screen = StatsScreen()
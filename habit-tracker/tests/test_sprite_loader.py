@@ -1,6 +1,7 @@
 """Tests for sprite loading functionality."""
 
 import pytest
+import numpy as np
 from PIL import Image
 from assets.sprite_loader import SpriteSheet, get_progress_bar_for_percentage
 from config import Config
@@ -55,6 +56,45 @@ def test_get_row_caching(icon_sheet):
     assert row1 is row2
 
 
+def test_sprite_sheet_get_is_shared():
+    """Test that SpriteSheet.get returns one instance per (path, tile size)."""
+    sheet1 = SpriteSheet.get(Config.ICONS_SPRITE_SHEET, 16, 16)
+    sheet2 = SpriteSheet.get(Config.ICONS_SPRITE_SHEET, 16, 16)
+    sheet3 = SpriteSheet.get(Config.ICONS_SPRITE_SHEET, 32, 32)
+
+    assert sheet1 is sheet2
+    assert sheet1 is not sheet3
+
+
+def test_tile_grid_precomputed(icon_sheet):
+    """Test that the full tile grid is built at construction."""
+    assert icon_sheet.rows == 8
+    assert icon_sheet.cols == 8
+    assert len(icon_sheet._tiles) == 8
+    assert all(len(row) == 8 for row in icon_sheet._tiles)
+
+
+def test_get_sprite_array_is_view(icon_sheet):
+    """Test that get_sprite_array returns a view into the sheet pixels."""
+    tile = icon_sheet.get_sprite_array(4, 0)
+
+    assert tile.shape == (16, 16, 4)
+    assert tile.dtype == np.uint8
+    assert np.shares_memory(tile, icon_sheet._pixels)
+
+
+def test_blit_row_into_matches_paste(icon_sheet):
+    """Test that blit_row_into draws the same pixels as a PIL masked paste."""
+    expected = Image.new('RGB', (128, 32), (255, 255, 255))
+    row_sprite = icon_sheet.get_row(3)
+    expected.paste(row_sprite, (0, 8), row_sprite)
+
+    dest = np.full((32, 128, 3), 255, dtype=np.uint8)
+    icon_sheet.blit_row_into(dest, 0, 8, 3)
+
+    assert np.array_equal(dest, np.asarray(expected))
+
+
 def test_get_sprites_range(icon_sheet):
     """Test extracting a range of sprites."""
     # Extract 2x2 grid starting at (0, 1) - checkbox icons
@@ -65,6 +105,17 @@ def test_get_sprites_range(icon_sheet):
     assert all(s.size == (16, 16) for s in sprites)
 
 
+def test_get_sprites_range_array_matches_tiles(icon_sheet):
+    """Test that the vectorized range returns the same tiles as get_sprite_array."""
+    tiles = icon_sheet.get_sprites_range_array(0, 1, 1, 2)
+
+    assert len(tiles) == 4
+    expected = [(0, 1), (1, 1), (0, 2), (1, 2)]
+    for tile, (col, row) in zip(tiles, expected):
+        assert np.array_equal(tile, icon_sheet.get_sprite_array(col, row))
+        assert np.shares_memory(tile, icon_sheet._pixels)
+
+
 def test_progress_bar_percentage_mapping_0_percent():
     """Test that 0% maps to progress-bar-0 (icons.png row 3)."""
     info = get_progress_bar_for_percentage(0)
@@ -221,3 +272,62 @@ def test_render_text_transparent_background():
     text_img = render_text("Test", Config.FONT_REGULAR, 8)
 
     assert text_img.mode == 'RGBA'  # Should have alpha channel
+
+
+def test_render_text_caching():
+    """Test that identical render_text calls return the cached image."""
+    from assets.sprite_loader import render_text, clear_text_cache
+
+    img1 = render_text("Cache", Config.FONT_REGULAR, 8, color=(0, 0, 0))
+    img2 = render_text("Cache", Config.FONT_REGULAR, 8, color=(0, 0, 0))
+    assert img1 is img2
+
+    clear_text_cache()
+    img3 = render_text("Cache", Config.FONT_REGULAR, 8, color=(0, 0, 0))
+    assert img3 is not img1
+
+
+def test_text_sprite_matches_draw_text():
+    """Test that pasting a text sprite reproduces non-antialiased draw.text."""
+    from PIL import ImageDraw
+    from assets.sprite_loader import load_font, render_text_sprite, paste_text_sprite
+
+    font = load_font(Config.FONT_REGULAR, 8)
+    color = Config.COLOR_BLUE_HIGHLIGHT
+
+    expected = Image.new('RGB', (64, 16), (255, 255, 255))
+    draw = ImageDraw.Draw(expected)
+    draw.fontmode = '1'
+    draw.text((5, 3), "Points:", fill=color, font=font)
+
+    actual = Image.new('RGB', (64, 16), (255, 255, 255))
+    sprite = render_text_sprite("Points:", Config.FONT_REGULAR, 8, color)
+    paste_text_sprite(actual, sprite, 5, 3)
+
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_load_image_is_cached():
+    """Test that decoded images are shared between callers."""
+    from assets.sprite_loader import load_image, load_flat_image
+
+    img = load_image(Config.EDIT_HABIT_BG)
+    assert img.mode == 'RGBA'
+    assert load_image(Config.EDIT_HABIT_BG) is img
+
+    flat = load_flat_image(Config.EDIT_HABIT_BG)
+    assert flat.mode == 'RGB'
+    assert flat.size == img.size
+    assert load_flat_image(Config.EDIT_HABIT_BG) is flat
+
+
+def test_upscale2x_matches_nearest_resize(icon_sheet):
+    """Test that upscale2x matches a 2x NEAREST resize."""
+    from assets.sprite_loader import upscale2x
+
+    sprite = icon_sheet.get_sprite(0, 0)
+    scaled = upscale2x(sprite)
+
+    expected = sprite.resize((32, 32), Image.NEAREST)
+    assert scaled.mode == expected.mode
+    assert scaled.tobytes() == expected.tobytes()